@@ -22,6 +22,10 @@ Access configured options
 
 .. autofunction:: get_font
 
+.. autofunction:: get_cached_font
+
+.. autofunction:: clear_font_cache
+
 .. autofunction:: get_pen
 
 .. autofunction:: get_brush
@@ -403,6 +407,47 @@ def get_font(conf: UserConfig, section: str, option: str = "") -> QG.QFont:
     return font
 
 
+_FONT_CACHE: dict[tuple[int, str, str], tuple[UserConfig, int, QG.QFont]] = {}
+
+
+def get_cached_font(conf: UserConfig, section: str, option: str = "") -> QG.QFont:
+    """
+    Return the QFont constructed from the specified configuration file entry,
+    like :py:func:`get_font`, but build it only once
+
+    The font is built again only when the configuration has changed or after
+    :py:func:`clear_font_cache` has been called (e.g. when switching color mode).
+    This function is intended for code paths which are called very often, like
+    the `data` method of item models (one call per cell and per repaint).
+
+    Args:
+        conf (UserConfig): UserConfig instance
+        section (str): configuration entry
+        option (str): configuration entry. Defaults to "".
+
+    Returns:
+        QG.QFont: font
+    """
+    # Importing Qt here because this module should be independent from it
+    from qtpy import QtGui as QG  # pylint: disable=import-outside-toplevel
+
+    key = (id(conf), section, option)
+    cached = _FONT_CACHE.get(key)
+    if cached is None or cached[0] is not conf or cached[1] != conf.get_revision():
+        font = get_font(conf, section, option)
+        # Revision is read after building the font, because `get_font` may add
+        # missing options to the configuration
+        _FONT_CACHE[key] = (conf, conf.get_revision(), font)
+    else:
+        font = cached[2]
+    return QG.QFont(font)
+
+
+def clear_font_cache() -> None:
+    """Clear the font cache used by :py:func:`get_cached_font`"""
+    _FONT_CACHE.clear()
+
+
 def get_pen(
     conf: UserConfig,
     section: str,
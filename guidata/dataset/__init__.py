@@ -13,6 +13,7 @@ from .conv import (
     dataset_to_json,
     json_to_dataset,
 )
+from .dataarray import DataSetArray
 from .dataitems import (
     BoolItem,
     ButtonItem,
@@ -62,6 +63,7 @@ from .datatypes import (
     NotProp,
     Obj,
     ObjectItem,
+    property_evaluation_pass,
     SeparatorItem,
     TabGroupItem,
     ValueProp,
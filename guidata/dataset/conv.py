@@ -41,7 +41,10 @@ if TYPE_CHECKING:
 
 
 def update_dataset(
-    dest: gdt.DataSet, source: Any | dict[str, Any], visible_only: bool = False
+    dest: gdt.DataSet,
+    source: Any | dict[str, Any],
+    visible_only: bool = False,
+    changed_only: bool = False,
 ) -> None:
     """Update `dest` dataset items from `source` dataset.
 
@@ -51,6 +54,9 @@ def update_dataset(
            matching attribute names.
         visible_only (bool): If True, update only visible items. Defaults
            to False.
+        changed_only (bool): If True and `source` is a dataset, update only the
+           items changed in `source` (see :py:meth:`DataSet.changed_items`).
+           Defaults to False.
 
     For each DataSet item, the function will try to get the attribute
     of the same name from the source.
@@ -64,10 +70,15 @@ def update_dataset(
     Returns:
         None
     """
+    changed = None
+    if changed_only and isinstance(source, gdt.DataSet):
+        changed = set(source.changed_items())
     for item in dest._items:
         key = item._name
         if isinstance(item.get_prop("data", "computed", None), gdt.ComputedProp):
             continue  # Skip computed items
+        if changed is not None and key not in changed:
+            continue  # Skip unchanged items
         if hasattr(source, key):
             try:
                 hide = item.get_prop_value("display", source, "hide", False)
@@ -223,16 +234,36 @@ def create_dataset_from_dict(
 # ==============================================================================
 
 
-def dataset_to_json(param: gdt.DataSet) -> str:
+def dataset_to_json(
+    param: gdt.DataSet,
+    binary_arrays: bool = False,
+    compression: str | None = None,
+    backend: str | None = None,
+    tagged_arrays: bool = False,
+) -> str:
     """Serialize dataset to JSON string.
 
     Args:
         param: dataset (gdt.DataSet)
+        binary_arrays: if True, write arrays in compact binary form
+         (see :py:class:`guidata.io.JSONWriter`). Defaults to False.
+        compression: compression codec for binary arrays. Defaults to None.
+        backend: JSON backend name (see :py:func:`guidata.io.get_json_backend`).
+         Defaults to None (default backend).
+        tagged_arrays: if True, write arrays in the tagged form
+         (see :py:class:`guidata.io.JSONWriter`). Defaults to False.
 
     Returns:
         JSON string representation of the dataset
     """
-    writer = JSONWriter(None)  # No filename, we'll get JSON text
+    # No filename, we'll get JSON text
+    writer = JSONWriter(
+        None,
+        binary_arrays=binary_arrays,
+        compression=compression,
+        backend=backend,
+        tagged_arrays=tagged_arrays,
+    )
     # Store the class name so we can deserialize to the correct type
     writer.write(param.__class__.__module__, "class_module")
     writer.write(param.__class__.__name__, "class_name")
@@ -240,16 +271,22 @@ def dataset_to_json(param: gdt.DataSet) -> str:
     return writer.get_json()
 
 
-def json_to_dataset(json_str: str) -> gdt.DataSet:
+def json_to_dataset(
+    json_str: str, backend: str | None = None, legacy_arrays: bool = True
+) -> gdt.DataSet:
     """Deserialize dataset from JSON string.
 
     Args:
         json_str: JSON string representation
+        backend: JSON backend name (see :py:func:`guidata.io.get_json_backend`).
+         Defaults to None (default backend).
+        legacy_arrays: if True, decode ``["array", data, dtype]`` triplets
+         (see :py:class:`guidata.io.JSONReader`). Defaults to True.
 
     Returns:
         Deserialized dataset object
     """
-    reader = JSONReader(json_str)
+    reader = JSONReader(json_str, backend=backend, legacy_arrays=legacy_arrays)
 
     # Read the class information
     class_module = reader.read("class_module")
@@ -0,0 +1,488 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+Columnar data set containers
+============================
+
+A :py:class:`DataSetArray` stores many records of the same
+:py:class:`guidata.dataset.DataSet` class column by column, instead of creating a
+Python object per record:
+
+* Scalar items (:py:class:`guidata.dataset.BoolItem`,
+  :py:class:`guidata.dataset.IntItem`, :py:class:`guidata.dataset.FloatItem`, and
+  :py:class:`guidata.dataset.ChoiceItem` with integer or string keys) are stored
+  in a NumPy structured array, with one field per item.
+
+* Other items (strings, arrays, dictionaries, etc.) are stored in NumPy object
+  arrays, with one array per item.
+
+Columns may be read and written at once (e.g. ``records["gain"] *= 2``), and each
+record may be accessed through a row view, which behaves like a data set
+instance (e.g. ``records[0].gain = 1.0``, ``records[0].edit()``).
+
+.. autoclass:: guidata.dataset.DataSetArray
+    :members:
+
+.. autofunction:: guidata.dataset.dataarray.get_dataset_dtype
+"""
+
+from __future__ import annotations
+
+from copy import deepcopy
+from typing import TYPE_CHECKING, Any, Generic, Iterable, Iterator
+
+import numpy as np
+
+from guidata.dataset.dataitems import (
+    BoolItem,
+    ButtonItem,
+    ChoiceItem,
+    FloatItem,
+    IntItem,
+    MultipleChoiceItem,
+)
+from guidata.dataset.datatypes import (
+    AnyDataSet,
+    BeginGroup,
+    DataItem,
+    DataSet,
+    DataSetMeta,
+    EndGroup,
+    ItemProperty,
+    SeparatorItem,
+    is_immutable,
+)
+from guidata.io import HDF5Reader, HDF5Writer
+from guidata.io.h5fmt import TABLE_NAME, pack_table, unpack_table
+
+if TYPE_CHECKING:
+    from guidata.io import INIReader, INIWriter, JSONReader, JSONWriter
+
+#: Name of the entry storing the number of records
+SIZE_NAME = "__size"
+
+
+def is_stored_item(item: DataItem) -> bool:
+    """Return True if the data item stores a value in data set instances (i.e. if
+    it is not a computed item, a group delimiter, a separator or a button)
+
+    Args:
+        item: data item
+
+    Returns:
+        True if the data item stores a value
+    """
+    if isinstance(item, (BeginGroup, EndGroup, SeparatorItem, ButtonItem)):
+        return False
+    return item.get_prop("data", "computed", None) is None
+
+
+def get_item_dtype(item: DataItem, default: Any) -> np.dtype | None:
+    """Return the dtype of the structured array field storing a data item
+
+    Args:
+        item: data item
+        default: default value of the item
+
+    Returns:
+        Field dtype, or None if the item has to be stored in an object column
+    """
+    if default is None:
+        return None
+    if isinstance(item, BoolItem):
+        return np.dtype(bool)
+    if isinstance(item, IntItem):
+        return np.dtype(np.int64)
+    if isinstance(item, FloatItem):
+        return np.dtype(np.float64)
+    if isinstance(item, ChoiceItem) and not isinstance(item, MultipleChoiceItem):
+        choices = item.get_prop("data", "choices", [])
+        if isinstance(choices, ItemProperty) or len(choices) == 0:
+            return None
+        keys = [key for key, _label, _image in choices]
+        if all(isinstance(key, int) and not isinstance(key, bool) for key in keys):
+            return np.dtype(np.int64)
+        if all(isinstance(key, str) for key in keys):
+            return np.dtype(f"U{max(len(key) for key in keys)}")
+    return None
+
+
+def get_dataset_dtype(klass: type[DataSet]) -> np.dtype:
+    """Return the structured dtype of the scalar items of a DataSet class
+
+    Args:
+        klass: DataSet class
+
+    Returns:
+        Structured dtype, with one field per scalar item (see :py:class:`DataSetArray`)
+    """
+    template = klass()
+    fields = []
+    for item in klass._items:
+        if is_stored_item(item):
+            dtype = get_item_dtype(item, item.get_value(template))
+            if dtype is not None:
+                fields.append((item.get_name(), dtype))
+    return np.dtype(fields)
+
+
+def new_object_column(values: Iterable[Any]) -> np.ndarray:
+    """Return an object array containing the values (which are not unpacked, even if
+    they are sequences or arrays)
+
+    Args:
+        values: column values
+
+    Returns:
+        Object array
+    """
+    values = list(values)
+    column = np.empty(len(values), dtype=object)
+    for index, value in enumerate(values):
+        column[index] = value
+    return column
+
+
+class DataSetRow:
+    """Mixin class of the row views of :py:class:`DataSetArray` objects
+
+    Row view classes are subclasses of the DataSet class of the array, in which
+    item values are read from and written to the columns of the array (see
+    :py:meth:`DataSetArray.get_row_class`).
+    """
+
+    __slots__ = ()
+
+    def __init__(self, array: DataSetArray, index: int) -> None:
+        self._row_array = array
+        self._row_index = index
+        super().__init__(skip_defaults=True)
+
+
+def _field_property(name: str) -> property:
+    """Return the property storing an item value in a structured array field"""
+
+    def fget(row: DataSetRow) -> Any:
+        return row._row_array.data[name][row._row_index].item()
+
+    def fset(row: DataSetRow, value: Any) -> None:
+        if value is None:
+            raise ValueError(f"Item '{name}' of a DataSetArray cannot be None")
+        row._row_array.data[name][row._row_index] = value
+
+    return property(fget, fset)
+
+
+def _object_property(name: str) -> property:
+    """Return the property storing an item value in an object column"""
+
+    def fget(row: DataSetRow) -> Any:
+        return row._row_array.objects[name][row._row_index]
+
+    def fset(row: DataSetRow, value: Any) -> None:
+        row._row_array.objects[name][row._row_index] = value
+
+    return property(fget, fset)
+
+
+class DataSetArray(Generic[AnyDataSet]):
+    """Columnar container of DataSet records
+
+    Scalar items (booleans, integers, floats, and choices with integer or string
+    keys) are stored in a NumPy structured array (see :py:attr:`data`), other items
+    in NumPy object arrays (see :py:attr:`objects`). Items which do not store any
+    value (computed items, groups, separators and buttons) have no column.
+
+    Indexing:
+
+    * ``records["name"]`` returns the column of item `name` (a view on the
+      structured array field, or the object array), and ``records["name"] = value``
+      sets the column at once (a scalar value is broadcast to all records).
+      Values are not validated (use row views for that).
+
+    * ``records[index]`` returns a row view, which behaves like a DataSet instance
+      (values are read from and written to the array), and
+      ``records[index] = dataset`` copies the values of a DataSet instance.
+
+    * ``records[slice]`` (or an integer array or a boolean mask) returns a new
+      DataSetArray, following NumPy indexing rules (slices share data).
+
+    Args:
+        klass: DataSet class (its constructor must require no argument)
+        size: number of records, initialized with the default item values.
+         Defaults to 0.
+    """
+
+    __row_classes: dict[type[DataSet], type[DataSet]] = {}
+
+    def __init__(self, klass: type[AnyDataSet], size: int = 0) -> None:
+        self.klass = klass
+        #: Structured array storing the scalar item values
+        self.data: np.ndarray = np.empty(size, dtype=get_dataset_dtype(klass))
+        #: Object arrays storing the other item values, by item name
+        self.objects: dict[str, np.ndarray] = {}
+        self.__set_defaults()
+
+    def __set_defaults(self) -> None:
+        """Set all records to the default item values"""
+        template = self.klass()
+        size = len(self.data)
+        fields = self.data.dtype.names
+        self.objects = {}
+        for item in self.get_items():
+            name = item.get_name()
+            value = item.get_value(template)
+            if name in fields:
+                self.data[name] = value
+            elif is_immutable(value):
+                self.objects[name] = new_object_column([value] * size)
+            else:
+                self.objects[name] = new_object_column(
+                    deepcopy(value) for _index in range(size)
+                )
+
+    @classmethod
+    def from_datasets(
+        cls, datasets: Iterable[AnyDataSet], klass: type[AnyDataSet] | None = None
+    ) -> DataSetArray[AnyDataSet]:
+        """Create a DataSetArray from DataSet instances
+
+        Args:
+            datasets: DataSet instances
+            klass: DataSet class. If None (default), the class of the first instance.
+
+        Returns:
+            New DataSetArray containing a copy of the item values
+
+        Raises:
+            ValueError: if `klass` is None and `datasets` is empty
+        """
+        datasets = list(datasets)
+        if klass is None:
+            if not datasets:
+                raise ValueError("klass is required to create an empty DataSetArray")
+            klass = type(datasets[0])
+        records = cls(klass, len(datasets))
+        fields = records.data.dtype.names
+        for item in records.get_items():
+            name = item.get_name()
+            values = [item.get_value(dataset) for dataset in datasets]
+            if name in fields:
+                records.data[name] = values
+            else:
+                records.objects[name] = new_object_column(
+                    value if is_immutable(value) else deepcopy(value)
+                    for value in values
+                )
+        return records
+
+    def to_datasets(self) -> list[AnyDataSet]:
+        """Return the records as DataSet instances
+
+        Item values are set directly on the new instances, without validation.
+
+        Returns:
+            List of new DataSet instances (independent of the array)
+        """
+        columns = [(f"_{name}", self.data[name].tolist()) for name in self.names]
+        for name in self.object_names:
+            column = self.objects[name]
+            if not all(is_immutable(value) for value in column):
+                column = deepcopy(column)
+            columns.append((f"_{name}", column))
+        datasets = []
+        for index in range(len(self)):
+            dataset = self.klass()
+            for attr_name, values in columns:
+                setattr(dataset, attr_name, values[index])
+            datasets.append(dataset)
+        return datasets
+
+    def get_dataset(self, index: int) -> AnyDataSet:
+        """Return a record as a new DataSet instance
+
+        Args:
+            index: record index
+
+        Returns:
+            New DataSet instance (independent of the array)
+        """
+        row = self[index]
+        dataset = self.klass()
+        for item in self.get_items():
+            setattr(dataset, f"_{item.get_name()}", deepcopy(item.get_value(row)))
+        return dataset
+
+    @classmethod
+    def get_row_class(cls, klass: type[AnyDataSet]) -> type[AnyDataSet]:
+        """Return the row view class of a DataSet class
+
+        The row view class is a subclass of the DataSet class, in which item values
+        are read from and written to the columns of a DataSetArray. It is created
+        once for each DataSet class.
+
+        Args:
+            klass: DataSet class
+
+        Returns:
+            Row view class
+        """
+        row_class = cls.__row_classes.get(klass)
+        if row_class is None:
+            fields = get_dataset_dtype(klass).names
+            dct = {
+                "__doc__": klass.__doc__,
+                "__module__": klass.__module__,
+                "__qualname__": klass.__qualname__,
+                "__slots__": ("_row_array", "_row_index"),
+                # Columns may be set without notifying row views
+                "_class_cache_computed": False,
+            }
+            for item in klass._items:
+                name = item.get_name()
+                if f"_{name}" in dct["__slots__"]:
+                    raise ValueError(f"Item name '{name}' is reserved")
+                if not is_stored_item(item):
+                    # Items without column (groups, computed items, etc.)
+                    dct[f"_{name}"] = item._default
+                elif name in fields:
+                    dct[f"_{name}"] = _field_property(name)
+                else:
+                    dct[f"_{name}"] = _object_property(name)
+            row_class = DataSetMeta(
+                klass.__name__,
+                (DataSetRow, klass),
+                dct,
+                title=klass._class_title,
+                comment=klass._class_comment,
+                icon=klass._class_icon,
+                readonly=klass._class_readonly,
+                compact=True,
+            )
+            cls.__row_classes[klass] = row_class
+        return row_class
+
+    def get_items(self) -> list[DataItem]:
+        """Return the data items which have a column in the array
+
+        Returns:
+            Data items (see :py:func:`is_stored_item`)
+        """
+        return [item for item in self.klass._items if is_stored_item(item)]
+
+    @property
+    def names(self) -> list[str]:
+        """Names of the items stored in the structured array"""
+        return list(self.data.dtype.names)
+
+    @property
+    def object_names(self) -> list[str]:
+        """Names of the items stored in object arrays"""
+        return list(self.objects)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.klass.__name__}, size={len(self)})"
+
+    def __iter__(self) -> Iterator[AnyDataSet]:
+        row_class = self.get_row_class(self.klass)
+        for index in range(len(self)):
+            yield row_class(self, index)
+
+    def __getitem__(self, key: Any) -> Any:
+        if isinstance(key, str):
+            if key in self.objects:
+                return self.objects[key]
+            return self.data[key]
+        if isinstance(key, (int, np.integer)):
+            size = len(self)
+            if not -size <= key < size:
+                raise IndexError(f"index {key} is out of bounds for size {size}")
+            return self.get_row_class(self.klass)(self, int(key) % size)
+        records = self.__class__.__new__(self.__class__)
+        records.klass = self.klass
+        records.data = self.data[key]
+        records.objects = {name: column[key] for name, column in self.objects.items()}
+        return records
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        if isinstance(key, str):
+            if key in self.objects:
+                column = self.objects[key]
+                if isinstance(value, (list, tuple, np.ndarray)) and len(value) == len(
+                    column
+                ):
+                    column[:] = new_object_column(value)
+                else:
+                    column.fill(value)
+            else:
+                self.data[key] = value
+        elif isinstance(key, (int, np.integer)):
+            row = self[key]
+            for item in self.get_items():
+                setattr(row, f"_{item.get_name()}", deepcopy(item.get_value(value)))
+        else:
+            raise TypeError(f"Invalid DataSetArray index: {key!r}")
+
+    def check(self) -> tuple[np.ndarray, dict[str, str]]:
+        """Check the item values of all records at once (see
+        :py:meth:`guidata.dataset.DataSet.check_many`)
+
+        Returns:
+            Boolean array (True for valid records), and error messages by item name
+        """
+        columns = {name: self[name] for name in self.names + self.object_names}
+        return self.klass().check_many(columns)
+
+    def serialize(self, writer: HDF5Writer | JSONWriter | INIWriter) -> None:
+        """Serialize the records
+
+        With an HDF5 writer, the scalar columns are written as a single compound
+        dataset. Other columns are written as sequences.
+
+        Args:
+            writer: writer object
+        """
+        writer.write(len(self), SIZE_NAME)
+        if isinstance(writer, HDF5Writer):
+            if self.names:
+                columns = [(name, self.data[name]) for name in self.names]
+                writer.write(pack_table(columns), TABLE_NAME)
+        else:
+            for name in self.names:
+                writer.write(self.data[name].tolist(), name)
+        for name in self.object_names:
+            writer.write(list(self.objects[name]), name)
+
+    def deserialize(self, reader: HDF5Reader | JSONReader | INIReader) -> None:
+        """Deserialize the records
+
+        Items which are not stored in the file (e.g. items added in a newer
+        version of the DataSet class) are set to their default value.
+
+        Args:
+            reader: reader object
+        """
+        size = int(reader.read(SIZE_NAME))
+        self.data = np.empty(size, dtype=self.data.dtype)
+        self.__set_defaults()
+        if isinstance(reader, HDF5Reader):
+            table = reader.read(TABLE_NAME, func=reader.read_array, default=None)
+            if table is not None:
+                for name, column in unpack_table(np.asarray(table)).items():
+                    if name in self.names:
+                        self.data[name] = column
+        else:
+            for name in self.names:
+                values = reader.read(name, default=None)
+                if values is not None:
+                    self.data[name] = values
+        for name in self.object_names:
+            values = reader.read(name, default=None)
+            if values is not None:
+                self.objects[name] = new_object_column(values)
@@ -227,6 +227,9 @@ class NumericTypeItem(DataItem):
     """
 
     type: type[int | float]
+    #: NumPy dtype kinds of the arrays which are checked with vectorized operations
+    #: by :py:meth:`check_values` (other values are checked one by one)
+    vectorized_kinds = ""
 
     def __init__(
         self,
@@ -301,6 +304,26 @@ class NumericTypeItem(DataItem):
             return False
         return True
 
+    def check_values(self, values: Sequence[Any] | np.ndarray) -> np.ndarray:
+        """Override DataItem method: numeric arrays (or sequences of numbers) are
+        checked with NumPy vectorized operations"""
+        if not self.get_prop("data", "check_value", True):
+            return np.ones(len(values), dtype=bool)
+        array = np.asarray(values)
+        if array.ndim != 1 or array.dtype.kind not in self.vectorized_kinds:
+            return super().check_values(values)
+        mask = np.ones(len(array), dtype=bool)
+        if self.get_prop("data", "nonzero"):
+            mask &= array != 0
+        # Comparisons are negated to handle NaN values as check_value does
+        _min = self.get_prop("data", "min")
+        if _min is not None:
+            mask &= ~(array < _min)
+        _max = self.get_prop("data", "max")
+        if _max is not None:
+            mask &= ~(array > _max)
+        return mask
+
     def from_string(self, value: str) -> Any | None:
         """Override DataItem method"""
         # String may contains numerical operands:
@@ -336,6 +359,7 @@ class FloatItem(NumericTypeItem):
     """
 
     type = float
+    vectorized_kinds = "biuf"
 
     def __init__(
         self,
@@ -369,6 +393,11 @@ class FloatItem(NumericTypeItem):
         self, instance: Any, value: Any, force_allow_none: bool = False
     ) -> None:
         """Override DataItem._set_value_with_validation to convert integers to float"""
+        value = self._convert_value(value)
+        super()._set_value_with_validation(instance, value, force_allow_none)
+
+    def _convert_value(self, value: Any) -> Any:
+        """Override DataItem method"""
         # Try to convert NumPy numeric types to Python float
         # (will convert silently either floating point or integer types to float)
         try:
@@ -380,7 +409,7 @@ class FloatItem(NumericTypeItem):
         # (no more NumPy types at this point)
         if isinstance(value, int):
             value = float(value)
-        super()._set_value_with_validation(instance, value, force_allow_none)
+        return value
 
     def get_value_from_reader(
         self, reader: HDF5Reader | JSONReader | INIReader
@@ -411,6 +440,7 @@ class IntItem(NumericTypeItem):
     """
 
     type = int
+    vectorized_kinds = "iu"
 
     def __init__(
         self,
@@ -456,6 +486,11 @@ class IntItem(NumericTypeItem):
     ) -> None:
         """Override DataItem._set_value_with_validation
         to convert NumPy numeric types to int"""
+        value = self._convert_value(value)
+        super()._set_value_with_validation(instance, value, force_allow_none)
+
+    def _convert_value(self, value: Any) -> Any:
+        """Override DataItem method"""
         # Try to convert NumPy integer types to Python int
         # (will convert silently only integer types to int)
         try:
@@ -463,7 +498,7 @@ class IntItem(NumericTypeItem):
                 value = self.type(value)
         except (TypeError, ValueError):
             pass
-        super()._set_value_with_validation(instance, value, force_allow_none)
+        return value
 
     def check_value(self, value: int, raise_exception: bool = False) -> bool:
         """Override DataItem method"""
@@ -482,6 +517,20 @@ class IntItem(NumericTypeItem):
                 return False
         return True
 
+    def check_values(self, values: Sequence[Any] | np.ndarray) -> np.ndarray:
+        """Override DataItem method"""
+        mask = super().check_values(values)
+        even = self.get_prop("data", "even")
+        array = np.asarray(values)
+        if (
+            even is not None
+            and self.get_prop("data", "check_value", True)
+            and array.ndim == 1
+            and array.dtype.kind in self.vectorized_kinds
+        ):
+            mask &= (array % 2 == 0) == even
+        return mask
+
     def get_value_from_reader(self, reader: HDF5Reader | JSONReader | INIReader) -> Any:
         """Reads value from the reader object, inside the try...except
         statement defined in the base item `deserialize` method"""
@@ -1202,6 +1251,15 @@ class ChoiceItem(DataItem, Generic[_T]):
         # guidata internals should call this; keep it returning the raw key
         return super().__get__(instance, instance.__class__)  # string (or None)
 
+    def _convert_value(self, value: Any) -> Any:
+        """Override DataItem method"""
+        if self._enum_cls is not None and value is not None:
+            try:
+                return self._enum_coerce_in(value)
+            except ValueError:
+                pass
+        return value
+
     def _set_value_with_validation(
         self, instance: Any, value: Any, force_allow_none: bool = False
     ) -> None:
@@ -1376,6 +1434,12 @@ class FloatArrayItem(DataItem):
          (function of two arguments (value, raise_exception) returning a boolean,
          where value is the value to check and raise_exception is a boolean
          indicating whether to raise an exception on invalid value)
+
+    .. note::
+        HDF5 storage of the array may be tuned with the `h5_chunks`,
+        `h5_compression`, `h5_compression_opts` and `h5_shuffle` data properties,
+        which override the :py:class:`guidata.io.HDF5Writer` array options, e.g.
+        ``FloatArrayItem("Data").set_prop("data", h5_compression="gzip")``.
     """
 
     type = np.ndarray
@@ -1404,7 +1468,10 @@ class FloatArrayItem(DataItem):
         """Override DataItem method"""
         if not self.get_prop("data", "check_value", True):
             return True
-        if not isinstance(value, self.type):
+        # Arrays read lazily (see guidata.io.LazyArray) are loaded on demand
+        if not isinstance(value, self.type) and not (
+            hasattr(value, "__array__") and callable(getattr(value, "load", None))
+        ):
             if raise_exception:
                 raise TypeError(f"Expected {self.type}, got {type(value)}")
             return False
@@ -1445,7 +1512,20 @@ class FloatArrayItem(DataItem):
     ) -> None:
         """Serialize this item"""
         value = self.get_value(instance)
-        writer.write_array(value)
+        if value is not None and not isinstance(value, np.ndarray):
+            # Arrays read lazily (see guidata.io.LazyArray) are loaded
+            value = np.asarray(value)
+        # Writers supporting per-array storage options (e.g. HDF5Writer)
+        array_options = getattr(writer, "array_options", None)
+        if array_options is not None:
+            options = {}
+            for name in array_options:
+                option = self.get_prop("data", f"h5_{name}", None)
+                if option is not None:
+                    options[name] = option
+            writer.write_array(value, **options)
+        else:
+            writer.write_array(value)
 
     def get_value_from_reader(self, reader: HDF5Reader | JSONReader | INIReader) -> Any:
         """Reads value from the reader object, inside the try...except
@@ -59,6 +59,8 @@ Handling item properties
 
 .. autoclass:: guidata.dataset.FuncPropMulti
     :members:
+
+.. autofunction:: guidata.dataset.property_evaluation_pass
 """
 
 # pylint: disable-msg=W0622
@@ -66,11 +68,15 @@ Handling item properties
 
 from __future__ import annotations
 
+import datetime
+import enum
 import re
 import sys
+import threading
 import warnings
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import contextmanager
 from copy import deepcopy
 from typing import TYPE_CHECKING, Any, TypeVar
 
@@ -78,6 +84,7 @@ import numpy as np
 
 from guidata.config import ValidationMode, get_validation_mode
 from guidata.io import INIReader, INIWriter
+from guidata.io.h5fmt import set_sync_token
 from guidata.userconfig import UserConfig
 
 DEBUG_DESERIALIZE = False
@@ -155,6 +162,11 @@ class ItemProperty:
         callable (Callable): callable to use to evaluate the value of the property
     """
 
+    #: True if the value of the property depends only on the dataset instance (not
+    #: on the item nor on its value): such properties are evaluated once per
+    #: instance during an evaluation pass (see :py:func:`property_evaluation_pass`)
+    item_independent: bool = False
+
     def __init__(self, callable: Callable) -> None:
         self.callable = callable
 
@@ -163,6 +175,18 @@ class ItemProperty:
         the item and the value maintained in the instance by the item"""
         return self.callable(instance, item, value)
 
+    def get_dependencies(self, instance: DataSet) -> set[str] | None:
+        """Return the names of the items on which the value of the property depends
+
+        Args:
+            instance (DataSet): instance of the DataSet
+
+        Returns:
+            set[str] | None: names of the items, or None if unknown (the value of
+            the property may then change at any time)
+        """
+        return None
+
     def set(self, instance: DataSet, item: Any, value: Any) -> Any:
         """Sets the value of the property given an instance, item and value
         Depending on implementation the value will be stored either on the
@@ -210,6 +234,17 @@ class FormatProp(ItemProperty):
                 print(f"Wrong Format for {item._name} : {self.fmt!r} % {dic!r}")
                 raise
 
+    def get_dependencies(self, instance: DataSet) -> set[str] | None:
+        """Return the names of the items on which the value of the property depends
+
+        Args:
+            instance (DataSet): instance of the DataSet
+
+        Returns:
+            set[str] | None: names of the items, or None if unknown
+        """
+        return set(self.attrs) if self.attrs else None
+
 
 class GetAttrProp(ItemProperty):
     """A property that matches the value of
@@ -219,6 +254,8 @@ class GetAttrProp(ItemProperty):
         attr (str): attribute to match
     """
 
+    item_independent = True
+
     def __init__(self, attr: str) -> None:
         self.attr = attr
 
@@ -226,6 +263,20 @@ class GetAttrProp(ItemProperty):
         val = getattr(instance, self.attr)
         return val
 
+    def get_dependencies(self, instance: DataSet) -> set[str] | None:
+        """Return the names of the items on which the value of the property depends
+
+        Args:
+            instance (DataSet): instance of the DataSet
+
+        Returns:
+            set[str] | None: name of the attribute, or None if the attribute is not
+            an item of the dataset
+        """
+        if self.attr in getattr(instance, "_item_bits", ()):
+            return {self.attr}
+        return None
+
     def set(self, instance: DataSet, item: DataItem, value: Any) -> None:
         setattr(instance, self.attr, value)
 
@@ -237,6 +288,8 @@ class ValueProp(ItemProperty):
         value (Any): value to store
     """
 
+    item_independent = True
+
     def __init__(self, value: Any) -> None:
         self.value = value
 
@@ -252,6 +305,8 @@ class ValueProp(ItemProperty):
             value (Any): value to set
         """
         self.value = value
+        if _PROPERTY_PASSES.depth:
+            _clear_pass_cache()
 
 
 class NotProp(ItemProperty):
@@ -263,10 +318,24 @@ class NotProp(ItemProperty):
 
     def __init__(self, prop: ItemProperty):
         self.property = prop
+        self.item_independent = prop.item_independent
 
     def __call__(self, instance: DataSet, item: DataItem, value: Any) -> Any:
+        if _PROPERTY_PASSES.depth:
+            return not evaluate_property(self.property, instance, item, value)
         return not self.property(instance, item, value)
 
+    def get_dependencies(self, instance: DataSet) -> set[str] | None:
+        """Return the names of the items on which the value of the property depends
+
+        Args:
+            instance (DataSet): instance of the DataSet
+
+        Returns:
+            set[str] | None: names of the items, or None if unknown
+        """
+        return self.property.get_dependencies(instance)
+
     def set(self, instance: DataSet, item: DataItem, value: Any) -> None:
         """Sets the value of the property given an instance, item and value
 
@@ -298,10 +367,26 @@ class FuncProp(ItemProperty):
         if invfunc is None:
             invfunc = func
         self.inverse_function = invfunc
+        self.item_independent = prop.item_independent
 
     def __call__(self, instance: DataSet, item: DataItem, value: Any) -> Any:
+        if _PROPERTY_PASSES.depth:
+            return self.function(
+                evaluate_property(self.property, instance, item, value)
+            )
         return self.function(self.property(instance, item, value))
 
+    def get_dependencies(self, instance: DataSet) -> set[str] | None:
+        """Return the names of the items on which the value of the property depends
+
+        Args:
+            instance (DataSet): instance of the DataSet
+
+        Returns:
+            set[str] | None: names of the items, or None if unknown
+        """
+        return self.property.get_dependencies(instance)
+
     def set(self, instance: DataSet, item: DataItem, value: Any) -> None:
         """Sets the value of the property given an instance, item and value
 
@@ -333,10 +418,35 @@ class FuncPropMulti(ItemProperty):
         if invfunc is None:
             invfunc = func
         self.inverse_function = invfunc
+        self.item_independent = all(prop.item_independent for prop in props)
 
     def __call__(self, instance: DataSet, item: DataItem, value: Any) -> Any:
+        if _PROPERTY_PASSES.depth:
+            return self.function(
+                *[
+                    evaluate_property(prop, instance, item, value)
+                    for prop in self.properties
+                ]
+            )
         return self.function(*[prop(instance, item, value) for prop in self.properties])
 
+    def get_dependencies(self, instance: DataSet) -> set[str] | None:
+        """Return the names of the items on which the value of the property depends
+
+        Args:
+            instance (DataSet): instance of the DataSet
+
+        Returns:
+            set[str] | None: names of the items, or None if unknown
+        """
+        names = set()
+        for prop in self.properties:
+            prop_names = prop.get_dependencies(instance)
+            if prop_names is None:
+                return None
+            names |= prop_names
+        return names
+
     def set(self, instance: DataSet, item: DataItem, value: Any) -> None:
         """Sets the value of the property given an instance, item and value
 
@@ -349,31 +459,284 @@ class FuncPropMulti(ItemProperty):
             prop.set(instance, item, self.inverse_function(value))
 
 
+class _PropertyPasses(threading.local):
+    """Evaluation passes of item properties in progress in the current thread: number
+    of nested passes, and cache of the values of item-independent properties
+    {(id(property), id(instance)): value}"""
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.cache: dict[tuple[int, int], Any] | None = None
+
+
+_PROPERTY_PASSES = _PropertyPasses()
+
+
+@contextmanager
+def property_evaluation_pass() -> Iterator[None]:
+    """Context manager evaluating item properties once per dataset instance
+
+    Inside the `with` block, the value of each item-independent property (see
+    :py:attr:`ItemProperty.item_independent`, e.g. `GetAttrProp`, `ValueProp`,
+    and `NotProp`, `FuncProp` or `FuncPropMulti` built on them) is computed once
+    for a given dataset instance, and then reused, e.g. when the same property
+    controls the state of many items. Functions of `FuncProp` and `FuncPropMulti`
+    are therefore assumed not to depend on external state during the pass.
+
+    Cached values are cleared when an item value or a `ValueProp` is set. Passes
+    may be nested: the cache is shared with the outermost pass, and dropped when
+    leaving it.
+    """
+    passes = _PROPERTY_PASSES
+    depth = passes.depth
+    if depth == 0:
+        passes.cache = {}
+    passes.depth = depth + 1
+    try:
+        yield
+    finally:
+        passes.depth = depth
+        if depth == 0:
+            _PROPERTY_PASSES.cache = None
+
+
+def _clear_pass_cache() -> None:
+    """Clear the property values cached by the evaluation pass of this thread"""
+    cache = _PROPERTY_PASSES.cache
+    if cache:
+        cache.clear()
+
+
+def evaluate_property(
+    prop: ItemProperty, instance: DataSet, item: DataItem, value: Any
+) -> Any:
+    """Evaluate an item property, using the cache of the evaluation pass in
+    progress (if any, see :py:func:`property_evaluation_pass`)
+
+    Args:
+        prop (ItemProperty): item property
+        instance (DataSet): instance of the DataSet
+        item (DataItem): data item
+        value (Any): item value
+
+    Returns:
+        Any: property value
+    """
+    cache = _PROPERTY_PASSES.cache
+    if cache is None or not prop.item_independent:
+        return prop(instance, item, value)
+    key = (id(prop), id(instance))
+    try:
+        return cache[key]
+    except KeyError:
+        result = cache[key] = prop(instance, item, value)
+        return result
+
+
+class _DependencyRecorders(threading.local):
+    """Dependency recording of computed items in the current thread: stack of
+    recorders [instance, bitset of the items read], one per computation in
+    progress (the stack is empty when no computation is in progress, which is
+    checked first by DataItem.__get__)"""
+
+    def __init__(self) -> None:
+        self.stack: list[list] = []
+
+
+_DEPENDENCY_RECORDERS = _DependencyRecorders()
+
+
+def _get_dependency_recorders() -> list[list]:
+    """Return the dependency recorder stack of the current thread"""
+    return _DEPENDENCY_RECORDERS.stack
+
+
+def _record_dependency(instance: DataSet, bits: int) -> None:
+    """Record that items have been read during the computation in progress
+
+    Args:
+        instance (DataSet): instance of the DataSet
+        bits (int): bitset of the items read (see DataSetMeta)
+    """
+    stack = _get_dependency_recorders()
+    if stack and stack[-1][0] is instance:
+        stack[-1][1] |= bits
+
+
+def invalidate_computed(instance: DataSet, bits: int) -> None:
+    """Invalidate the cached computed item values which depend on items
+
+    Args:
+        instance (DataSet): instance of the DataSet
+        bits (int): bitset of the items which have been set (see DataSetMeta)
+    """
+    cache = instance._DataSet__computed
+    for name, (_value, dep_bits, prop) in list(cache.items()):
+        if dep_bits & bits:
+            del cache[name]
+            prop.invalidations += 1
+
+
+def invalidate_item_dependents(instance: DataSet, item: DataItem) -> None:
+    """Invalidate the values cached for an instance which may depend on an item
+    (computed item values, and property values cached by the evaluation pass in
+    progress), after the item value has been written without `DataItem.__set__`
+
+    Args:
+        instance (DataSet): instance of the DataSet
+        item (DataItem): data item
+    """
+    if _PROPERTY_PASSES.depth:
+        _clear_pass_cache()
+    if getattr(instance, "_DataSet__computed", None):
+        invalidate_computed(instance, instance._item_bits.get(item._name, 0))
+
+
+def _record_read(instance: DataSet, item: DataItem) -> None:
+    """Record that an item has been read during the computation in progress
+
+    Args:
+        instance (DataSet): instance of the DataSet
+        item (DataItem): data item
+    """
+    stack = _get_dependency_recorders()
+    if stack and stack[-1][0] is instance:
+        stack[-1][1] |= instance._item_bits.get(item._name, 0)
+
+
 class ComputedProp(ItemProperty):
     """A computed property that calls a method of the dataset to calculate values
 
+    Computed values are cached in the dataset instance, until one of the items they
+    depend on is set. Dependencies are detected by recording the items read during
+    the computation, and may also be declared explicitly with `depends_on` (e.g. if
+    the computation reads item values without using the item attributes). Values
+    modified in place (e.g. arrays) are not detected: set them again after
+    modification, or disable caching.
+
     Args:
         method_or_name: name of the method to call on the dataset instance,
          or the function object itself
+        depends_on: names of the items the computed value depends on, in addition
+         to the items read during the computation (optional)
+        cache: if False, the value is computed on each access (default: True)
     """
 
-    def __init__(self, method_or_name: str | callable) -> None:
+    def __init__(
+        self,
+        method_or_name: str | callable,
+        depends_on: Iterable[str] | None = None,
+        cache: bool = True,
+    ) -> None:
         if callable(method_or_name):
             self.method = method_or_name
             self.method_name = getattr(method_or_name, "__name__", str(method_or_name))
         else:
             self.method = None
             self.method_name = method_or_name
+        self.depends_on = tuple(depends_on or ())
+        self.cache = cache
+        #: Number of values returned from the cache
+        self.hits = 0
+        #: Number of values computed
+        self.misses = 0
+        #: Number of cached values invalidated
+        self.invalidations = 0
+        #: Bitset of the items read by all computations, for each DataSet class
+        self.recorded_dependencies: dict[type, int] = {}
+
+    def get_stats(self) -> dict[str, int]:
+        """Return cache statistics (for all dataset instances)
+
+        Returns:
+            dict[str, int]: number of cache hits, misses (i.e. computations) and
+            invalidations
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
+
+    def reset_stats(self) -> None:
+        """Reset cache statistics"""
+        self.hits = self.misses = self.invalidations = 0
 
     # pylint: disable=unused-argument
     def __call__(self, instance: DataSet, item: DataItem, value: Any) -> Any:
-        """Compute the value by calling the specified method on the dataset instance
+        """Compute the value by calling the specified method on the dataset instance,
+        or return the cached value
 
         Args:
             instance (DataSet): dataset instance
             item (DataItem): the data item
             value (Any): current value (ignored for computed items)
 
+        Returns:
+            Any: computed value
+        """
+        try:
+            cache = instance._DataSet__computed
+        except AttributeError:
+            # Not a DataSet instance (or not initialized yet): no caching
+            self.misses += 1
+            return self.compute(instance)
+        name = item._name
+        if cache is not None and name in cache:
+            self.hits += 1
+            value, bits, _prop = cache[name]
+            if _DEPENDENCY_RECORDERS.stack:
+                _record_dependency(instance, bits)
+            return value
+        recorder = [instance, 0]
+        stack = _get_dependency_recorders()
+        stack.append(recorder)
+        try:
+            value = self.compute(instance)
+        finally:
+            stack.pop()
+        self.misses += 1
+        item_bits = instance._item_bits
+        bits = recorder[1]
+        for dep_name in self.depends_on:
+            bits |= item_bits[dep_name]
+        if stack:
+            # Nested computation: dependencies are also those of the outer one
+            _record_dependency(instance, bits)
+        recorded = self.recorded_dependencies.get(instance.__class__)
+        if recorded is None or bits & ~recorded:
+            self.recorded_dependencies[instance.__class__] = (recorded or 0) | bits
+        if self.cache and instance._class_cache_computed:
+            if cache is None:
+                cache = instance._DataSet__computed = {}
+            cache[name] = (value, bits, self)
+        return value
+
+    def get_dependencies(self, instance: DataSet) -> set[str] | None:
+        """Return the names of the items read by the computations of the value, for
+        all the instances of the same DataSet class
+
+        As the computation of the current value is one of these computations, its
+        dependencies are included.
+
+        Args:
+            instance (DataSet): instance of the DataSet
+
+        Returns:
+            set[str] | None: names of the items, or None if the value has never been
+            computed
+        """
+        bits = self.recorded_dependencies.get(instance.__class__)
+        if bits is None:
+            return None
+        return {name for name, bit in instance._item_bits.items() if bits & bit}
+
+    def compute(self, instance: DataSet) -> Any:
+        """Compute the value by calling the specified method on the dataset instance
+
+        Args:
+            instance (DataSet): dataset instance
+
         Returns:
             Any: computed value
         """
@@ -410,6 +773,97 @@ class ComputedProp(ItemProperty):
         raise ValueError(f"Computed item '{item.get_name()}' is read-only")
 
 
+IMMUTABLE_TYPES = (
+    type(None),
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+    frozenset,
+    range,
+    enum.Enum,
+    np.generic,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+)
+
+
+def is_immutable(value: Any) -> bool:
+    """Return True if value is immutable, i.e. if it may be shared between data set
+    instances without being copied
+
+    Args:
+        value (Any): value
+
+    Returns:
+        bool: True if value is immutable
+    """
+    if isinstance(value, tuple):
+        return all(is_immutable(element) for element in value)
+    return isinstance(value, IMMUTABLE_TYPES) and not isinstance(value, np.void)
+
+
+class LazyDefault:
+    """Placeholder for a mutable default value which has not been copied yet
+
+    The same placeholder is stored in all data set instances which use the default
+    value of an item: the value is copied the first time it is accessed on an
+    instance (see :py:meth:`DataItem.__get__`).
+
+    Args:
+        value (Any): default value (validated and converted by the data item)
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def copy(self) -> Any:
+        """Return a copy of the default value"""
+        return deepcopy(self.value)
+
+    def __copy__(self) -> LazyDefault:
+        return self
+
+    def __deepcopy__(self, memo: dict) -> LazyDefault:
+        return self
+
+
+class DataItemAccessPlan:
+    """Precompiled attribute access plan of a data item
+
+    The plan gathers the data properties which are needed each time the item
+    value is read or set on a dataset instance, so that these properties are not
+    looked up on every attribute access. Plans are compiled by
+    :py:class:`DataSetMeta` when the DataSet class is created, and recompiled
+    after the data properties of the item have changed (see
+    :py:meth:`DataItem.set_prop`).
+
+    Args:
+        item (DataItem): data item
+    """
+
+    __slots__ = ("attr_name", "computed", "allow_none", "check", "default")
+
+    def __init__(self, item: DataItem) -> None:
+        #: Name of the instance attribute storing the item value
+        self.attr_name = f"_{item._name}"
+        computed = item.get_prop("data", "computed", None)
+        #: Computed property, or None if the item is not computed
+        self.computed = computed if isinstance(computed, ComputedProp) else None
+        #: True if None is a valid value
+        self.allow_none = bool(item.get_prop("data", "allow_none", False))
+        #: True if the value has to be checked when set
+        self.check = bool(item.get_prop("data", "check_value", True))
+        #: Default value, once validated: tuple (validation mode, `item._default`,
+        #: value to store in the instance), or None if not validated yet
+        self.default: tuple[ValidationMode, Any, Any] | None = None
+
+
 class DataItem(ABC):
     """DataSet data item
 
@@ -424,6 +878,7 @@ class DataItem(ABC):
 
     type = type
     count = 0
+    _plan: DataItemAccessPlan | None = None
 
     def __init__(
         self,
@@ -481,10 +936,48 @@ class DataItem(ABC):
         """
         value = self.get_prop(realm, name, default)
         if isinstance(value, ItemProperty):
+            if _PROPERTY_PASSES.depth and value.item_independent:
+                # The item value is not needed, and the property value may
+                # already have been computed during this evaluation pass
+                return evaluate_property(value, instance, self, None)
             return value(instance, self, self.get_value(instance))
         else:
             return value
 
+    def get_prop_dependencies(
+        self,
+        realm: str,
+        instance: DataSet,
+        names: Iterable[str] | None = None,
+        exclude: Iterable[str] = (),
+    ) -> set[str] | None:
+        """Return the names of the items on which the values of properties depend
+        (see :py:meth:`ItemProperty.get_dependencies`)
+
+        Args:
+            realm (str): realm name
+            instance (DataSet): instance of the DataSet
+            names (Iterable[str] | None): names of the properties (default: None,
+             all the properties of the realm)
+            exclude (Iterable[str]): names of the properties to ignore
+
+        Returns:
+            set[str] | None: names of the items, or None if unknown
+        """
+        realm_props = self._props.get(realm, {})
+        if names is None:
+            names = realm_props
+        dependencies = set()
+        for name in names:
+            value = realm_props.get(name)
+            if name in exclude or not isinstance(value, ItemProperty):
+                continue
+            prop_dependencies = value.get_dependencies(instance)
+            if prop_dependencies is None:
+                return None
+            dependencies |= prop_dependencies
+        return dependencies
+
     def set_prop(self, realm: str, **kwargs) -> DataItem:
         """Set one or several properties using the syntax::
 
@@ -503,8 +996,21 @@ class DataItem(ABC):
         """  # noqa
         prop = self._props.setdefault(realm, {})
         prop.update(kwargs)
+        if realm == "data":
+            self._plan = None
         return self
 
+    def get_access_plan(self) -> DataItemAccessPlan:
+        """Return the attribute access plan of this item, compiling it if needed
+
+        Returns:
+            DataItemAccessPlan: access plan
+        """
+        plan = self._plan
+        if plan is None:
+            plan = self._plan = DataItemAccessPlan(self)
+        return plan
+
     def set_pos(
         self, col: int = 0, colspan: int | None = None, row: int | None = None
     ) -> DataItem:
@@ -518,17 +1024,26 @@ class DataItem(ABC):
         self.set_prop("display", col=col, colspan=colspan, row=row)
         return self
 
-    def set_computed(self, method_or_name: str | callable) -> DataItem:
+    def set_computed(
+        self,
+        method_or_name: str | callable,
+        depends_on: Iterable[str] | None = None,
+        cache: bool = True,
+    ) -> DataItem:
         """Set data item as computed using the specified method
 
         Args:
             method_or_name: name of the method to call on the dataset instance to
              compute the value, or the function object itself
+            depends_on: names of the items the computed value depends on, in
+             addition to the items read during the computation (optional)
+            cache: if False, the value is computed on each access instead of being
+             cached until one of its dependencies is set (default: True)
 
         Returns:
             DataItem: self
         """
-        computed_prop = ComputedProp(method_or_name)
+        computed_prop = ComputedProp(method_or_name, depends_on, cache)
         self.set_prop("data", computed=computed_prop)
         # Also make it readonly in the display
         self.set_prop("display", readonly=True)
@@ -621,6 +1136,7 @@ class DataItem(ABC):
             new_name (str): new name
         """
         self._name = new_name
+        self._plan = None
 
     def set_help(self, new_help: str) -> None:
         """Set data item's help text
@@ -651,12 +1167,29 @@ class DataItem(ABC):
     def set_default(self, instance: DataSet) -> None:
         """Set data item's value to default
 
+        The default value is validated (and converted, if needed) only once for a
+        given validation mode. Immutable default values are then shared between
+        instances, and mutable default values are copied on first access (see
+        :py:class:`LazyDefault`).
+
         Args:
             instance (DataSet): instance of the DataSet
         """
+        plan = self._plan or self.get_access_plan()
+        default = plan.default
+        vmode = get_validation_mode()
+        if default is not None and default[0] is vmode and default[1] is self._default:
+            setattr(instance, plan.attr_name, default[2])
+            invalidate_item_dependents(instance, self)
+            return
         try:
             value = deepcopy(self._default)
             self._set_value_with_validation(instance, value, force_allow_none=True)
+            value = getattr(instance, plan.attr_name)
+            if not is_immutable(value):
+                value = LazyDefault(deepcopy(value))
+            plan.default = (vmode, self._default, value)
+            invalidate_item_dependents(instance, self)
         except ValueError as exc:
             # Convert generic ValueError to a more specific DataItemValidationError
             # to provide clearer context when setting default values fails
@@ -692,11 +1225,34 @@ class DataItem(ABC):
             value (Any): value to set
         """
         # Check if this item is computed (read-only)
-        computed_prop = self.get_prop("data", "computed", None)
-        if isinstance(computed_prop, ComputedProp):
+        plan = self._plan or self.get_access_plan()
+        if plan.computed is not None:
             raise ValueError(f"Computed item '{self.get_name()}' is read-only")
+        if _PROPERTY_PASSES.depth:
+            # Property values cached by the evaluation pass may depend on the item
+            _clear_pass_cache()
 
-        self._set_value_with_validation(instance, value, force_allow_none=False)
+        try:
+            journal = instance._DataSet__journal
+        except AttributeError:
+            # Not a DataSet instance: no change tracking
+            self._set_value_with_validation(instance, value, force_allow_none=False)
+            return
+        if journal is None:
+            self._set_value_with_validation(instance, value, force_allow_none=False)
+        else:
+            old_value = getattr(instance, plan.attr_name, None)
+            if old_value.__class__ is LazyDefault:
+                old_value = old_value.value
+            self._set_value_with_validation(instance, value, force_allow_none=False)
+            journal.append(
+                (self._name, old_value, getattr(instance, plan.attr_name, None))
+            )
+        # Mark the item as changed (see DataSet.changed_items)
+        bit = instance._item_bits[self._name]
+        instance._DataSet__changed |= bit
+        if instance._DataSet__computed:
+            invalidate_computed(instance, bit)
 
     def _set_value_with_validation(
         self, instance: Any, value: Any, force_allow_none: bool = False
@@ -709,17 +1265,18 @@ class DataItem(ABC):
             force_allow_none (bool): if True, allow None values even when
              allow_none is False (used for default values)
         """
+        plan = self._plan or self.get_access_plan()
         vmode = get_validation_mode()
 
         # Early exit if validation is disabled
-        if vmode == ValidationMode.DISABLED:
-            setattr(instance, f"_{self._name}", value)
+        if vmode == ValidationMode.DISABLED or not plan.check:
+            setattr(instance, plan.attr_name, value)
             return
 
         # Check if validation should be skipped for None values
         if value is None:
-            if force_allow_none or self.get_prop("data", "allow_none", False):
-                setattr(instance, f"_{self._name}", value)
+            if force_allow_none or plan.allow_none:
+                setattr(instance, plan.attr_name, value)
                 return
 
         # Perform validation
@@ -739,20 +1296,25 @@ class DataItem(ABC):
             else:
                 raise ValueError(f"Unknown validation mode: {vmode}") from exc
 
-        setattr(instance, f"_{self._name}", value)
+        setattr(instance, plan.attr_name, value)
 
     def __get__(self, instance: Any, klass: type) -> Any | None:
-        if instance is not None:
-            # Check if this item is computed
-            computed_prop = self.get_prop("data", "computed", None)
-            if isinstance(computed_prop, ComputedProp):
-                # For computed items, calculate the value using the computed property
-                return computed_prop(instance, self, None)
-            else:
-                # For regular items, return the stored value or default
-                return getattr(instance, "_%s" % (self._name), self._default)
-        else:
+        if instance is None:
             return self
+        if _DEPENDENCY_RECORDERS.stack:
+            # A computed item value is being computed: record the dependency
+            _record_read(instance, self)
+        plan = self._plan or self.get_access_plan()
+        if plan.computed is not None:
+            # For computed items, calculate the value using the computed property
+            return plan.computed(instance, self, None)
+        # For regular items, return the stored value or default
+        value = getattr(instance, plan.attr_name, self._default)
+        if value.__class__ is LazyDefault:
+            # Copy the mutable default value on first access
+            value = value.copy()
+            setattr(instance, plan.attr_name, value)
+        return value
 
     def get_value(self, instance: Any) -> Any:
         """Return data item's value
@@ -775,6 +1337,8 @@ class DataItem(ABC):
             Any: data item's value
         """
         value = getattr(instance, "_%s" % (self._name))
+        if isinstance(value, LazyDefault):
+            value = value.value
         return self.check_value(value)
 
     def check_value(self, value: Any, raise_exception: bool = False) -> bool:
@@ -790,6 +1354,63 @@ class DataItem(ABC):
         """
         raise NotImplementedError()
 
+    def _convert_value(self, value: Any) -> Any:
+        """Convert value before validation, as when it is set (e.g. NumPy scalar
+        types to Python types)
+
+        Args:
+            value (Any): value to convert
+
+        Returns:
+            Any: converted value
+        """
+        return value
+
+    def check_values(self, values: Sequence[Any] | np.ndarray) -> np.ndarray:
+        """Check a batch of values at once (calling method check_value for each
+        value, unless reimplemented with vectorized operations)
+
+        Values are converted as when they are set (e.g. integers are valid values of
+        float items), and None is valid if the item allows it.
+
+        Args:
+            values (Sequence[Any] | np.ndarray): one-dimensional sequence or array
+             of values
+
+        Returns:
+            np.ndarray: boolean array, True for valid values
+        """
+        plan = self._plan or self.get_access_plan()
+        mask = np.ones(len(values), dtype=bool)
+        if not plan.check:
+            return mask
+        for index, value in enumerate(values):
+            if value is None and plan.allow_none:
+                continue
+            try:
+                mask[index] = self.check_value(self._convert_value(value))
+            except NotImplementedError:
+                # Checking is not implemented for this item
+                return np.ones(len(values), dtype=bool)
+            except Exception:  # pylint: disable=broad-except
+                mask[index] = False
+        return mask
+
+    def get_check_message(self, value: Any) -> str:
+        """Return the reason why a value is invalid
+
+        Args:
+            value (Any): invalid value
+
+        Returns:
+            str: error message (as raised by method check_value)
+        """
+        try:
+            self.check_value(self._convert_value(value), raise_exception=True)
+        except Exception as exc:  # pylint: disable=broad-except
+            return str(exc)
+        return f"Invalid value {value!r}"
+
     def from_string(self, string_value: str) -> Any:
         """Transform string into valid data item's value
 
@@ -899,7 +1520,12 @@ class ObjectItem(DataItem):
             value = self.klass()  # pylint: disable=not-callable
             if self._default is not None:
                 update_dataset(value, self._default)
-            self.__set__(instance, value)
+                if isinstance(value, DataSet):
+                    # The default value is not a change of the object
+                    value.mark_clean()
+            # Set the value without marking the item as changed (see __set__)
+            self._set_value_with_validation(instance, value, force_allow_none=True)
+            invalidate_item_dependents(instance, self)
 
     def deserialize(
         self,
@@ -1081,6 +1707,27 @@ class DataItemProxy:
         """
         return self.item.get_prop_value(realm, instance, name, default)
 
+    def get_prop_dependencies(
+        self,
+        realm: str,
+        instance: DataSet,
+        names: Iterable[str] | None = None,
+        exclude: Iterable[str] = (),
+    ) -> set[str] | None:
+        """Return the names of the items on which the values of properties depend
+
+        Args:
+            realm (str): realm name
+            instance (DataSet): instance of the DataSet
+            names (Iterable[str] | None): names of the properties (default: None,
+             all the properties of the realm)
+            exclude (Iterable[str]): names of the properties to ignore
+
+        Returns:
+            set[str] | None: names of the items, or None if unknown
+        """
+        return self.item.get_prop_dependencies(realm, instance, names, exclude)
+
     def set_prop(self, realm: str, **kwargs) -> DataItem:
         """DataItem method proxy
 
@@ -1316,6 +1963,10 @@ class DataSetMeta(type):
 
     Create class attribute `_items`: list of the DataSet class attributes,
     created in the same order as these attributes were written
+
+    For compact DataSet classes (`compact=True` class keyword, inherited by
+    subclasses), `__slots__` are generated for the item values, so that instances
+    have no `__dict__` (if all the base classes are compact too).
     """
 
     def __new__(
@@ -1331,9 +1982,47 @@ class DataSetMeta(type):
                     value._order = items[attrname]._order
                 items[attrname] = value
         dct["_items"] = list(items.values())
+        for item in dct["_items"]:
+            item.get_access_plan()
+        # Bit of each item in the change bitset of instances (see DataSet.__changed)
+        dct["_item_bits"] = {
+            item._name: 1 << index for index, item in enumerate(dct["_items"])
+        }
+        # Items which values may be data sets with their own change tracking
+        dct["_object_items"] = tuple(
+            item._name for item in dct["_items"] if isinstance(item, ObjectItem)
+        )
+        compact = kwargs.get("compact")
+        if compact is None:
+            compact = any(getattr(base, "_class_compact", False) for base in bases)
+        if compact and "__slots__" not in dct:
+            dct["__slots__"] = DataSetMeta.__get_compact_slots(bases, dct)
         # Pass kwargs through to type.__new__ (which will trigger __init_subclass__)
         return super().__new__(cls, name, bases, dct, **kwargs)
 
+    @staticmethod
+    def __get_compact_slots(bases: Any, dct: dict[str, Any]) -> tuple[str, ...]:
+        """Return the `__slots__` of a compact DataSet class
+
+        Args:
+            bases: base classes
+            dct: class namespace (including `_items`)
+
+        Returns:
+            Names of the slots which are not already defined by the base classes
+        """
+        existing = set()
+        for base in bases:
+            for klass in base.__mro__:
+                slots = klass.__dict__.get("__slots__", ())
+                existing.update((slots,) if isinstance(slots, str) else slots)
+        slots = []
+        for item in dct["_items"]:
+            slot = f"_{item._name}"
+            if slot not in existing and slot not in dct and slot not in slots:
+                slots.append(slot)
+        return tuple(slots)
+
 
 Meta_Py3Compat = DataSetMeta("Meta_Py3Compat", (object,), {})
 
@@ -1390,7 +2079,23 @@ class DataSet(metaclass=DataSetMeta):
         skip_defaults (bool): if True, do not set default values for items
     """
 
+    # Instances of non-compact subclasses also have a `__dict__` (see DataSetMeta)
+    __slots__ = (
+        "__weakref__",
+        "__icon",
+        "__readonly",
+        "__title",
+        "__comment",
+        "__changed",
+        "__journal",
+        "__computed",
+        "__outer_changed",
+    )
     _items: list[DataItem] = []
+    _item_bits: dict[str, int] = {}
+    _object_items: tuple[str, ...] = ()
+    #: If False, computed item values are never cached for instances of this class
+    _class_cache_computed: bool = True
     __metaclass__ = DataSetMeta  # keep it even with Python 3 (see DataSetMeta)
 
     # Class-level configuration (set via __init_subclass__)
@@ -1398,6 +2103,8 @@ class DataSet(metaclass=DataSetMeta):
     _class_comment: str | None = None
     _class_icon: str = ""
     _class_readonly: bool = False
+    _class_compact: bool = False
+    _compact_title: str | None = None
 
     def __init_subclass__(
         cls,
@@ -1405,6 +2112,7 @@ class DataSet(metaclass=DataSetMeta):
         comment: str | None = None,
         icon: str = "",
         readonly: bool = False,
+        compact: bool | None = None,
         **kwargs,
     ) -> None:
         """Called when a class inherits from DataSet.
@@ -1419,6 +2127,12 @@ class DataSet(metaclass=DataSetMeta):
             comment: Default comment for this DataSet class
             icon: Default icon for this DataSet class
             readonly: Default readonly state for this DataSet class
+            compact: If True, item values are stored in slots instead of the
+             instance `__dict__`, and the default title (computed from the class
+             docstring) is shared by all instances. This reduces the memory footprint
+             of each instance, but compact instances do not accept attributes other
+             than item values. If None (default), the setting is inherited from the
+             parent class.
             **kwargs: Additional arguments passed to parent __init_subclass__
         """
         super().__init_subclass__(**kwargs)
@@ -1426,6 +2140,9 @@ class DataSet(metaclass=DataSetMeta):
         cls._class_comment = comment
         cls._class_icon = icon
         cls._class_readonly = readonly
+        if compact is not None:
+            cls._class_compact = compact
+        cls._compact_title = None
 
     def __init__(
         self,
@@ -1446,6 +2163,12 @@ class DataSet(metaclass=DataSetMeta):
         elif self._class_title is not None:
             # Set at class level via __init_subclass__ (even if empty string)
             self.__title = self._class_title
+        elif self._class_compact:
+            # Fall back to docstring, computed once for all compact instances
+            klass = self.__class__
+            if klass._compact_title is None:
+                klass._compact_title = self._compute_title_and_comment()[0]
+            self.__title = klass._compact_title
         else:
             # Fall back to docstring (for backward compatibility)
             comp_title, comp_comment = self._compute_title_and_comment()
@@ -1462,9 +2185,189 @@ class DataSet(metaclass=DataSetMeta):
             # No automatic fallback to docstring for comment
             self.__comment = None
 
+        # Bitset of the items changed since the dataset was created, loaded or marked
+        # as clean (one bit per item, see DataSetMeta), and optional change journal
+        self.__changed = 0
+        self.__journal: list[tuple[str, Any, Any]] | None = None
+        # `track_changes` blocks in progress (innermost last): [bitset of the items
+        # changed before entering the block, bitset of the items set in the block
+        # and then marked as clean]
+        self.__outer_changed: list[list[int]] | None = None
+        # Cached computed item values: {name: (value, dependency bitset, property)}
+        self.__computed: dict[str, tuple[Any, int, ComputedProp]] | None = None
+
         if not skip_defaults:
             self.set_defaults()
 
+    def __copy__(self: AnyDataSet) -> AnyDataSet:
+        """Return a shallow copy of the data set, with its own change journal and
+        cached computed values"""
+        return self.__copy_with(lambda state: state)
+
+    def __deepcopy__(self: AnyDataSet, memo: dict[int, Any]) -> AnyDataSet:
+        """Return a deep copy of the data set, with its own change journal and
+        cached computed values"""
+        return self.__copy_with(lambda state: deepcopy(state, memo), memo)
+
+    def __copy_with(
+        self: AnyDataSet,
+        copy_state: Callable[[dict[str, Any]], dict[str, Any]],
+        memo: dict[int, Any] | None = None,
+    ) -> AnyDataSet:
+        """Return a copy of the data set (see :py:meth:`__copy__`)
+
+        Args:
+            copy_state: function copying the instance attributes: {name: value}
+            memo: `deepcopy` memo dictionary, if any
+
+        Returns:
+            Copy of the data set
+        """
+        func, args, state = self.__reduce_ex__(4)[:3]
+        result = func(*args)
+        if memo is not None:
+            memo[id(self)] = result
+        attrs: dict[str, Any] = {}
+        for part in state if isinstance(state, tuple) else (state,):
+            attrs.update(part or {})
+        # Change tracking state and cache of the original are not shared
+        for name in ("__computed", "__outer_changed"):
+            attrs.pop(f"_DataSet{name}", None)
+        for name, value in copy_state(attrs).items():
+            setattr(result, name, value)
+        result.__computed = None
+        result.__outer_changed = None
+        if self.__journal is not None and result.__journal is self.__journal:
+            result.__journal = list(self.__journal)
+        return result
+
+    def changed_items(self) -> list[str]:
+        """Return the names of the items which have been set since the dataset was
+        created, loaded (see :py:meth:`deserialize`) or marked as clean (see
+        :py:meth:`mark_clean`)
+
+        Setting the default value of an item does not mark it as changed. Object
+        items (see :py:class:`ObjectItem`) are also changed when the data set they
+        hold has changed items.
+
+        Returns:
+            list[str]: names of the changed items
+        """
+        changed = self.__changed
+        bits = self._item_bits
+        for name in self._object_items:
+            value = getattr(self, name)
+            if getattr(value, "changed_items", None) and value.changed_items():
+                changed |= bits[name]
+        if not changed:
+            return []
+        return [item._name for item in self._items if changed & bits[item._name]]
+
+    def mark_clean(self, names: Iterable[str] | None = None) -> None:
+        """Mark items as unchanged (e.g. after saving the dataset)
+
+        The data sets held by object items are marked as clean as well.
+
+        Marking changed items as clean makes the data set differ from the files it
+        has been written to in update mode (see :py:class:`guidata.io.HDF5Writer`):
+        it will be written entirely the next time.
+
+        Args:
+            names (Iterable[str] | None): names of the items to mark as unchanged.
+             If None (default), all items are marked as unchanged, and the change
+             journal (if enabled) is cleared.
+        """
+        changed = self.changed_items()
+        if changed and (names is None or not set(names).isdisjoint(changed)):
+            set_sync_token(self, None)
+        if names is None:
+            self.__clear_changed(-1)
+            if self.__journal is not None:
+                self.__journal.clear()
+            names = self._object_items
+        else:
+            names = list(names)
+            bits = 0
+            for name in names:
+                bits |= self._item_bits[name]
+            self.__clear_changed(bits)
+        for name in names:
+            if name in self._object_items:
+                value = getattr(self, name)
+                if getattr(value, "mark_clean", None):
+                    value.mark_clean()
+
+    def __clear_changed(self, bits: int) -> None:
+        """Mark items as unchanged, including in the changes saved by the
+        `track_changes` blocks in progress
+
+        Args:
+            bits (int): bitset of the items (see DataSetMeta)
+        """
+        blocks = self.__outer_changed
+        if blocks:
+            blocks[-1][1] |= self.__changed & bits
+            for index in range(len(blocks) - 1, -1, -1):
+                if index:
+                    # Items set in the enclosing block before entering this one
+                    blocks[index - 1][1] |= blocks[index][0] & bits
+                blocks[index][0] &= ~bits
+        self.__changed &= ~bits
+
+    @contextmanager
+    def track_changes(self) -> Iterator[set[str]]:
+        """Context manager collecting the names of the items set inside the `with`
+        block (e.g. by a callback), in the set returned by the context manager
+
+        The set is filled when leaving the block. Items changed before entering the
+        block are still returned by :py:meth:`changed_items` afterwards, unless they
+        are marked as clean inside the block (see :py:meth:`mark_clean`). Items set
+        and then marked as clean inside the block are collected as well.
+        """
+        blocks = self.__outer_changed
+        if blocks is None:
+            blocks = self.__outer_changed = []
+        blocks.append([self.__changed, 0])
+        self.__changed = 0
+        names: set[str] = set()
+        try:
+            yield names
+        finally:
+            # Items marked as clean in the block have been removed from the saved
+            # bitset, and are still returned as set in the block (see
+            # __clear_changed)
+            changed, cleaned = blocks.pop()
+            block_changed = self.__changed | cleaned
+            bits = self._item_bits
+            for item in self._items:
+                if block_changed & bits[item._name]:
+                    names.add(item._name)
+            if blocks:
+                blocks[-1][1] |= cleaned
+            self.__changed |= changed
+
+    def set_journal_enabled(self, enabled: bool) -> None:
+        """Enable or disable the change journal: when enabled, each item value
+        change is recorded as a tuple (item name, old value, new value)
+
+        Args:
+            enabled (bool): True to enable the journal, False to disable it (and
+             discard its entries)
+        """
+        if not enabled:
+            self.__journal = None
+        elif self.__journal is None:
+            self.__journal = []
+
+    def get_journal(self) -> list[tuple[str, Any, Any]]:
+        """Return the change journal entries (see :py:meth:`set_journal_enabled`)
+
+        Returns:
+            list[tuple[str, Any, Any]]: tuples (item name, old value, new value),
+            in chronological order (empty list if the journal is disabled)
+        """
+        return [] if self.__journal is None else list(self.__journal)
+
     def get_items(self, copy=False) -> list[DataItem]:
         """Returns all the DataItem objects from the DataSet instance. Ignore private
         items that have a name starting with an underscore (e.g. '_private_item = ...')
@@ -1599,6 +2502,8 @@ class DataSet(metaclass=DataSetMeta):
 
     def set_defaults(self) -> None:
         """Set default values"""
+        self.__computed = None
+        set_sync_token(self, None)
         for item in self._items:
             item.set_default(self)
 
@@ -1626,6 +2531,61 @@ class DataSet(metaclass=DataSetMeta):
                 errors.append(item._name)
         return errors
 
+    def check_many(
+        self, values_by_item: dict[str, Sequence[Any] | np.ndarray]
+    ) -> tuple[np.ndarray, dict[str, str]]:
+        """Check batches of item values at once, e.g. before applying many updates
+        to the dataset (see :py:meth:`DataItem.check_values`)
+
+        Invalid values are reported depending on the validation mode: nothing
+        more than the returned errors if validation is disabled, a warning for
+        each item with invalid values if validation is enabled, and an exception
+        for the first item with invalid values in strict mode.
+
+        Args:
+            values_by_item (dict[str, Sequence[Any] | np.ndarray]): values to check,
+             by item name (all sequences must have the same length)
+
+        Returns:
+            tuple[np.ndarray, dict[str, str]]: boolean array (True for the indexes
+            where the values of all items are valid), and error messages by item name
+            (for items with invalid values)
+
+        Raises:
+            AttributeError: if an item name is not an item of the dataset
+            ValueError: if the sequences do not have the same length
+            DataItemValidationError: if a value is invalid in strict validation mode
+        """
+        items = {item._name: item for item in self._items}
+        sizes = {len(values) for values in values_by_item.values()}
+        if len(sizes) > 1:
+            raise ValueError("All value sequences must have the same length")
+        mask = np.ones(sizes.pop() if sizes else 0, dtype=bool)
+        errors: dict[str, str] = {}
+        vmode = get_validation_mode()
+        for name, values in values_by_item.items():
+            item = items.get(name)
+            if item is None:
+                raise AttributeError(
+                    f"DataSet class '{self.__class__.__name__}' "
+                    f"has no attribute '{name}'"
+                )
+            item_mask = item.check_values(values)
+            if item_mask.all():
+                continue
+            mask &= item_mask
+            invalid = np.flatnonzero(~item_mask)
+            errors[name] = msg = (
+                f"{len(invalid)} invalid value(s) out of {len(values)} (first at "
+                f"index {invalid[0]}: {item.get_check_message(values[invalid[0]])})"
+            )
+            if vmode == ValidationMode.ENABLED:
+                msg = f"Checking {self.__class__.__name__}.{str(item)}: {msg}"
+                warnings.warn(msg, DataItemValidationWarning)
+            elif vmode == ValidationMode.STRICT:
+                raise DataItemValidationError(self, item, msg)
+        return mask, errors
+
     def text_edit(self) -> None:
         """Edit data set with text input only"""
         from guidata.dataset import textedit
@@ -1895,23 +2855,89 @@ class DataSet(metaclass=DataSetMeta):
         """
         return DATASET_TABLE_CSS + self.to_html()
 
-    def serialize(self, writer: HDF5Writer | JSONWriter | INIWriter) -> None:
+    def __filter_items(
+        self, include: Iterable[str] | None, exclude: Iterable[str] | None
+    ) -> list[DataItem]:
+        """Return the items selected by `include` and `exclude`
+
+        Args:
+            include (Iterable[str] | None): names of the items to select
+             (if None, all items are selected)
+            exclude (Iterable[str] | None): names of the items not to select
+
+        Returns:
+            list[DataItem]: selected items
+
+        Raises:
+            AttributeError: if `include` or `exclude` contains a name which is not
+             an item of the dataset
+        """
+        items = self._items
+        if include is not None or exclude is not None:
+            names = [item._name for item in items]
+            include = names if include is None else list(include)
+            exclude = [] if exclude is None else list(exclude)
+            for name in include + exclude:
+                if name not in names:
+                    raise AttributeError(
+                        f"DataSet class '{self.__class__.__name__}' "
+                        f"has no attribute '{name}'"
+                    )
+            items = [
+                item
+                for item in items
+                if item._name in include and item._name not in exclude
+            ]
+        return items
+
+    def serialize(
+        self,
+        writer: HDF5Writer | JSONWriter | INIWriter,
+        include: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+    ) -> None:
         """Serialize the dataset
 
         Args:
             writer (HDF5Writer | JSONWriter | INIWriter): writer object
+            include (Iterable[str] | None): names of the items to serialize
+             (if None, all items are serialized), e.g. the changed items (see
+             :py:meth:`changed_items`)
+            exclude (Iterable[str] | None): names of the items not to serialize
+
+        Raises:
+            AttributeError: if `include` or `exclude` contains a name which is not
+             an item of the dataset
         """
-        for item in self._items:
+        for item in self.__filter_items(include, exclude):
             with writer.group(item._name):
                 item.serialize(self, writer)
 
-    def deserialize(self, reader: HDF5Reader | JSONReader | INIReader) -> None:
+    def deserialize(
+        self,
+        reader: HDF5Reader | JSONReader | INIReader,
+        include: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+    ) -> None:
         """Deserialize the dataset
 
+        Items which are not deserialized (see `include` and `exclude`) are left
+        untouched, and their values are not read from the file at all.
+
         Args:
             reader (HDF5Reader | JSONReader | INIReader): reader object
+            include (Iterable[str] | None): names of the items to deserialize
+             (if None, all items are deserialized)
+            exclude (Iterable[str] | None): names of the items not to deserialize
+
+        Raises:
+            AttributeError: if `include` or `exclude` contains a name which is not
+             an item of the dataset
         """
-        for item in self._items:
+        items = self.__filter_items(include, exclude)
+        # The data set may not match the files it has been written to anymore
+        set_sync_token(self, None)
+        for item in items:
             with reader.group(item._name):
                 if item.get_prop("data", "computed", None) is not None:
                     continue  # Skip computed items
@@ -1927,6 +2953,14 @@ class DataSet(metaclass=DataSetMeta):
                         traceback.print_stack()
                         print(error, file=sys.stderr)
                     item.set_default(self)
+        # Loaded items are not changed anymore
+        bits = 0
+        for item in items:
+            bits |= self._item_bits[item._name]
+        self.__clear_changed(bits)
+        # Items may have been set to their default value without invalidating the
+        # cached computed values
+        self.__computed = None
 
     def read_config(self, conf: UserConfig, section: str, option: str) -> None:
         """Read configuration from a UserConfig instance
@@ -1942,13 +2976,17 @@ class DataSet(metaclass=DataSetMeta):
     def write_config(self, conf: UserConfig, section: str, option: str) -> None:
         """Write configuration to a UserConfig instance
 
+        The configuration file is written only once, after all items have been
+        serialized.
+
         Args:
             conf (UserConfig): UserConfig instance
             section (str): section name
             option (str): option name
         """
-        writer = INIWriter(conf, section, option)
-        self.serialize(writer)
+        with conf.transaction():
+            writer = INIWriter(conf, section, option)
+            self.serialize(writer)
 
     @classmethod
     def set_global_prop(klass, realm: str, **kwargs) -> None:
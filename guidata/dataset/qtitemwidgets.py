@@ -475,8 +475,12 @@ def _display_callback(widget: AbstractDataSetWidget, value):
             widget.set()
             return
         top_level_layout.update_dataitems()
-        if cb is not None:
-            cb(widget.item.instance, widget.item.item, value)
+        # Widget values have been written to the data set, so only the edited item
+        # and the items set by the callback may have changed
+        with widget.item.instance.track_changes() as names:
+            if cb is not None:
+                cb(widget.item.instance, widget.item.item, value)
+        names.add(widget.item.item.get_name())
         # Set `build_mode` on all sibling widgets while we refresh them, so
         # the cascading `setText` calls below do not re-enter this function
         # and recursively call `update_widgets` with a different
@@ -486,7 +490,8 @@ def _display_callback(widget: AbstractDataSetWidget, value):
         for w in all_widgets:
             w.build_mode = True
         try:
-            top_level_layout.update_widgets(except_this_one=widget)
+            top_level_layout.update_widgets(except_this_one=widget, names=names)
+            top_level_layout.refresh_widgets(names=names)
         finally:
             for w, mode in previous_modes:
                 w.build_mode = mode
@@ -707,8 +712,9 @@ class CheckBoxWidget(AbstractDataSetWidget):
             self.do_store(state)
 
     def do_store(self, state: bool) -> None:
-        self.store.set(self.item.instance, self.item.item, state)
-        self.parent_layout.refresh_widgets()
+        with self.item.instance.track_changes() as names:
+            self.store.set(self.item.instance, self.item.item, state)
+        self.retrieve_top_level_layout().refresh_widgets(names=names)
 
     def set_state(self):
         """Update the visual status of the widget and enables/disables it if
@@ -1167,8 +1173,9 @@ class ChoiceWidget(AbstractDataSetWidget):
             index: index of the combobox, unused (but required by the signal)
         """
         if self.store:
-            self.store.set(self.item.instance, self.item.item, self.value())
-            self.parent_layout.refresh_widgets()
+            with self.item.instance.track_changes() as names:
+                self.store.set(self.item.instance, self.item.item, self.value())
+            self.retrieve_top_level_layout().refresh_widgets(names=names)
         _display_callback(self, self.value())
         self.notify_value_change()
 
@@ -35,6 +35,9 @@ Layouts
     :show-inheritance:
     :members:
 
+.. autoclass:: WidgetDependencyGraph
+    :members:
+
 Group boxes
 ^^^^^^^^^^^
 
@@ -49,6 +52,7 @@ Group boxes
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, Any, Generic
 
 from qtpy.compat import getopenfilename, getopenfilenames, getsavefilename
@@ -80,10 +84,11 @@ from qtpy.QtWidgets import (
 )
 
 from guidata.config import CONF, _
-from guidata.configtools import get_font, get_icon
+from guidata.configtools import get_cached_font, get_icon
 from guidata.dataset.datatypes import (
     AnyDataSet,
     BeginGroup,
+    ComputedProp,
     DataItem,
     DataItemVariable,
     DataSet,
@@ -92,6 +97,7 @@ from guidata.dataset.datatypes import (
     GroupItem,
     SeparatorItem,
     TabGroupItem,
+    property_evaluation_pass,
 )
 from guidata.qthelpers import win32_fix_title_bar_background
 
@@ -290,6 +296,159 @@ class DataSetGroupEditDialog(DataSetEditDialog):
                 tabs.addTab(page, dataset.get_title())
 
 
+class WidgetDependencyGraph:
+    """Dependencies of the widgets of a layout (including the widgets of nested
+    layouts) on the items of the edited data set
+
+    The dependencies are given by the item properties (see
+    :py:meth:`guidata.dataset.ItemProperty.get_dependencies`):
+
+    - the state of a widget depends on its `active` and `readonly` display
+      properties,
+    - the value shown by a widget depends on its item, and on its other properties
+      (e.g. choices of a `ChoiceItem` depending on another item),
+    - the value of a computed item depends on the items read when computing it.
+
+    Widgets depending on properties with unknown dependencies (e.g. `ValueProp`, or
+    properties built on callables) are always considered as affected by changes.
+
+    Args:
+        layout: layout
+    """
+
+    #: Display properties which may change the state of a widget (see `set_state`)
+    STATE_PROPS = ("active", "readonly")
+    #: Display properties which are not used to show the value of an item
+    NON_VALUE_PROPS = STATE_PROPS + ("hide", "store", "callback", "value_callback")
+
+    def __init__(self, layout: DataSetEditLayout) -> None:
+        self.instance = layout.instance
+        #: All widgets, containers (groups and tabs) before their content
+        self.widgets: list[AbstractDataSetWidget] = []
+        self.__value_widgets: dict[str, list[AbstractDataSetWidget]] = {}
+        self.__state_widgets: dict[str, list[AbstractDataSetWidget]] = {}
+        self.__dynamic_value_widgets: list[AbstractDataSetWidget] = []
+        self.__dynamic_state_widgets: list[AbstractDataSetWidget] = []
+        self.__computed: list[tuple[str, ComputedProp]] = []
+        stack = layout.widgets[::-1]
+        while stack:
+            widget = stack.pop()
+            self.widgets.append(widget)
+            self.__add_widget(widget)
+            if isinstance(widget, GroupWidget):
+                stack.extend(widget.edit.widgets[::-1])
+            elif isinstance(widget, TabGroupWidget):
+                stack.extend(widget.widgets[::-1])
+
+    def __add_widget(self, widget: AbstractDataSetWidget) -> None:
+        """Add widget dependencies to the graph
+
+        Args:
+            widget: widget
+        """
+        item = widget.item.item
+        names = item.get_prop_dependencies("display", self.instance, self.STATE_PROPS)
+        self.__register(
+            widget, names, self.__state_widgets, self.__dynamic_state_widgets
+        )
+        if isinstance(widget, (GroupWidget, TabGroupWidget)):
+            return
+        name = item.get_name()
+        names = item.get_prop_dependencies("data", self.instance, exclude=("computed",))
+        if names is not None:
+            display_names = item.get_prop_dependencies(
+                "display", self.instance, exclude=self.NON_VALUE_PROPS
+            )
+            names = None if display_names is None else names | display_names | {name}
+        self.__register(
+            widget, names, self.__value_widgets, self.__dynamic_value_widgets
+        )
+        computed_prop = item.get_prop("data", "computed", None)
+        if isinstance(computed_prop, ComputedProp):
+            self.__computed.append((name, computed_prop))
+
+    @staticmethod
+    def __register(
+        widget: AbstractDataSetWidget,
+        names: set[str] | None,
+        widgets: dict[str, list[AbstractDataSetWidget]],
+        dynamic_widgets: list[AbstractDataSetWidget],
+    ) -> None:
+        """Register widget as depending on items
+
+        Args:
+            widget: widget
+            names: names of the items (None if unknown)
+            widgets: widgets depending on each item
+            dynamic_widgets: widgets with unknown dependencies
+        """
+        if names is None:
+            dynamic_widgets.append(widget)
+        else:
+            for name in names:
+                widgets.setdefault(name, []).append(widget)
+
+    def get_changed_items(self, names: Iterable[str]) -> set[str]:
+        """Return the names of the items which may have changed, including computed
+        items depending on the changed items
+
+        Args:
+            names: names of the items which have been set
+
+        Returns:
+            names of the items
+        """
+        names = set(names)
+        changed = set(names)
+        for name, prop in self.__computed:
+            dependencies = prop.get_dependencies(self.instance)
+            if dependencies is None or dependencies & names:
+                changed.add(name)
+        return changed
+
+    def __get_widgets(
+        self,
+        names: set[str],
+        widgets: dict[str, list[AbstractDataSetWidget]],
+        dynamic_widgets: list[AbstractDataSetWidget],
+    ) -> list[AbstractDataSetWidget]:
+        """Return the widgets depending on items, in layout order"""
+        affected = set(dynamic_widgets)
+        for name in names:
+            affected.update(widgets.get(name, ()))
+        return [widget for widget in self.widgets if widget in affected]
+
+    def get_value_widgets(self, names: Iterable[str]) -> list[AbstractDataSetWidget]:
+        """Return the widgets which value must be updated after items have been set
+
+        Args:
+            names: names of the items which have been set
+
+        Returns:
+            terminal widgets (i.e. not `GroupWidget` or `TabGroupWidget`)
+        """
+        return self.__get_widgets(
+            self.get_changed_items(names),
+            self.__value_widgets,
+            self.__dynamic_value_widgets,
+        )
+
+    def get_state_widgets(self, names: Iterable[str]) -> list[AbstractDataSetWidget]:
+        """Return the widgets which state must be updated after items have been set
+
+        Args:
+            names: names of the items which have been set
+
+        Returns:
+            widgets, including containers (before their content)
+        """
+        return self.__get_widgets(
+            self.get_changed_items(names),
+            self.__state_widgets,
+            self.__dynamic_state_widgets,
+        )
+
+
 class DataSetEditLayout(Generic[AnyDataSet]):
     """Layout in which data item widgets are placed
 
@@ -332,6 +491,7 @@ class DataSetEditLayout(Generic[AnyDataSet]):
         self.change_callback = change_callback
         self.group_widget = group_widget
         self.widgets: list[AbstractDataSetWidget] = []
+        self.__dependency_graph: WidgetDependencyGraph | None = None
         # self.linenos = {}  # prochaine ligne à remplir par colonne
         self.items_pos: dict[DataItem, list[int]] = {}
         if not items:
@@ -440,12 +600,13 @@ class DataSetEditLayout(Generic[AnyDataSet]):
             last_item = [line, col, colspan]
             self.items_pos[item] = last_item
 
-        for item in items:
-            hide = item.get_prop_value("display", self.instance, "hide", False)
-            if hide:
-                continue
-            widget = self.build_widget(item)
-            self.add_row(widget)
+        with property_evaluation_pass():
+            for item in items:
+                hide = item.get_prop_value("display", self.instance, "hide", False)
+                if hide:
+                    continue
+                widget = self.build_widget(item)
+                self.add_row(widget)
 
         self.refresh_widgets()
 
@@ -461,8 +622,29 @@ class DataSetEditLayout(Generic[AnyDataSet]):
         factory = self._widget_factory[type(item)]
         widget = factory(item.bind(self.instance), self)
         self.widgets.append(widget)
+        self.invalidate_dependency_graph()
         return widget
 
+    def get_dependency_graph(self) -> WidgetDependencyGraph:
+        """Return the dependency graph of the widgets of the layout on the items
+        (built on first call)
+
+        Returns:
+            dependency graph
+        """
+        if self.__dependency_graph is None:
+            self.__dependency_graph = WidgetDependencyGraph(self)
+        return self.__dependency_graph
+
+    def invalidate_dependency_graph(self) -> None:
+        """Invalidate the dependency graph of this layout and of the parent layouts
+        (e.g. when a widget is added)"""
+        layout = self
+        while layout is not None:
+            layout.__dependency_graph = None
+            group_widget = layout.group_widget
+            layout = None if group_widget is None else group_widget.parent_layout
+
     def add_row(self, widget: DataSetShowWidget) -> None:
         """Add widget to row
 
@@ -481,10 +663,29 @@ class DataSetEditLayout(Generic[AnyDataSet]):
             print("Error building item :", item.item.get_name())
             raise
 
-    def refresh_widgets(self) -> None:
-        """Refresh the status of all widgets"""
-        for widget in self.widgets:
-            widget.set_state()
+    def refresh_widgets(self, names: Iterable[str] | None = None) -> None:
+        """Refresh the status of all widgets, or of the widgets depending on items
+
+        Item properties (e.g. `active` or `readonly` display properties) are
+        evaluated once per refresh pass (see `property_evaluation_pass`), even if
+        they are shared by many widgets.
+
+        Args:
+            names: names of the items which have been set: if not None, only the
+             widgets which state depends on these items are refreshed (see
+             `get_dependency_graph`). Defaults to None (all widgets are refreshed).
+        """
+        with property_evaluation_pass():
+            if names is None:
+                for widget in self.widgets:
+                    widget.set_state()
+                return
+            for widget in self.get_dependency_graph().get_state_widgets(names):
+                if isinstance(widget, (GroupWidget, TabGroupWidget)):
+                    # Contained widgets are refreshed separately, if needed
+                    AbstractDataSetWidget.set_state(widget)
+                else:
+                    widget.set_state()
 
     def update_dataitems(self) -> None:
         """Refresh the content of all data items"""
@@ -493,14 +694,24 @@ class DataSetEditLayout(Generic[AnyDataSet]):
                 widget.set()
 
     def update_widgets(
-        self, except_this_one: QWidget | AbstractDataSetWidget | None = None
+        self,
+        except_this_one: QWidget | AbstractDataSetWidget | None = None,
+        names: Iterable[str] | None = None,
     ) -> None:
-        """Refresh the content of all widgets
+        """Refresh the content of all widgets, or of the widgets depending on items
 
         Args:
             except_this_one: widget to skip (recursively, including widgets
              nested in `GroupWidget` or `TabGroupWidget` containers)
+            names: names of the items which have been set: if not None, only the
+             widgets which value depends on these items are refreshed (see
+             `get_dependency_graph`). Defaults to None (all widgets are refreshed).
         """
+        if names is not None:
+            for widget in self.get_dependency_graph().get_value_widgets(names):
+                if widget is not except_this_one:
+                    widget.get()
+            return
         for widget in self.widgets:
             if widget is except_this_one:
                 continue
@@ -837,9 +1048,10 @@ class DataSetShowGroupBox(Generic[AnyDataSet], QGroupBox):
             widget.build_mode = True
 
         # Now update all widgets from dataset
-        for widget in self.edit.widgets:
-            widget.get()
-            widget.set_state()
+        with property_evaluation_pass():
+            for widget in self.edit.widgets:
+                widget.get()
+                widget.set_state()
 
         # Reset build_mode after all updates are complete
         for widget in all_widgets:
@@ -1060,7 +1272,7 @@ class DataSetTableModel(QAbstractTableModel, Generic[AnyDataSet]):
         if role == Qt.ItemDataRole.TextAlignmentRole:
             return int(Qt.AlignCenter | Qt.AlignVCenter)  # type: ignore
         if role == Qt.ItemDataRole.FontRole:
-            return get_font(CONF, "arrayeditor", "font")
+            return get_cached_font(CONF, "arrayeditor", "font")
         return None
 
 
@@ -55,6 +55,17 @@ Reader and writer for the serialization of data sets into .json files:
 .. autoclass:: JSONWriter
     :members:
 
+JSON documents are encoded and decoded by a JSON backend: the standard library
+`json` module by default, or `orjson` (faster, with native NumPy support) if
+selected. All backends write the same documents, byte for byte.
+
+.. autofunction:: get_json_backend
+
+.. autofunction:: set_default_json_backend
+
+.. autoclass:: JSONBackend
+    :members:
+
 HDF5 files (.h5)
 ^^^^^^^^^^^^^^^^
 
@@ -68,10 +79,37 @@ Reader and writer for the serialization of data sets into .h5 files:
 
 .. autoclass:: HDF5Writer
     :members:
+
+.. autoclass:: LazyArray
+    :members:
+
+NumPy directories
+^^^^^^^^^^^^^^^^^
+
+Reader and writer for the serialization of data sets into directories holding a
+JSON manifest (scalar values) and one .npy file per array, read as memory-mapped
+arrays (faster than HDF5 files for many small groups, and without h5py):
+
+* :py:class:`NPYReader`
+* :py:class:`NPYWriter`
+
+.. autoclass:: NPYReader
+    :members:
+
+.. autoclass:: NPYWriter
+    :members:
 """
 
 # pylint: disable=unused-import
 from .base import BaseIOHandler, GroupContext, WriterMixin  # noqa
-from .h5fmt import HDF5Handler, HDF5Reader, HDF5Writer  # noqa
+from .h5fmt import HDF5Handler, HDF5Reader, HDF5Writer, LazyArray  # noqa
 from .inifmt import INIHandler, INIReader, INIWriter  # noqa
-from .jsonfmt import JSONHandler, JSONReader, JSONWriter  # noqa
+from .jsonfmt import (  # noqa
+    JSONBackend,
+    JSONHandler,
+    JSONReader,
+    JSONWriter,
+    get_json_backend,
+    set_default_json_backend,
+)
+from .npyfmt import NPYHandler, NPYReader, NPYWriter  # noqa
@@ -10,12 +10,62 @@ Base classes for I/O handlers
 from __future__ import annotations
 
 import datetime
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import Any
 
 import numpy as np
 
 
+def deserialize_object(
+    obj: Any,
+    reader: BaseIOHandler,
+    include: Iterable[str] | None = None,
+    exclude: Iterable[str] | None = None,
+) -> None:
+    """
+    Call the DataSet-like `deserialize` method of an object.
+
+    `include` and `exclude` are passed to the `deserialize` method only if they
+    are specified, so that objects implementing their own `deserialize` method
+    without these arguments are still supported.
+
+    Args:
+        obj: The object to deserialize.
+        reader: The reader object.
+        include: Names of the items to deserialize. Defaults to None.
+        exclude: Names of the items not to deserialize. Defaults to None.
+    """
+    if include is None and exclude is None:
+        obj.deserialize(reader)
+    else:
+        obj.deserialize(reader, include=include, exclude=exclude)
+
+
+def serialize_object(
+    obj: Any,
+    writer: BaseIOHandler,
+    include: Iterable[str] | None = None,
+    exclude: Iterable[str] | None = None,
+) -> None:
+    """
+    Call the DataSet-like `serialize` method of an object.
+
+    `include` and `exclude` are passed to the `serialize` method only if they
+    are specified, so that objects implementing their own `serialize` method
+    without these arguments are still supported.
+
+    Args:
+        obj: The object to serialize.
+        writer: The writer object.
+        include: Names of the items to serialize. Defaults to None.
+        exclude: Names of the items not to serialize. Defaults to None.
+    """
+    if include is None and exclude is None:
+        obj.serialize(writer)
+    else:
+        obj.serialize(writer, include=include, exclude=exclude)
+
+
 class GroupContext:
     """
     Group context manager object.
@@ -11,14 +11,20 @@ from __future__ import annotations
 
 import datetime
 import sys
-from collections.abc import Callable, Sequence
+import weakref
+from collections.abc import Callable, Iterable, Sequence
 from typing import Any
 from uuid import uuid1
 
 import h5py
 import numpy as np
 
-from guidata.io.base import BaseIOHandler, WriterMixin
+from guidata.io.base import (
+    BaseIOHandler,
+    WriterMixin,
+    deserialize_object,
+    serialize_object,
+)
 
 
 class TypeConverter:
@@ -406,6 +412,12 @@ class HDF5Handler(H5Store, BaseIOHandler):
     """
     Base HDF5 I/O Handler object. Inherits from H5Store and BaseIOHandler.
 
+    HDF5 group handles are kept in a stack which follows the `option` list (see
+    :py:meth:`begin` and :py:meth:`end`), so that reading or writing a value does
+    not require to walk the group hierarchy from the file root. Handles are
+    resolved lazily: a group is only opened (or created when writing) when a
+    value is read or written inside it.
+
     Args:
         filename: The name of the HDF5 file.
     """
@@ -413,6 +425,36 @@ class HDF5Handler(H5Store, BaseIOHandler):
     def __init__(self, filename: str) -> None:
         super().__init__(filename)
         self.option = []
+        # Group handles: item #i is the group at path `self.option[: i + 1]`,
+        # or None if this group has not been resolved yet
+        self.__groups: list[h5py.Group | None] = []
+
+    def begin(self, section: str) -> None:
+        """
+        Begin a new section (i.e. enter a group).
+
+        Args:
+            section: The name of the section to begin.
+        """
+        super().begin(section)
+        self.__groups.append(None)
+
+    def end(self, section: str) -> None:
+        """
+        End the current section (i.e. leave the current group).
+
+        Args:
+            section: The name of the section to end.
+        """
+        super().end(section)
+        self.__groups.pop(-1)
+
+    def close(self) -> None:
+        """
+        Closes the HDF5 file if it is open.
+        """
+        self.__groups = [None] * len(self.option)
+        super().close()
 
     def get_parent_group(self) -> h5py._hl.group.Group:
         """
@@ -421,14 +463,202 @@ class HDF5Handler(H5Store, BaseIOHandler):
         Returns:
             The parent group in the HDF5 file.
         """
-        parent = self.h5
-        for option in self.option[:-1]:
-            parent = parent.require_group(option)
+        groups = self.__groups
+        depth = len(self.option) - 1
+        if len(groups) != len(self.option):
+            # The `option` list has been modified without calling `begin`/`end`
+            groups[:] = [None] * len(self.option)
+        if depth <= 0:
+            return self.h5
+        parent = groups[depth - 1]
+        if parent is None:
+            # Resolve the missing handles from the deepest resolved ancestor
+            index = depth - 1
+            while index >= 0 and groups[index] is None:
+                index -= 1
+            parent = self.h5 if index < 0 else groups[index]
+            for index in range(index + 1, depth):
+                parent = parent.require_group(self.option[index])
+                groups[index] = parent
         return parent
 
 
 SEQUENCE_NAME = "__seq"
 DICT_NAME = "__dict"
+SEQUENCE_TYPE_NAME = "__seqtype__"
+TABLE_NAME = "__table"
+TABLE_NONE_NAME = "__none__"
+#: Attribute of the groups of the objects written in update mode, holding the
+#: synchronization token of the object (see :py:func:`get_sync_token`)
+SYNC_NAME = "__sync"
+
+# Synchronization tokens of the objects: {object: token}
+_SYNC_TOKENS: weakref.WeakKeyDictionary[Any, str] = weakref.WeakKeyDictionary()
+
+
+def get_sync_token(obj: Any) -> str | None:
+    """Return the synchronization token of an object.
+
+    When an object is written in update mode (see :py:class:`HDF5Writer`), a new
+    token is stored both in its group and in memory: the group contains the
+    state of the object as long as the tokens match. Tokens are also set when
+    reading an object from a group holding a token (see :py:class:`HDF5Reader`).
+
+    Args:
+        obj: The object.
+
+    Returns:
+        The token, or None if the object has never been written in update mode
+        nor read from a group holding a token (or if it does not support weak
+        references).
+    """
+    try:
+        return _SYNC_TOKENS.get(obj)
+    except TypeError:
+        return None
+
+
+def set_sync_token(obj: Any, token: str | None) -> None:
+    """Set the synchronization token of an object (see :py:func:`get_sync_token`).
+
+    Args:
+        obj: The object.
+        token: The token, or None to forget the token of the object.
+    """
+    try:
+        if token is None:
+            _SYNC_TOKENS.pop(obj, None)
+        else:
+            _SYNC_TOKENS[obj] = token
+    except TypeError:
+        pass
+
+
+def pack_sequence(seq: Sequence[Any]) -> tuple[np.ndarray, str] | None:
+    """Pack a homogeneous sequence into a single numpy array.
+
+    Supported sequences are non-empty sequences of booleans, integers, floats,
+    strings (`str` or UTF-8 encoded `bytes`) or numpy arrays sharing the same
+    shape and dtype.
+
+    Args:
+        seq: The sequence to pack.
+
+    Returns:
+        A tuple (array, sequence type), or None if the sequence is not homogeneous
+        (or if it is empty).
+    """
+    if len(seq) == 0:
+        return None
+    first = seq[0]
+    if isinstance(first, (bool, np.bool_)):
+        if all(isinstance(obj, (bool, np.bool_)) for obj in seq):
+            return np.array(seq, dtype=bool), "bool"
+    elif isinstance(first, (int, np.integer)):
+        if all(
+            isinstance(obj, (int, np.integer)) and not isinstance(obj, bool)
+            for obj in seq
+        ):
+            try:
+                return np.array(seq, dtype=np.int64), "int"
+            except OverflowError:
+                return None
+    elif isinstance(first, (float, np.floating)):
+        if all(isinstance(obj, (float, np.floating)) for obj in seq):
+            return np.array(seq, dtype=np.float64), "float"
+    elif isinstance(first, (str, bytes)):
+        if all(isinstance(obj, (str, bytes)) for obj in seq):
+            try:
+                strings = [
+                    obj.decode("utf-8") if isinstance(obj, bytes) else obj
+                    for obj in seq
+                ]
+            except UnicodeDecodeError:
+                return None
+            return np.array(strings, dtype=h5py.string_dtype()), "str"
+    elif isinstance(first, np.ndarray) and not isinstance(first, np.ma.MaskedArray):
+        if first.dtype.kind not in "OV" and all(
+            isinstance(obj, np.ndarray)
+            and not isinstance(obj, np.ma.MaskedArray)
+            and obj.shape == first.shape
+            and obj.dtype == first.dtype
+            for obj in seq
+        ):
+            return np.stack(seq), "array"
+    return None
+
+
+def is_packed_sequence(obj: h5py.Group | h5py.Dataset | None) -> bool:
+    """Return True if the HDF5 object is a sequence packed in a single dataset
+    (see :py:func:`pack_sequence`).
+
+    Args:
+        obj: The HDF5 object (or None).
+    """
+    return isinstance(obj, h5py.Dataset) and SEQUENCE_TYPE_NAME in obj.attrs
+
+
+def unpack_sequence(dset: h5py.Dataset) -> list[Any]:
+    """Read a sequence packed in a single dataset.
+
+    Args:
+        dset: The HDF5 dataset.
+
+    Returns:
+        The sequence, as a list.
+    """
+    seqtype = dset.attrs[SEQUENCE_TYPE_NAME]
+    if isinstance(seqtype, bytes):
+        seqtype = seqtype.decode("utf-8")
+    if seqtype == "str":
+        return dset.asstr()[...].tolist()
+    if seqtype == "array":
+        return list(dset[...])
+    return dset[...].tolist()
+
+
+def pack_table(columns: Sequence[tuple[str, np.ndarray]]) -> np.ndarray:
+    """Pack columns of the same length into a single compound array.
+
+    Unicode string columns are converted to variable-length HDF5 strings.
+
+    Args:
+        columns: The (name, values) columns (at least one).
+
+    Returns:
+        The compound array, with one field per column.
+    """
+    dtype = [
+        (
+            name,
+            h5py.string_dtype() if values.dtype.kind == "U" else values.dtype,
+            values.shape[1:],
+        )
+        for name, values in columns
+    ]
+    table = np.empty(len(columns[0][1]), dtype=dtype)
+    for name, values in columns:
+        table[name] = values
+    return table
+
+
+def unpack_table(table: np.ndarray) -> dict[str, np.ndarray]:
+    """Unpack the columns of a compound array read from an HDF5 dataset
+    (see :py:func:`pack_table`).
+
+    Args:
+        table: The compound array.
+
+    Returns:
+        The columns: {name: values} (string values are decoded).
+    """
+    columns = {}
+    for name in table.dtype.names:
+        values = table[name]
+        if h5py.check_string_dtype(table.dtype[name]) is not None:
+            values = np.array([value.decode("utf-8") for value in values], dtype=object)
+        columns[name] = values
+    return columns
 
 
 class HDF5Writer(HDF5Handler, WriterMixin):
@@ -437,11 +667,129 @@ class HDF5Writer(HDF5Handler, WriterMixin):
 
     Args:
         filename: The name of the HDF5 file.
+        packed_sequences: If True, homogeneous sequences (booleans, integers,
+         floats, strings or same-shape arrays) are written as a single dataset
+         instead of one attribute or dataset per element, and are read back as
+         lists. Files written with this option cannot be read by older versions
+         of guidata. Defaults to False.
+        compression: Default compression filter for arrays and packed sequences
+         ("gzip", "lzf" or a filter number). Defaults to None (no compression).
+        compression_opts: Default compression settings (e.g. compression level
+         for "gzip", from 0 to 9). Defaults to None.
+        shuffle: If True, the shuffle filter is enabled by default, which often
+         improves the compression ratio. Defaults to False.
+        chunks: Default chunk shape, or True for automatic chunking. Defaults to
+         None (automatic chunking if a filter is enabled, contiguous dataset
+         otherwise).
+        mode: "w" (default) to create a new file (an existing file is truncated),
+         or "a" to update an existing file (created if it does not exist), see
+         the note below.
+
+    .. note::
+        Array options may be overriden for each array written with
+        :py:meth:`write_array` (for example, by setting the `h5_compression`,
+        `h5_compression_opts`, `h5_shuffle` or `h5_chunks` data properties of a
+        :py:class:`guidata.dataset.FloatArrayItem`).
+
+    .. note::
+        In update mode (`mode="a"`), written values replace the existing ones:
+        arrays are overwritten in place when their shape and dtype did not change.
+        Objects with change tracking (like :py:class:`guidata.dataset.DataSet`, see
+        :py:meth:`guidata.dataset.DataSet.changed_items`) are written incrementally
+        when their group contains their state, i.e. when they have been read from
+        this group or last written to it in update mode (see
+        :py:func:`get_sync_token`): only the items changed since then are
+        rewritten, and the objects are then marked as clean. Other objects are
+        written entirely. Object lists are updated object by object. This supposes
+        that mutable values (e.g. arrays) are not modified in place but set again
+        after modification.
     """
 
-    def __init__(self, filename: str) -> None:
+    def __init__(
+        self,
+        filename: str,
+        packed_sequences: bool = False,
+        compression: str | int | None = None,
+        compression_opts: Any | None = None,
+        shuffle: bool = False,
+        chunks: tuple[int, ...] | bool | None = None,
+        mode: str = "w",
+    ) -> None:
         super().__init__(filename)
-        self.open("w")
+        if mode not in ("w", "a"):
+            raise ValueError(f"Invalid mode {mode!r} (expected 'w' or 'a')")
+        self.packed_sequences = packed_sequences
+        self.array_options = {
+            "chunks": chunks,
+            "compression": compression,
+            "compression_opts": compression_opts,
+            "shuffle": shuffle,
+        }
+        self.update_mode = mode == "a"
+        self.open(mode)
+
+    def __clear_entry(self, keep_group: bool = False) -> None:
+        """
+        In update mode, remove the existing value (attribute, dataset or group)
+        stored under the current name, before writing a new value.
+
+        Args:
+            keep_group: If True, an existing group is kept.
+        """
+        if not self.update_mode or not self.option:
+            return
+        group = self.get_parent_group()
+        name = self.option[-1]
+        for attr_name in (name, f"{name}__type__"):
+            if attr_name in group.attrs:
+                del group.attrs[attr_name]
+        if name in group and not (keep_group and isinstance(group[name], h5py.Group)):
+            del group[name]
+
+    def __create_dataset(
+        self, group: h5py.Group, name: str, data: Any, **options
+    ) -> h5py.Dataset:
+        """
+        Create a dataset, using the writer array options.
+
+        Args:
+            group: The group in which to create the dataset.
+            name: The name of the dataset.
+            data: The data to be stored in the dataset.
+            options: Array options overriding the writer array options
+             (see :py:meth:`write_array`).
+
+        Returns:
+            The new dataset.
+        """
+        if self.update_mode:
+            for attr_name in (name, f"{name}__type__"):
+                if attr_name in group.attrs:
+                    del group.attrs[attr_name]
+            dset = group.get(name)
+            if (
+                isinstance(dset, h5py.Dataset)
+                and dset.shape == np.shape(data)
+                and dset.dtype == np.asarray(data).dtype
+            ):
+                # Overwrite the existing dataset in place
+                for attr_name in list(dset.attrs):
+                    del dset.attrs[attr_name]
+                dset[...] = data
+                return dset
+            if dset is not None:
+                del group[name]
+        options = {**self.array_options, **options}
+        kwargs = {
+            key: value
+            for key, value in options.items()
+            if value is not None and value is not False
+        }
+        if not kwargs or np.ndim(data) == 0 or np.size(data) == 0:
+            # Chunking and filters are not supported for scalar or empty datasets
+            group[name] = data
+            return group[name]
+        return group.create_dataset(name, data=data, **kwargs)
 
     def write(self, val: Any, group_name: str | None = None) -> None:
         """
@@ -469,8 +817,12 @@ class HDF5Writer(HDF5Handler, WriterMixin):
             self.write_array(val)
         elif hasattr(val, "serialize") and isinstance(val.serialize, Callable):
             # The object has a DataSet-like `serialize` method
-            val.serialize(self)
+            if self.update_mode and self.option:
+                self.write_object_update(val)
+            else:
+                val.serialize(self)
         else:
+            self.__clear_entry()
             group = self.get_parent_group()
             try:
                 group.attrs[self.option[-1]] = val
@@ -489,6 +841,7 @@ class HDF5Writer(HDF5Handler, WriterMixin):
         Args:
             val: The value to write.
         """
+        self.__clear_entry()
         group = self.get_parent_group()
         group.attrs[self.option[-1]] = val
 
@@ -510,6 +863,7 @@ class HDF5Writer(HDF5Handler, WriterMixin):
         Args:
             val: The datetime value to write.
         """
+        self.__clear_entry()
         group = self.get_parent_group()
         attr_name = self.option[-1]
         group.attrs[attr_name] = val.timestamp()
@@ -522,36 +876,56 @@ class HDF5Writer(HDF5Handler, WriterMixin):
         Args:
             val: The date value to write.
         """
+        self.__clear_entry()
         group = self.get_parent_group()
         attr_name = self.option[-1]
         group.attrs[attr_name] = val.toordinal()
         group.attrs[f"{attr_name}__type__"] = "date"
 
-    def write_array(self, val: np.ndarray) -> None:
+    def write_array(self, val: np.ndarray, **options) -> None:
         """
         Write the numpy array value to the HDF5 file.
 
         Args:
             val: The numpy array value to write.
+            options: Array options overriding the writer array options:
+             `chunks`, `compression`, `compression_opts` and `shuffle` (see
+             :py:class:`HDF5Writer`).
         """
-        group = self.get_parent_group()
-        group[self.option[-1]] = val
+        for key in options:
+            if key not in self.array_options:
+                raise ValueError(f"unknown array option {key!r}")
+        self.__create_dataset(self.get_parent_group(), self.option[-1], val, **options)
 
     def write_none(self) -> None:
         """
         Write a None value to the HDF5 file as an attribute.
         """
+        self.__clear_entry()
         group = self.get_parent_group()
         group.attrs[self.option[-1]] = ""
 
     def write_sequence(self, val: list | tuple) -> None:
         """
-        Write the list or tuple value to the HDF5 file as an attribute.
+        Write the list or tuple value to the HDF5 file.
+
+        Homogeneous sequences are written as a single dataset (see
+        :py:func:`pack_sequence`), other sequences are written as a group
+        containing one attribute or dataset per element.
 
         Args:
             The value to write.
         """
-        # Check if all elements are of the same type, raise an error if not
+        packed = None
+        if self.packed_sequences and self.option:
+            packed = pack_sequence(val)
+        if packed is not None:
+            data, seqtype = packed
+            group = self.get_parent_group()
+            dset = self.__create_dataset(group, self.option[-1], data)
+            dset.attrs[SEQUENCE_TYPE_NAME] = seqtype
+            return
+        self.__clear_entry()
         for index, obj in enumerate(val):
             if val is None:
                 raise ValueError("cannot serialize None value in sequence")
@@ -568,6 +942,7 @@ class HDF5Writer(HDF5Handler, WriterMixin):
         # Check if keys are all strings, raise an error if not
         if not all(isinstance(key, str) for key in val.keys()):
             raise ValueError("cannot serialize dict with non-string keys")
+        self.__clear_entry()
         for key, value in val.items():
             with self.group(key):
                 if value is None:
@@ -575,7 +950,9 @@ class HDF5Writer(HDF5Handler, WriterMixin):
                 self.write(value)
         self.write(len(val), DICT_NAME)
 
-    def write_object_list(self, seq: Sequence[Any] | None, group_name: str) -> None:
+    def write_object_list(
+        self, seq: Sequence[Any] | None, group_name: str, table: bool = False
+    ) -> None:
         """
         Write an object sequence to the HDF5 file in a group.
         Objects must implement the DataSet-like `serialize` method.
@@ -583,10 +960,21 @@ class HDF5Writer(HDF5Handler, WriterMixin):
         Args:
             seq: The object sequence to write. Defaults to None.
             group_name: The name of the group in which to write the objects.
+            table: If True, and if `seq` is a list of instances of the same DataSet
+             class, objects are written column by column (see
+             :py:meth:`write_object_table`) instead of one group per object.
+             If the objects cannot be written as a table, this option is ignored.
+             Defaults to False.
         """
         with self.group(group_name):
+            if self.update_mode and seq is not None and not table:
+                self.__update_object_list(seq)
+                return
+            self.__clear_entry()
             if seq is None:
                 self.write_none()
+            elif table and self.write_object_table(seq):
+                pass
             else:
                 ids = []
                 for obj in seq:
@@ -600,6 +988,133 @@ class HDF5Writer(HDF5Handler, WriterMixin):
                 with self.group("IDs"):
                     self.write_list(ids)
 
+    def write_object_update(self, obj: Any) -> None:
+        """
+        Write an object with a DataSet-like `serialize` method, in update mode.
+
+        If the object supports change tracking (i.e. if it has DataSet-like
+        `changed_items` and `mark_clean` methods) and if its group contains its
+        state (see :py:func:`get_sync_token`), only its changed items are written.
+        Otherwise, the whole object is written (replacing the existing values).
+
+        Args:
+            obj: The object to write.
+        """
+        group = self.get_parent_group()
+        name = self.option[-1]
+        tracked = hasattr(obj, "changed_items") and hasattr(obj, "mark_clean")
+        self.__clear_entry(keep_group=True)
+        obj_group = group.get(name)
+        token = get_sync_token(obj)
+        if (
+            tracked
+            and token is not None
+            and isinstance(obj_group, h5py.Group)
+            and obj_group.attrs.get(SYNC_NAME) == token
+        ):
+            names = obj.changed_items()
+            if names:
+                serialize_object(obj, self, include=names)
+        else:
+            obj.serialize(self)
+        if tracked:
+            obj.mark_clean()
+            token = str(uuid1())
+            group.require_group(name).attrs[SYNC_NAME] = token
+            set_sync_token(obj, token)
+
+    def __update_object_list(self, seq: Sequence[Any]) -> None:
+        """
+        Write an object sequence in the current group, in update mode.
+
+        Objects which are already in the group (see :py:func:`get_sync_token`)
+        are written incrementally (see :py:meth:`write_object_update`), and the
+        groups of the objects which are no longer in the sequence are removed.
+
+        Args:
+            seq: The object sequence to write.
+        """
+        group = self.get_parent_group().get(self.option[-1])
+        old_ids: list[bytes] = []
+        if isinstance(group, h5py.Group) and TABLE_NAME not in group.attrs:
+            old_ids = [
+                guid.encode("utf-8") if isinstance(guid, str) else bytes(guid)
+                for guid in group.attrs.get("IDs", [])
+            ]
+        else:
+            self.__clear_entry()
+        # IDs of the existing object groups: {token: ID}
+        synced_ids = {}
+        for guid in old_ids:
+            obj_group = group.get(guid)
+            if isinstance(obj_group, h5py.Group) and SYNC_NAME in obj_group.attrs:
+                synced_ids[obj_group.attrs[SYNC_NAME]] = guid
+        ids = []
+        for obj in seq:
+            guid = None if obj is None else synced_ids.pop(get_sync_token(obj), None)
+            if guid is None:
+                guid = bytes(str(uuid1()), "utf-8")
+            ids.append(guid)
+            with self.group(guid):
+                if obj is None:
+                    self.write_none()
+                else:
+                    self.write_object_update(obj)
+        for guid in set(old_ids).difference(ids):
+            with self.group(guid):
+                self.__clear_entry()
+        with self.group("IDs"):
+            self.write_list(ids)
+
+    def write_object_table(self, seq: Sequence[Any]) -> bool:
+        """
+        Write a list of instances of the same DataSet class in the current group,
+        column by column.
+
+        Scalar item values (booleans, integers, floats and strings) are written in a
+        single compound dataset, with one field per item. Array item values are
+        written in one dataset per item (arrays of a given item must share the same
+        shape and dtype). Items which are None for all objects are only listed in an
+        attribute. Computed items are not written.
+
+        Args:
+            seq: The object sequence to write.
+
+        Returns:
+            True if the objects were written, False if they cannot be written as a
+            table (in that case, nothing is written).
+        """
+        if len(seq) == 0:
+            return False
+        klass = type(seq[0])
+        if not hasattr(klass, "_items") or any(type(obj) is not klass for obj in seq):
+            return False
+        fields, arrays, nones = [], [], []
+        for item in klass._items:
+            if item.get_prop("data", "computed", None) is not None:
+                continue
+            name = item.get_name()
+            values = [item.get_value(obj) for obj in seq]
+            if all(value is None for value in values):
+                nones.append(name)
+                continue
+            packed = pack_sequence(values)
+            if packed is None:
+                return False
+            data, seqtype = packed
+            if seqtype == "array":
+                arrays.append((name, data))
+            else:
+                fields.append((name, data))
+        group = self.get_parent_group().require_group(self.option[-1])
+        if fields:
+            self.__create_dataset(group, TABLE_NAME, pack_table(fields))
+        for name, data in arrays:
+            self.__create_dataset(group, name, data)
+        group.attrs[TABLE_NAME] = len(seq)
+        group.attrs[TABLE_NONE_NAME] = np.array(nones, dtype=h5py.string_dtype())
+        return True
+
 
 class NoDefault:
     """Class to represent the absence of a default value."""
@@ -607,16 +1122,178 @@ class NoDefault:
     pass
 
 
+class LazyArray(np.lib.mixins.NDArrayOperatorsMixin):
+    """
+    Proxy over an HDF5 dataset, which is loaded on first numeric access.
+
+    Shape, dtype, number of dimensions and size are available without loading
+    the data. Slicing reads only the requested part of the dataset (until the
+    array is loaded). Any other access (NumPy functions, arithmetic operators,
+    array methods like `min` or `max`, etc.) loads the whole array, which is then
+    kept in memory.
+
+    The proxy does not keep a handle on the HDF5 file: the file is opened (in
+    read mode) each time data is read, so the proxy remains valid after the
+    reader is closed, as long as the file exists and is not modified.
+
+    Args:
+        filename: The name of the HDF5 file.
+        name: The full path of the dataset in the HDF5 file.
+        shape: The shape of the dataset.
+        dtype: The data type of the dataset.
+    """
+
+    def __init__(
+        self, filename: str, name: str, shape: tuple[int, ...], dtype: np.dtype
+    ) -> None:
+        self.filename = filename
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+        self.__data: np.ndarray | None = None
+
+    @classmethod
+    def from_dataset(cls, dset: h5py.Dataset) -> LazyArray:
+        """
+        Create a proxy over an HDF5 dataset.
+
+        Args:
+            dset: The HDF5 dataset.
+
+        Returns:
+            The proxy.
+        """
+        return cls(dset.file.filename, dset.name, dset.shape, dset.dtype)
+
+    @property
+    def ndim(self) -> int:
+        """Number of array dimensions"""
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        """Number of elements in the array"""
+        return int(np.prod(self.shape))
+
+    @property
+    def loaded(self) -> bool:
+        """True if the array has been loaded into memory"""
+        return self.__data is not None
+
+    def load(self) -> np.ndarray:
+        """
+        Load the array into memory (if not already loaded).
+
+        Returns:
+            The array.
+        """
+        if self.__data is None:
+            with h5py.File(self.filename, "r") as h5:
+                self.__data = h5[self.name][...]
+        return self.__data
+
+    def __len__(self) -> int:
+        if not self.shape:
+            raise TypeError("len() of unsized object")
+        return self.shape[0]
+
+    def __getitem__(self, key: Any) -> Any:
+        if self.__data is None:
+            try:
+                with h5py.File(self.filename, "r") as h5:
+                    return h5[self.name][key]
+            except (TypeError, ValueError):
+                # Indexing not supported by h5py (e.g. unsorted index lists)
+                pass
+        return self.load()[key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.load()[key] = value
+
+    def __array__(self, dtype: np.dtype | None = None, copy: bool | None = None):
+        data = self.load()
+        if dtype is not None:
+            return data.astype(dtype, copy=False)
+        return data
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        inputs = tuple(
+            obj.load() if isinstance(obj, LazyArray) else obj for obj in inputs
+        )
+        if "out" in kwargs:
+            kwargs["out"] = tuple(
+                obj.load() if isinstance(obj, LazyArray) else obj
+                for obj in kwargs["out"]
+            )
+        return getattr(ufunc, method)(*inputs, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+    def __repr__(self) -> str:
+        if self.__data is not None:
+            return repr(self.__data)
+        return (
+            f"{self.__class__.__name__}({self.filename!r}, {self.name!r}, "
+            f"shape={self.shape}, dtype={self.dtype})"
+        )
+
+
+def lazy_array(dset: h5py.Dataset) -> np.memmap | LazyArray:
+    """
+    Return a lazily loaded array over an HDF5 dataset.
+
+    Contiguous, uncompressed datasets of numeric type are memory-mapped
+    (copy-on-write: modifying the array does not modify the file). Other datasets
+    are returned as :py:class:`LazyArray` proxies.
+
+    Args:
+        dset: The HDF5 dataset.
+
+    Returns:
+        The memory-mapped array or the proxy.
+    """
+    if (
+        dset.chunks is None
+        and dset.compression is None
+        and dset.external is None
+        and dset.dtype.kind in "biufc"
+        and dset.size > 0
+    ):
+        offset = dset.id.get_offset()
+        if offset is not None:
+            return np.memmap(
+                dset.file.filename,
+                mode="c",
+                dtype=dset.dtype,
+                shape=dset.shape,
+                offset=offset,
+            )
+    return LazyArray.from_dataset(dset)
+
+
 class HDF5Reader(HDF5Handler):
     """
     Reader for HDF5 files. Inherits from HDF5Handler.
 
     Args:
         filename: The name of the HDF5 file.
+        lazy_arrays: If True, :py:meth:`read_array` does not load arrays into
+         memory but returns memory-mapped arrays or :py:class:`LazyArray` proxies
+         (see :py:func:`lazy_array`). Defaults to False.
+
+    .. note::
+        Lazy arrays remain valid after the reader is closed, but they read the
+        file when accessed: the file must not be modified or removed while they
+        are in use. On Windows, memory-mapped arrays keep the file open until
+        they are deleted.
     """
 
-    def __init__(self, filename: str):
+    def __init__(self, filename: str, lazy_arrays: bool = False):
         super().__init__(filename)
+        self.lazy_arrays = lazy_arrays
         self.open("r")
 
     def read(
@@ -625,6 +1302,8 @@ class HDF5Reader(HDF5Handler):
         func: Callable[[], Any] | None = None,
         instance: Any | None = None,
         default: Any | NoDefault = NoDefault,
+        include: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
     ) -> Any:
         """
         Read a value from the current group or specified group_name.
@@ -637,6 +1316,10 @@ class HDF5Reader(HDF5Handler):
             default: The default value to return if the value is not found.
              Defaults to `NoDefault` (no default value: raises an exception if the
              value is not found).
+            include: Names of the items of `instance` to deserialize (see
+             :py:meth:`guidata.dataset.DataSet.deserialize`). Defaults to None.
+            exclude: Names of the items of `instance` not to deserialize.
+             Defaults to None.
 
         Returns:
             The read value.
@@ -655,7 +1338,9 @@ class HDF5Reader(HDF5Handler):
                     # the object was None when deserializing it
                     val = None
                 else:
-                    instance.deserialize(self)
+                    deserialize_object(instance, self, include, exclude)
+                    if include is None and exclude is None:
+                        self.__read_sync_token(instance)
                     val = instance
         except Exception:  # pylint:disable=broad-except
             if default is NoDefault:
@@ -665,6 +1350,20 @@ class HDF5Reader(HDF5Handler):
             self.end(group_name)
         return val
 
+    def __read_sync_token(self, obj: Any) -> None:
+        """
+        Set the synchronization token of an object which has just been read
+        entirely from the current group (see :py:func:`get_sync_token`).
+
+        Args:
+            obj: The object.
+        """
+        obj_group = self.get_parent_group().get(self.option[-1])
+        token = None
+        if isinstance(obj_group, h5py.Group):
+            token = obj_group.attrs.get(SYNC_NAME)
+        set_sync_token(obj, token)
+
     def read_any(
         self,
     ) -> (
@@ -688,6 +1387,9 @@ class HDF5Reader(HDF5Handler):
         try:
             value = group.attrs[attr_name]
         except KeyError:
+            dset = group.get(attr_name)
+            if is_packed_sequence(dset):
+                return unpack_sequence(dset)
             if self.read(SEQUENCE_NAME, func=self.read_int, default=None) is None:
                 # No sequence found, this means that the data we are trying to read
                 # is not here (e.g. compatibility issue), so we raise an error
@@ -749,10 +1451,14 @@ class HDF5Reader(HDF5Handler):
         Read a numpy array from the current group.
 
         Returns:
-            The read numpy array.
+            The read numpy array (a memory-mapped array or a :py:class:`LazyArray`
+            proxy if the reader was created with `lazy_arrays=True`).
         """
         group = self.get_parent_group()
-        return group[self.option[-1]][...]
+        dset = group[self.option[-1]]
+        if self.lazy_arrays and isinstance(dset, h5py.Dataset):
+            return lazy_array(dset)
+        return dset[...]
 
     def read_sequence(self) -> list[Any]:
         """
@@ -761,6 +1467,10 @@ class HDF5Reader(HDF5Handler):
         Returns:
             The read sequence.
         """
+        if self.option:
+            dset = self.get_parent_group().get(self.option[-1])
+            if is_packed_sequence(dset):
+                return unpack_sequence(dset)
         length = self.read(SEQUENCE_NAME, func=self.read_int)
         if length is None:
             return []
@@ -774,6 +1484,8 @@ class HDF5Reader(HDF5Handler):
                     group = self.get_parent_group()
                     if name in group.attrs:
                         obj = self.read_any()
+                    elif is_packed_sequence(group.get(name)):
+                        obj = unpack_sequence(group[name])
                     else:
                         try:
                             obj = self.read_array()
@@ -817,6 +1529,9 @@ class HDF5Reader(HDF5Handler):
                     continue
             dict_val[key] = value
         for key in dict_group:
+            if is_packed_sequence(dict_group[key]):
+                dict_val[key] = unpack_sequence(dict_group[key])
+                continue
             with self.group(key):
                 try:
                     dict_val[key] = self.read_array()
@@ -848,6 +1563,8 @@ class HDF5Reader(HDF5Handler):
         group_name: str,
         klass: type[Any],
         progress_callback: Callable[[int], bool] | None = None,
+        include: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
     ) -> list[Any]:
         """Read an object sequence from a group.
 
@@ -860,8 +1577,16 @@ class HDF5Reader(HDF5Handler):
             progress_callback: A function to call with an integer argument (progress:
              0 --> 100). The function returns the `cancel` state (True: progress
              dialog has been canceled, False otherwise).
+            include: Names of the items to deserialize (see
+             :py:meth:`guidata.dataset.DataSet.deserialize`). Defaults to None.
+            exclude: Names of the items not to deserialize. Defaults to None.
         """
         with self.group(group_name):
+            group = self.get_parent_group().get(group_name)
+            if isinstance(group, h5py.Group) and TABLE_NAME in group.attrs:
+                return self.read_object_table(
+                    klass, progress_callback, include, exclude
+                )
             try:
                 ids = self.read("IDs", func=self.read_list)
             except ValueError:
@@ -883,12 +1608,76 @@ class HDF5Reader(HDF5Handler):
                             obj = None
                         else:
                             obj = klass()
-                            obj.deserialize(self)
+                            deserialize_object(obj, self, include, exclude)
+                            if include is None and exclude is None:
+                                self.__read_sync_token(obj)
                     except ValueError:
                         break
                 seq.append(obj)
         return seq
 
+    def read_object_table(
+        self,
+        klass: type[Any],
+        progress_callback: Callable[[int], bool] | None = None,
+        include: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+    ) -> list[Any]:
+        """Read a list of DataSet instances written by
+        :py:meth:`HDF5Writer.write_object_table` in the current group.
+
+        Item values are set directly on the new instances, without validation.
+        Items which are not stored in the table (e.g. items added in a newer
+        version of the DataSet class) keep their default value.
+
+        Args:
+            klass: The DataSet class which constructor requires no argument.
+            progress_callback: A function to call with an integer argument (progress:
+             0 --> 100). The function returns the `cancel` state (True: progress
+             dialog has been canceled, False otherwise).
+            include: Names of the items to read (if None, all items are read).
+             Defaults to None.
+            exclude: Names of the items not to read. Defaults to None.
+
+        Returns:
+            The list of objects.
+        """
+        group = self.get_parent_group()[self.option[-1]]
+        count = int(group.attrs[TABLE_NAME])
+        item_names = {
+            item.get_name()
+            for item in klass._items
+            if item.get_prop("data", "computed", None) is None
+        }
+        if include is not None:
+            item_names.intersection_update(include)
+        if exclude is not None:
+            item_names.difference_update(exclude)
+        columns = {}
+        for name in group.attrs.get(TABLE_NONE_NAME, []):
+            columns[name] = [None] * count
+        for name, dset in group.items():
+            if name != TABLE_NAME and name in item_names:
+                columns[name] = list(dset[...])
+        if TABLE_NAME in group:
+            for name, values in unpack_table(group[TABLE_NAME][...]).items():
+                columns[name] = values.tolist()
+        columns = [
+            (f"_{name}", values)
+            for name, values in columns.items()
+            if name in item_names
+        ]
+        seq = []
+        for idx in range(count):
+            if progress_callback is not None:
+                if progress_callback(int(100 * float(idx) / count)):
+                    break
+            obj = klass()
+            for attr_name, values in columns:
+                setattr(obj, attr_name, values[idx])
+            seq.append(obj)
+        return seq
+
     read_none = read_any
 
     read_none = read_any
@@ -91,8 +91,31 @@ class INIWriter(INIHandler, WriterMixin):
 
     This class extends INIHandler and WriterMixin to provide methods for
     writing different types of values into the user configuration.
+
+    Args:
+        conf (Any): The configuration object.
+        section (str): The section of the configuration.
+        option (str): The option within the section of the configuration.
+        deferred_save (bool): If True, values are only written in memory and the
+         configuration file is saved once when calling :py:meth:`save`.
+         Defaults to False (the configuration file is saved after each value).
     """
 
+    def __init__(
+        self, conf: Any, section: str, option: str, deferred_save: bool = False
+    ) -> None:
+        super().__init__(conf, section, option)
+        self.deferred_save = deferred_save
+
+    def save(self) -> None:
+        """
+        Save the configuration file.
+
+        This is only needed in deferred save mode, where values written by the
+        `write_*` methods are not saved until this method is called.
+        """
+        self.conf.save()
+
     def write_any(self, val: Any) -> None:
         """
         Write any value into the configuration.
@@ -105,7 +128,10 @@ class INIWriter(INIHandler, WriterMixin):
             val (Any): The value to be written.
         """
         option = "/".join(self.option)
-        self.conf.set(self.section, option, val)
+        if self.deferred_save:
+            self.conf.set(self.section, option, val, save=False)
+        else:
+            self.conf.set(self.section, option, val)
 
     # Make write_bool, write_int, write_float, write_array, write_sequence,
     # alias to write_any
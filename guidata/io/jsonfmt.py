@@ -8,33 +8,331 @@
 
 """
 JSON files (.json)
+
+NumPy arrays are written as ``["array", data, dtype]`` triplets, where `data` is
+the (nested) list of array values. Optionally, arrays may be written in a tagged
+form, ``{"__array__": data, "dtype": dtype}``, or in a compact binary form: a
+dictionary holding the base64-encoded (and optionally compressed) raw array buffer,
+the dtype (including byte order) and the shape of the array (see
+:py:func:`encode_binary_array`).
+
+Tagged and binary arrays are always accepted by the reader. Triplets are legacy
+arrays: as any list of the document may be a triplet, the reader has to check
+every list of three items, which may be disabled for documents without triplets
+(see :py:class:`JSONReader`).
+
+Large documents may be written in streaming mode (each value is written to the file
+as soon as it is serialized, see :py:class:`JSONWriter`), and object lists may be
+read one object at a time without loading the whole document (see
+:py:meth:`JSONReader.iter_object_list`).
+
+JSON files may be compressed ("gzip", "bz2" or "xz" codecs, see `FILE_CODECS`):
+the codec is chosen from the file extension when writing (e.g. ``.json.gz``), and
+detected from the first bytes of the file when reading. Files are compressed and
+decompressed on the fly, without holding the compressed data in memory.
+
+Documents are encoded and decoded by a JSON backend (see :py:class:`JSONBackend`):
+the standard library by default, or `orjson` (faster, with native NumPy support)
+if selected. All backends write the same documents, byte for byte.
 """
 
 # pylint: disable=invalid-name  # Allows short reference names like x, y, ...
 
 from __future__ import annotations
 
+import abc
+import base64
+import bz2
+import gzip
+import io
 import json
+import lzma
 import os
-from collections.abc import Callable, Sequence
-from typing import Any
+import re
+import zlib
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import IO, Any
 from uuid import uuid1
 
 import numpy as np
 
-from guidata.io.base import BaseIOHandler, WriterMixin
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from guidata.io.base import BaseIOHandler, WriterMixin, deserialize_object
+
+BINARY_ARRAY_KEY = "__ndarray__"
+ARRAY_TAG_KEY = "__array__"
+
+#: Compression codecs for binary arrays: name -> (compress, decompress)
+ARRAY_CODECS: dict[str, tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    "zlib": (zlib.compress, zlib.decompress),
+    "bz2": (bz2.compress, bz2.decompress),
+    "lzma": (lzma.compress, lzma.decompress),
+}
+
+
+#: Compression codecs for JSON files: name -> (open function, extensions, magic)
+FILE_CODECS: dict[str, tuple[Callable[..., IO], tuple[str, ...], bytes]] = {
+    "gzip": (gzip.open, (".gz",), b"\x1f\x8b"),
+    "bz2": (bz2.open, (".bz2",), b"BZh"),
+    "xz": (lzma.open, (".xz",), b"\xfd7zXZ\x00"),
+}
+
+#: Size of the chunks of text written to JSON files (characters)
+WRITE_CHUNK_SIZE = 1 << 20
+
+
+def get_file_codec(filename: str) -> str | None:
+    """Return the compression codec of a JSON file from its extension
+
+    Args:
+        filename: file name
+
+    Returns:
+        Codec name (key of `FILE_CODECS`), or None (no compression)
+    """
+    lower = filename.lower()
+    for name, (_open, extensions, _magic) in FILE_CODECS.items():
+        if lower.endswith(extensions):
+            return name
+    return None
+
+
+def detect_file_codec(filename: str) -> str | None:
+    """Return the compression codec of an existing JSON file from its first bytes
+
+    Args:
+        filename: file name
+
+    Returns:
+        Codec name (key of `FILE_CODECS`), or None (no compression)
+    """
+    with open(filename, mode="rb") as fdesc:
+        header = fdesc.read(max(len(magic) for _o, _e, magic in FILE_CODECS.values()))
+    for name, (_open, _extensions, magic) in FILE_CODECS.items():
+        if header.startswith(magic):
+            return name
+    return None
+
+
+def open_json_file(filename: str, mode: str, codec: str | None = None) -> IO[str]:
+    """Open a JSON file in text mode, compressing or decompressing it on the fly
+
+    Args:
+        filename: file name
+        mode: "r" (read) or "w" (write)
+        codec: compression codec name (key of `FILE_CODECS`), or None (no
+         compression)
+
+    Returns:
+        Text stream (UTF-8, without newline translation)
+    """
+    if codec is None:
+        return open(filename, mode=mode, encoding="utf-8", newline="")
+    if codec not in FILE_CODECS:
+        raise ValueError(f"Unknown file compression codec: {codec!r}")
+    return FILE_CODECS[codec][0](filename, mode + "t", encoding="utf-8", newline="")
+
+
+def write_text(fdesc: IO[str], text: str) -> None:
+    """Write text to a stream by chunks (so that the encoded text and the compressed
+    data are never held in memory as a whole)
+
+    Args:
+        fdesc: text stream
+        text: text
+    """
+    for start in range(0, len(text), WRITE_CHUNK_SIZE):
+        fdesc.write(text[start : start + WRITE_CHUNK_SIZE])
+
+
+def is_binary_encodable(arr: np.ndarray) -> bool:
+    """Return True if array may be written in the binary form
+
+    Object arrays, structured arrays and masked arrays are not supported by the
+    binary form.
+
+    Args:
+        arr: NumPy array
+
+    Returns:
+        True if array may be written with :py:func:`encode_binary_array`
+    """
+    return arr.dtype.kind not in "OV" and not isinstance(arr, np.ma.MaskedArray)
+
+
+def encode_binary_array(arr: np.ndarray, compression: str | None = None) -> dict:
+    """Encode a NumPy array in a JSON-serializable binary form
+
+    Args:
+        arr: NumPy array
+        compression: compression codec name (one of the keys of `ARRAY_CODECS`),
+         or None (no compression)
+
+    Returns:
+        Dictionary with the base64-encoded raw array buffer (C order), the dtype
+        string (which includes byte order, e.g. ``"<f8"``), the shape and the
+        compression codec name (or None)
+    """
+    data = np.ascontiguousarray(arr).reshape(-1).view(np.uint8)
+    if compression is not None:
+        data = ARRAY_CODECS[compression][0](data)
+    return {
+        BINARY_ARRAY_KEY: base64.b64encode(data).decode("ascii"),
+        "dtype": arr.dtype.str,
+        "shape": list(arr.shape),
+        "compression": compression,
+    }
+
+
+def decode_binary_array(obj: dict) -> np.ndarray:
+    """Decode a NumPy array encoded with :py:func:`encode_binary_array`
+
+    Args:
+        obj: dictionary returned by :py:func:`encode_binary_array`
+
+    Returns:
+        NumPy array (writeable)
+    """
+    data = base64.b64decode(obj[BINARY_ARRAY_KEY])
+    compression = obj.get("compression")
+    if compression is not None:
+        data = ARRAY_CODECS[compression][1](data)
+    arr = np.frombuffer(bytearray(data), dtype=np.dtype(obj["dtype"]))
+    return arr.reshape(obj["shape"])
+
+
+def encode_array_data(arr: np.ndarray) -> Any:
+    """Return the values of a NumPy array as (nested) lists
+
+    Complex arrays are written as the concatenation of the real and imaginary parts.
+
+    Args:
+        arr: NumPy array
+
+    Returns:
+        Nested lists of values
+    """
+    if arr.dtype in (np.complex64, np.complex128):
+        return arr.real.tolist() + arr.imag.tolist()
+    return arr.tolist()
+
+
+def decode_array_data(data: Any, dtype: np.dtype) -> np.ndarray:
+    """Create a NumPy array from values returned by :py:func:`encode_array_data`
+
+    Args:
+        data: nested lists of values
+        dtype: array dtype
+
+    Returns:
+        NumPy array
+    """
+    if dtype in (np.complex64, np.complex128):
+        half = len(data) // 2
+        return np.asarray(data[:half], dtype) + 1j * np.asarray(data[half:], dtype)
+    return np.asarray(data, dtype)
+
+
+def decode_tagged_array(obj: dict) -> np.ndarray:
+    """Decode a NumPy array written in the tagged form
+
+    Args:
+        obj: dictionary ``{"__array__": data, "dtype": dtype}``
+
+    Returns:
+        NumPy array
+    """
+    return decode_array_data(obj[ARRAY_TAG_KEY], np.dtype(obj["dtype"]))
+
+
+def decode_legacy_array(obj: list) -> np.ndarray | None:
+    """Decode a NumPy array written as a ``["array", data, dtype]`` triplet
+
+    Args:
+        obj: list
+
+    Returns:
+        NumPy array, or None if the list is not a valid triplet
+    """
+    if len(obj) == 3 and obj[0] == "array" and isinstance(obj[2], str):
+        try:
+            return decode_array_data(obj[1], np.dtype(obj[2]))
+        except (TypeError, ValueError):
+            pass
+    return None
+
+
+def decode_arrays(obj: Any, legacy_arrays: bool = True) -> Any:
+    """Decode the NumPy arrays of a JSON document parsed without
+    :py:class:`CustomJSONDecoder` (each node of the document is visited once)
+
+    Args:
+        obj: parsed JSON document (dictionaries and lists are modified in place)
+        legacy_arrays: if True, decode ``["array", data, dtype]`` triplets
+
+    Returns:
+        Document with NumPy arrays
+    """
+    if isinstance(obj, dict):
+        if BINARY_ARRAY_KEY in obj:
+            return decode_binary_array(obj)
+        if ARRAY_TAG_KEY in obj:
+            return decode_tagged_array(obj)
+        for key, value in obj.items():
+            if isinstance(value, (dict, list)):
+                obj[key] = decode_arrays(value, legacy_arrays)
+    elif isinstance(obj, list):
+        if legacy_arrays:
+            arr = decode_legacy_array(obj)
+            if arr is not None:
+                return arr
+        for index, item in enumerate(obj):
+            if isinstance(item, (dict, list)):
+                obj[index] = decode_arrays(item, legacy_arrays)
+    return obj
 
 
 class CustomJSONEncoder(json.JSONEncoder):
-    """Custom JSON Encoder"""
+    """Custom JSON Encoder
+
+    Args:
+        binary_arrays: if True, write NumPy arrays in binary form
+         (see :py:func:`encode_binary_array`) instead of nested lists.
+         Defaults to False.
+        compression: compression codec name for binary arrays (see `ARRAY_CODECS`).
+         Defaults to None (no compression).
+        tagged_arrays: if True, write NumPy arrays (which are not written in binary
+         form) in the tagged form instead of ``["array", data, dtype]`` triplets.
+         Defaults to False.
+    """
+
+    def __init__(
+        self,
+        *args,
+        binary_arrays: bool = False,
+        compression: str | None = None,
+        tagged_arrays: bool = False,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        if compression is not None and compression not in ARRAY_CODECS:
+            raise ValueError(f"Unknown array compression codec: {compression!r}")
+        self.binary_arrays = binary_arrays
+        self.compression = compression
+        self.tagged_arrays = tagged_arrays
 
     def default(self, o: Any) -> Any:
         """Override JSONEncoder method"""
         if isinstance(o, np.ndarray):
-            olist = o.tolist()
-            if o.dtype in (np.complex64, np.complex128):
-                olist = o.real.tolist() + o.imag.tolist()
-            return ["array", olist, str(o.dtype)]
+            if self.binary_arrays and is_binary_encodable(o):
+                return encode_binary_array(o, self.compression)
+            if self.tagged_arrays:
+                return {ARRAY_TAG_KEY: encode_array_data(o), "dtype": str(o.dtype)}
+            return ["array", encode_array_data(o), str(o.dtype)]
         if isinstance(o, np.generic):
             if isinstance(o, np.integer):
                 return int(o)
@@ -48,51 +346,395 @@ class CustomJSONEncoder(json.JSONEncoder):
 
 
 class CustomJSONDecoder(json.JSONDecoder):
-    """Custom JSON Decoder"""
+    """Custom JSON Decoder
 
-    def __init__(self, *args, **kwargs) -> None:
+    Args:
+        legacy_arrays: if True, decode ``["array", data, dtype]`` triplets (see
+         module documentation). Defaults to True.
+    """
+
+    def __init__(self, *args, legacy_arrays: bool = True, **kwargs) -> None:
         json.JSONDecoder.__init__(self, object_hook=self.object_hook, *args, **kwargs)
+        self.legacy_arrays = legacy_arrays
 
-    def __iterate_dict(self, obj: Any) -> Any:
-        """Iterate dictionaries"""
-        if isinstance(obj, list):
-            if len(obj) == 3:
-                family, data, dtypestr = obj
-                try:
-                    dtype = np.dtype(dtypestr)
-                    if family == "array":
-                        if dtype in (np.complex64, np.complex128):
-                            return np.asarray(
-                                data[: len(data) // 2], dtype
-                            ) + 1j * np.asarray(data[len(data) // 2 :], dtype)
-                        return np.asarray(data, dtype)
-                except (TypeError, ValueError):
-                    pass
-            return [self.__iterate_dict(item) for item in obj]
-        elif isinstance(obj, dict):
-            for key, value in list(obj.items()):
-                obj[key] = self.__iterate_dict(value)
+    def __decode_lists(self, obj: list) -> list | np.ndarray:
+        """Decode the legacy arrays of a list and of its nested lists (nested
+        dictionaries have already been decoded by the object hook)"""
+        arr = decode_legacy_array(obj)
+        if arr is not None:
+            return arr
+        for index, item in enumerate(obj):
+            if isinstance(item, list):
+                obj[index] = self.__decode_lists(item)
         return obj
 
-    def object_hook(self, obj: dict) -> dict:  # pylint: disable=E0202
+    def object_hook(self, obj: dict) -> dict | np.ndarray:  # pylint: disable=E0202
         """Object hook"""
-        for key, value in list(obj.items()):
-            obj[key] = self.__iterate_dict(value)
+        if BINARY_ARRAY_KEY in obj:
+            return decode_binary_array(obj)
+        if ARRAY_TAG_KEY in obj:
+            return decode_tagged_array(obj)
+        if self.legacy_arrays:
+            for key, value in obj.items():
+                if isinstance(value, list):
+                    obj[key] = self.__decode_lists(value)
         return obj
 
 
+class JSONBackend(abc.ABC):
+    """Base class for JSON backends
+
+    A JSON backend encodes and decodes JSON documents, with NumPy arrays written as
+    described in the module documentation: all backends write the same documents,
+    byte for byte.
+    """
+
+    #: Backend name (key of `JSON_BACKENDS`)
+    name = ""
+
+    #: Indentation of the JSON files written by the backend
+    indent = 4
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Return True if the backend may be used (its dependencies are installed)"""
+        return True
+
+    @abc.abstractmethod
+    def dumps(
+        self,
+        obj: Any,
+        indent: int | None = None,
+        binary_arrays: bool = False,
+        compression: str | None = None,
+        tagged_arrays: bool = False,
+    ) -> str:
+        """Encode an object to JSON
+
+        Args:
+            obj: object to encode
+            indent: Indentation level (None: compact form)
+            binary_arrays: if True, write NumPy arrays in binary form
+            compression: compression codec name for binary arrays
+            tagged_arrays: if True, write NumPy arrays in the tagged form
+
+        Returns:
+            JSON string
+
+        Raises:
+            TypeError: object contains values which are not JSON serializable
+        """
+
+    @abc.abstractmethod
+    def loads(self, text: str, legacy_arrays: bool = True) -> Any:
+        """Decode a JSON document
+
+        Args:
+            text: JSON string
+            legacy_arrays: if True, decode ``["array", data, dtype]`` triplets
+
+        Returns:
+            Decoded object (with NumPy arrays)
+        """
+
+    @abc.abstractmethod
+    def load(self, fdesc: IO[str], legacy_arrays: bool = True) -> Any:
+        """Decode a JSON document from a text stream
+
+        Args:
+            fdesc: text stream (e.g. decompressing file object, see
+             :py:func:`open_json_file`)
+            legacy_arrays: if True, decode ``["array", data, dtype]`` triplets
+
+        Returns:
+            Decoded object (with NumPy arrays)
+        """
+
+
+class StdlibJSONBackend(JSONBackend):
+    """JSON backend based on the `json` module of the standard library"""
+
+    name = "json"
+
+    def dumps(
+        self,
+        obj: Any,
+        indent: int | None = None,
+        binary_arrays: bool = False,
+        compression: str | None = None,
+        tagged_arrays: bool = False,
+    ) -> str:
+        """Encode an object to JSON (see :py:meth:`JSONBackend.dumps`)"""
+        return json.dumps(
+            obj,
+            indent=indent,
+            cls=CustomJSONEncoder,
+            binary_arrays=binary_arrays,
+            compression=compression,
+            tagged_arrays=tagged_arrays,
+        )
+
+    def loads(self, text: str, legacy_arrays: bool = True) -> Any:
+        """Decode a JSON document (see :py:meth:`JSONBackend.loads`)"""
+        return json.loads(text, cls=CustomJSONDecoder, legacy_arrays=legacy_arrays)
+
+    def load(self, fdesc: IO[str], legacy_arrays: bool = True) -> Any:
+        """Decode a JSON document from a text stream (see
+        :py:meth:`JSONBackend.load`)"""
+        return json.load(fdesc, cls=CustomJSONDecoder, legacy_arrays=legacy_arrays)
+
+
+#: Array dtype kinds serialized natively by `orjson`
+ORJSON_ARRAY_KINDS = "biuf"
+
+# Numbers formatted differently by `orjson` and by the standard library: exponents
+# (e.g. "1e-8" instead of "1e-08", "1e16" instead of "1e+16"), and numbers in
+# [1e-5, 1e-4[ (e.g. "0.00002" instead of "2e-05")
+_ORJSON_EXPONENT = re.compile(r"e(-?)(\d+)")
+_ORJSON_SMALL_FLOAT = re.compile(r"0\.0000([1-9])(\d*)")
+
+
+def _format_exponent(match: re.Match) -> str:
+    """Format the exponent of a number formatted by `orjson` like `repr`"""
+    return "e" + (match.group(1) or "+") + match.group(2).zfill(2)
+
+
+def _format_small_float(match: re.Match) -> str:
+    """Format a number in [1e-5, 1e-4[ formatted by `orjson` like `repr`"""
+    start = match.start()
+    if start and match.string[start - 1].isdigit():
+        # Not the beginning of a number (e.g. "10.00001")
+        return match.group(0)
+    decimals = match.group(2)
+    return match.group(1) + ("." + decimals if decimals else "") + "e-05"
+
+
+class OrjsonJSONBackend(JSONBackend):
+    """JSON backend based on `orjson` (fast JSON library with native NumPy support)
+
+    Documents are parsed by `orjson`, the NumPy arrays being restored afterwards.
+    Documents which are not supported by `orjson` (non-finite floats, integers
+    larger than 64 bits...) are parsed by the standard library.
+
+    When encoding, the data of numeric arrays is formatted by `orjson` directly
+    from the array buffer, and normalized so as to be identical to the output of
+    the standard library. The rest of the document is encoded by the standard
+    library, which raises the same errors as :py:class:`StdlibJSONBackend` for
+    values which are not JSON serializable.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        self.fallback = StdlibJSONBackend()
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Return True if `orjson` is installed"""
+        return orjson is not None
+
+    def __prepare(
+        self,
+        obj: Any,
+        depth: int,
+        arrays: list[tuple[np.ndarray, int]],
+        placeholder: str,
+        binary_arrays: bool,
+        tagged_arrays: bool,
+    ) -> Any:
+        """Replace the data of the numeric arrays of an object by placeholders,
+        the arrays being otherwise converted as by :py:class:`CustomJSONEncoder`
+
+        Args:
+            obj: object to convert
+            depth: nesting level of the object in the document
+            arrays: list to which (array data, nesting level) tuples are appended
+            placeholder: prefix of the placeholders (followed by the array index)
+            binary_arrays: if True, NumPy arrays are written in binary form
+            tagged_arrays: if True, write NumPy arrays in the tagged form
+
+        Returns:
+            Converted object
+        """
+        options = arrays, placeholder, binary_arrays, tagged_arrays
+        if isinstance(obj, dict):
+            return {
+                key: self.__prepare(value, depth + 1, *options)
+                for key, value in obj.items()
+            }
+        if isinstance(obj, (list, tuple)):
+            return [self.__prepare(item, depth + 1, *options) for item in obj]
+        if (
+            not isinstance(obj, np.ndarray)
+            or isinstance(obj, np.ma.MaskedArray)
+            or obj.ndim == 0
+            or obj.size == 0
+            or (binary_arrays and is_binary_encodable(obj))
+        ):
+            return obj
+        if obj.dtype in (np.complex64, np.complex128):
+            data = np.concatenate((obj.real, obj.imag))
+        else:
+            data = obj
+        if data.dtype.kind not in ORJSON_ARRAY_KINDS or not data.dtype.isnative:
+            return obj
+        if data.dtype.kind == "f":
+            if not np.isfinite(data).all():
+                return obj
+            # Values are formatted as Python floats (like `tolist` does)
+            data = data.astype(np.float64, copy=False)
+        arrays.append((np.ascontiguousarray(data), depth + 1))
+        data = f"{placeholder}{len(arrays) - 1}"
+        if tagged_arrays:
+            return {ARRAY_TAG_KEY: data, "dtype": str(obj.dtype)}
+        return ["array", data, str(obj.dtype)]
+
+    @staticmethod
+    def format_array_data(data: np.ndarray, depth: int, indent: int | None) -> str:
+        """Format the values of a numeric array like the standard library does
+
+        Args:
+            data: C-contiguous array
+            depth: nesting level of the array in the document
+            indent: indentation level (None: compact form)
+
+        Returns:
+            JSON text
+        """
+        inner = outer = ""
+        if indent is not None:
+            inner = "\n" + " " * indent * (depth + 1)
+            outer = "\n" + " " * indent * depth
+            if data.ndim > 1:
+                rows = [
+                    OrjsonJSONBackend.format_array_data(row, depth + 1, indent)
+                    for row in data
+                ]
+                return "[" + inner + ("," + inner).join(rows) + outer + "]"
+        text = orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+        if data.dtype.kind == "f":
+            if "e" in text:
+                text = _ORJSON_EXPONENT.sub(_format_exponent, text)
+            if ".0000" in text:
+                text = _ORJSON_SMALL_FLOAT.sub(_format_small_float, text)
+        if indent is None:
+            return text.replace(",", ", ")
+        return "[" + inner + text[1:-1].replace(",", "," + inner) + outer + "]"
+
+    def dumps(
+        self,
+        obj: Any,
+        indent: int | None = None,
+        binary_arrays: bool = False,
+        compression: str | None = None,
+        tagged_arrays: bool = False,
+    ) -> str:
+        """Encode an object to JSON (see :py:meth:`JSONBackend.dumps`)"""
+        arrays: list[tuple[np.ndarray, int]] = []
+        placeholder = f"\x00{uuid1().hex}:"
+        prepared = self.__prepare(
+            obj, 0, arrays, placeholder, binary_arrays, tagged_arrays
+        )
+        text = self.fallback.dumps(
+            prepared, indent, binary_arrays, compression, tagged_arrays
+        )
+        if not arrays:
+            return text
+        pattern = re.escape(json.dumps(placeholder)[:-1]) + r'(\d+)"'
+        return re.sub(
+            pattern,
+            lambda match: self.format_array_data(*arrays[int(match.group(1))], indent),
+            text,
+        )
+
+    def loads(self, text: str, legacy_arrays: bool = True) -> Any:
+        """Decode a JSON document (see :py:meth:`JSONBackend.loads`)"""
+        try:
+            obj = orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # e.g. non-finite floats (NaN, Infinity), which are not valid JSON
+            return self.fallback.loads(text, legacy_arrays)
+        return decode_arrays(obj, legacy_arrays)
+
+    def load(self, fdesc: IO[str], legacy_arrays: bool = True) -> Any:
+        """Decode a JSON document from a text stream (see
+        :py:meth:`JSONBackend.load`)"""
+        # `orjson` parses a whole document at once
+        return self.loads(fdesc.read(), legacy_arrays)
+
+
+#: Available JSON backends
+JSON_BACKENDS: dict[str, type[JSONBackend]] = {
+    StdlibJSONBackend.name: StdlibJSONBackend,
+    OrjsonJSONBackend.name: OrjsonJSONBackend,
+}
+
+_DEFAULT_BACKEND: list[str] = [StdlibJSONBackend.name]
+
+
+def get_json_backend(name: str | None = None) -> JSONBackend:
+    """Return a JSON backend
+
+    Args:
+        name: backend name (key of `JSON_BACKENDS`). If None, return the default
+         backend (see :py:func:`set_default_json_backend`).
+
+    Returns:
+        JSON backend instance
+
+    Raises:
+        ValueError: unknown or unavailable backend
+    """
+    if name is None:
+        name = _DEFAULT_BACKEND[0]
+    klass = JSON_BACKENDS.get(name)
+    if klass is None:
+        raise ValueError(f"Unknown JSON backend: {name!r}")
+    if not klass.is_available():
+        raise ValueError(f"JSON backend {name!r} is not available")
+    return klass()
+
+
+def set_default_json_backend(name: str | None) -> None:
+    """Set the default JSON backend
+
+    The default backend is the standard library one ("json"): the "orjson"
+    backend, which is faster for documents with large numeric arrays, has to be
+    selected explicitly (it requires the optional `orjson` package).
+
+    Args:
+        name: backend name (key of `JSON_BACKENDS`), or None to restore the
+         standard library backend
+
+    Raises:
+        ValueError: unknown or unavailable backend
+    """
+    if name is None:
+        name = StdlibJSONBackend.name
+    get_json_backend(name)
+    _DEFAULT_BACKEND[0] = name
+
+
 class JSONHandler(BaseIOHandler):
     """Class handling JSON r/w
 
     Args:
         filename: JSON filename (if None, use `jsontext` attribute)
+        backend: JSON backend name (see :py:func:`get_json_backend`). Defaults to
+         None (default backend).
     """
 
-    def __init__(self, filename: str | None = None) -> None:
+    def __init__(self, filename: str | None = None, backend: str | None = None) -> None:
         super().__init__()
+        self.backend = get_json_backend(backend)
         self.jsondata = {}
         self.jsontext: str | None = None
         self.filename = filename
+        self.binary_arrays = False
+        self.compression: str | None = None
+        self.tagged_arrays = False
+        self.legacy_arrays = True
+        self.file_compression: str | None = None
 
     def get_parent_group(self) -> dict:
         """Get parent group"""
@@ -123,15 +765,31 @@ class JSONHandler(BaseIOHandler):
             JSON string
         """
         if self.jsondata is not None:
-            return json.dumps(self.jsondata, indent=indent, cls=CustomJSONEncoder)
+            return self.dumps(self.jsondata, indent=indent)
         return None
 
+    def dumps(self, obj: Any, indent: int | None = None) -> str:
+        """Encode an object to JSON, with the array options of the handler
+
+        Args:
+            obj: object to encode
+            indent: Indentation level
+
+        Returns:
+            JSON string
+        """
+        return self.backend.dumps(
+            obj, indent, self.binary_arrays, self.compression, self.tagged_arrays
+        )
+
     def load(self) -> None:
-        """Load JSON file"""
-        if self.filename is not None:
-            with open(self.filename, mode="rb") as fdesc:
-                self.jsontext = fdesc.read().decode()
-        self.jsondata = json.loads(self.jsontext, cls=CustomJSONDecoder)
+        """Load JSON file (or JSON text, if no file name has been set)"""
+        if self.filename is None:
+            self.jsondata = self.backend.loads(self.jsontext, self.legacy_arrays)
+            return
+        codec = detect_file_codec(self.filename)
+        with open_json_file(self.filename, "r", codec) as fdesc:
+            self.jsondata = self.backend.load(fdesc, self.legacy_arrays)
 
     def save(self, path: str | None = None) -> None:
         """Save JSON file
@@ -143,21 +801,176 @@ class JSONHandler(BaseIOHandler):
             filepath = self.filename
             if path:
                 filepath = os.path.join(path, filepath)
-            with open(filepath, mode="wb") as fdesc:
-                fdesc.write(self.get_json(indent=4).encode())
+            text = self.get_json(indent=self.backend.indent)
+            with open_json_file(filepath, "w", self.file_compression) as fdesc:
+                write_text(fdesc, text)
 
     def close(self) -> None:
         """Expected close method: do nothing for JSON I/O handler classes"""
 
 
 class JSONWriter(JSONHandler, WriterMixin):
-    """Class handling JSON serialization"""
+    """Class handling JSON serialization
+
+    In streaming mode, each value is written to the file as soon as it is
+    serialized, instead of being kept in memory until the file is saved (e.g. for
+    object lists with many objects, see :py:meth:`write_object_list`). The file
+    content is the same as in normal mode, provided that the values of each group
+    are written together (as done by `DataSet.serialize`): a group which has been
+    left, or a value, cannot be written again. The file is completed by
+    :py:meth:`save` (or :py:meth:`close`).
+
+    Args:
+        filename: JSON filename (if None, use `get_json` to get JSON text)
+        binary_arrays: if True, write NumPy arrays in a compact binary form (base64
+         of the raw array buffer) instead of nested lists. Defaults to False.
+        compression: compression codec for binary arrays ("zlib", "bz2", "lzma"
+         or None). Defaults to None (no compression).
+        streaming: if True, write values to the file as soon as they are
+         serialized (`filename` is then required). Defaults to False.
+        backend: JSON backend name (see :py:func:`get_json_backend`). Defaults to
+         None (default backend).
+        tagged_arrays: if True, write NumPy arrays (which are not written in binary
+         form) in the tagged form ``{"__array__": data, "dtype": dtype}`` instead
+         of ``["array", data, dtype]`` triplets, so that the file may be read
+         without legacy array detection (see :py:class:`JSONReader`). Such files
+         are not supported by guidata versions older than 3.15. Defaults to False.
+        file_compression: compression codec of the file ("gzip", "bz2", "xz", see
+         `FILE_CODECS`). Defaults to None: the codec is chosen from the extension
+         of `filename` (".gz", ".bz2", ".xz"), other files are not compressed.
+    """
+
+    def __init__(
+        self,
+        filename: str | None = None,
+        binary_arrays: bool = False,
+        compression: str | None = None,
+        streaming: bool = False,
+        backend: str | None = None,
+        tagged_arrays: bool = False,
+        file_compression: str | None = None,
+    ) -> None:
+        super().__init__(filename, backend)
+        if compression is not None and compression not in ARRAY_CODECS:
+            raise ValueError(f"Unknown array compression codec: {compression!r}")
+        if streaming and filename is None:
+            raise ValueError("A filename is required in streaming mode")
+        if file_compression is None and filename is not None:
+            file_compression = get_file_codec(filename)
+        elif file_compression is not None and file_compression not in FILE_CODECS:
+            raise ValueError(f"Unknown file compression codec: {file_compression!r}")
+        self.file_compression = file_compression
+        self.binary_arrays = binary_arrays
+        self.compression = compression
+        self.tagged_arrays = tagged_arrays
+        self.streaming = streaming
+        self.__stream: IO[str] | None = None
+        # Names of the groups open in the file, and keys already written in the
+        # root object and in each open group
+        self.__stream_groups: list[str] = []
+        self.__stream_keys: list[set[str]] = []
 
     def write_any(self, val) -> None:
         """Write any value type"""
+        if self.streaming:
+            self.__stream_value(val)
+            return
         group = self.get_parent_group()
         group[self.option[-1]] = val
 
+    def __stream_key(self, key: str) -> None:
+        """Write a key of the innermost open group to the file (streaming mode)
+
+        Args:
+            key: key
+        """
+        keys = self.__stream_keys[-1]
+        if key in keys:
+            path = "/".join(self.__stream_groups + [key])
+            raise ValueError(
+                f"'{path}' has already been written: in streaming mode, the values "
+                "of a group must be written together, and only once"
+            )
+        separator = "," if keys else ""
+        indent = " " * self.backend.indent * len(self.__stream_keys)
+        self.__stream.write(f"{separator}\n{indent}{json.dumps(key)}: ")
+        keys.add(key)
+
+    def __stream_close_group(self) -> None:
+        """Close the innermost open group of the file (streaming mode)"""
+        self.__stream_groups.pop()
+        self.__stream_keys.pop()
+        indent = " " * self.backend.indent * len(self.__stream_keys)
+        self.__stream.write("\n" + indent + "}")
+
+    def __stream_value(self, val: Any) -> None:
+        """Write a value to the file (streaming mode)
+
+        Args:
+            val: value
+        """
+        if self.__stream is None:
+            self.__stream = open_json_file(self.filename, "w", self.file_compression)
+            self.__stream.write("{")
+            self.__stream_keys = [set()]
+        path = self.option[:-1]
+        groups = self.__stream_groups
+        depth = 0
+        while depth < min(len(groups), len(path)) and groups[depth] == path[depth]:
+            depth += 1
+        while len(groups) > depth:
+            self.__stream_close_group()
+        for name in path[depth:]:
+            self.__stream_key(name)
+            self.__stream.write("{")
+            groups.append(name)
+            self.__stream_keys.append(set())
+        self.__stream_key(self.option[-1])
+        indent = " " * self.backend.indent * len(self.__stream_keys)
+        text = self.dumps(val, indent=self.backend.indent)
+        self.__stream.write(text.replace("\n", "\n" + indent))
+
+    def get_json(self, indent: int | None = None) -> str | None:
+        """Get JSON string
+
+        Args:
+            indent: Indentation level
+
+        Returns:
+            JSON string
+        """
+        if self.streaming:
+            raise ValueError("JSON text is not available in streaming mode")
+        return super().get_json(indent)
+
+    def save(self, path: str | None = None) -> None:
+        """Save JSON file
+
+        Args:
+            path: Path to save the JSON file (if None, implies current directory).
+             Not supported in streaming mode.
+        """
+        if not self.streaming:
+            super().save(path)
+            return
+        if path:
+            raise ValueError("The path cannot be changed in streaming mode")
+        if self.__stream is None:
+            # Nothing has been written
+            with open_json_file(self.filename, "w", self.file_compression) as fdesc:
+                fdesc.write("{}")
+            return
+        while self.__stream_groups:
+            self.__stream_close_group()
+        self.__stream.write("\n}" if self.__stream_keys[0] else "}")
+        self.__stream.close()
+        self.__stream = None
+
+    def close(self) -> None:
+        """Complete and close the JSON file in streaming mode (do nothing otherwise)"""
+        if self.streaming and self.__stream is not None:
+            self.save()
+
     def write_none(self) -> None:
         """Write None"""
         self.write_any(None)
@@ -200,17 +1013,73 @@ class NoDefault:
 class JSONReader(JSONHandler):
     """Class handling JSON deserialization
 
+    In streaming mode, the document is not loaded when creating the reader:
+    :py:meth:`iter_object_list` then parses the file incrementally, one object at a
+    time, and the whole document is loaded (parsed group by group) only when other
+    values are read.
+
     Args:
-        fname_or_jsontext: JSON filename or JSON text
+        fname_or_jsontext: JSON filename (compressed files are detected from their
+         first bytes, see `FILE_CODECS`) or JSON text
+        streaming: if True, do not load the document until needed. Defaults to
+         False.
+        backend: JSON backend name (see :py:func:`get_json_backend`). Defaults to
+         None (default backend).
+        legacy_arrays: if True, decode ``["array", data, dtype]`` triplets, which
+         requires checking every list of three items of the document. May be set
+         to False for files written with the `tagged_arrays` or `binary_arrays`
+         options of :py:class:`JSONWriter`, triplets being then read as lists.
+         Defaults to True.
     """
 
-    def __init__(self, fname_or_jsontext: str) -> None:
+    #: Size of the chunks read from the file in streaming mode (characters)
+    CHUNK_SIZE = 1 << 16
+
+    def __init__(
+        self,
+        fname_or_jsontext: str,
+        streaming: bool = False,
+        backend: str | None = None,
+        legacy_arrays: bool = True,
+    ) -> None:
         """JSONReader constructor"""
-        JSONHandler.__init__(self, fname_or_jsontext)
+        JSONHandler.__init__(self, fname_or_jsontext, backend)
+        self.legacy_arrays = legacy_arrays
         if fname_or_jsontext is not None and not os.path.isfile(fname_or_jsontext):
             self.filename = None
             self.jsontext = fname_or_jsontext
-        self.load()
+        self.streaming = streaming
+        if streaming:
+            self.jsondata = None
+        else:
+            self.load()
+
+    def load(self) -> None:
+        """Load JSON file (or JSON text, if no file name has been set)
+
+        In streaming mode, the file is parsed incrementally (see
+        :py:meth:`JSONStreamScanner.read_document`).
+        """
+        if not self.streaming or self.filename is None:
+            super().load()
+            return
+        codec = detect_file_codec(self.filename)
+        with open_json_file(self.filename, "r", codec) as fdesc:
+            scanner = JSONStreamScanner(fdesc, self.CHUNK_SIZE, self.legacy_arrays)
+            self.jsondata = scanner.read_document()
+
+    def get_parent_group(self) -> dict:
+        """Get parent group"""
+        if self.jsondata is None:
+            # Streaming mode: load the whole document
+            self.load()
+        return super().get_parent_group()
+
+    def get_json_dict(self) -> dict:
+        """Return JSON data dictionary"""
+        if self.jsondata is None:
+            self.load()
+        return self.jsondata
 
     def read(
         self,
@@ -218,6 +1087,8 @@ class JSONReader(JSONHandler):
         func: Callable[[], Any] | None = None,
         instance: Any | None = None,
         default: Any | NoDefault = NoDefault,
+        include: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
     ) -> Any:
         """
         Read a value from the current group or specified group_name.
@@ -230,6 +1101,10 @@ class JSONReader(JSONHandler):
             default: The default value to return if the value is not found.
              Defaults to `NoDefault` (no default value: raises an exception if the
              value is not found).
+            include: Names of the items of `instance` to deserialize (see
+             :py:meth:`guidata.dataset.DataSet.deserialize`). Defaults to None.
+            exclude: Names of the items of `instance` not to deserialize.
+             Defaults to None.
 
         Returns:
             The read value.
@@ -248,7 +1123,7 @@ class JSONReader(JSONHandler):
                     # the object was None when deserializing it
                     val = None
                 else:
-                    instance.deserialize(self)
+                    deserialize_object(instance, self, include, exclude)
                     val = instance
         except Exception:  # pylint:disable=broad-except
             if default is NoDefault:
@@ -268,6 +1143,8 @@ class JSONReader(JSONHandler):
         group_name: str,
         klass: type[Any],
         progress_callback: Callable[[int], bool] | None = None,
+        include: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
     ) -> list[Any]:
         """Read an object sequence from a group.
 
@@ -280,6 +1157,9 @@ class JSONReader(JSONHandler):
             progress_callback: A function to call with an integer argument (progress:
              0 --> 100). The function returns the `cancel` state (True: progress
              dialog has been canceled, False otherwise).
+            include: Names of the items to deserialize (see
+             :py:meth:`guidata.dataset.DataSet.deserialize`). Defaults to None.
+            exclude: Names of the items not to deserialize. Defaults to None.
         """
         with self.group(group_name):
             try:
@@ -301,10 +1181,218 @@ class JSONReader(JSONHandler):
                         obj = None
                     else:
                         obj = klass()
-                        obj.deserialize(self)
+                        deserialize_object(obj, self, include, exclude)
                 seq.append(obj)
         return seq
 
+    def iter_object_list(
+        self,
+        group_name: str,
+        klass: type[Any],
+        include: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+    ) -> Iterator[Any]:
+        """Iterate over an object sequence of a group, deserializing objects one at
+        a time (generator variant of :py:meth:`read_object_list`)
+
+        In streaming mode (and if the document has not been loaded), the file is
+        parsed incrementally: only one object is held in memory at a time, and
+        objects are returned in the order of the file (which is the order of the
+        sequence for files written by :py:class:`JSONWriter`). Otherwise, objects
+        are returned in the order of the sequence, from the loaded document.
+
+        Args:
+            group_name: The name of the group to read the object sequence from.
+            klass: The object class which constructor requires no argument.
+            include: Names of the items to deserialize (see
+             :py:meth:`guidata.dataset.DataSet.deserialize`). Defaults to None.
+            exclude: Names of the items not to deserialize. Defaults to None.
+
+        Yields:
+            Deserialized objects (or None for objects which were None when
+            serialized). Nothing is yielded if the sequence was None.
+        """
+        if self.jsondata is not None:
+            with self.group(group_name):
+                if self.get_parent_group().get(group_name, {}) is None:
+                    # None was saved instead of list of objects
+                    return
+            seq = self.read_object_list(group_name, klass, None, include, exclude)
+            yield from seq or []
+            return
+        path = self.option + [group_name]
+        if self.filename is None:
+            fdesc = io.StringIO(self.jsontext)
+        else:
+            codec = detect_file_codec(self.filename)
+            fdesc = open_json_file(self.filename, "r", codec)
+        with fdesc:
+            scanner = JSONStreamScanner(fdesc, self.CHUNK_SIZE, self.legacy_arrays)
+            for name, value in scanner.iter_group(path):
+                if name == "IDs":
+                    continue
+                if value is None:
+                    yield None
+                    continue
+                # Deserialize the object from a document holding only this object
+                root = parent = {}
+                for option in path:
+                    parent = parent.setdefault(option, {})
+                parent[name] = value
+                obj = klass()
+                self.jsondata = root
+                try:
+                    with self.group(group_name), self.group(name):
+                        deserialize_object(obj, self, include, exclude)
+                finally:
+                    self.jsondata = None
+                yield obj
+
     read_unicode = read_sequence = read_dict = read_float = read_int = read_str = (
         read_bool
     ) = read_array = read_any
+
+
+class JSONStreamScanner:
+    """Incremental JSON parser, reading a text stream chunk by chunk
+
+    Only the groups (JSON objects) leading to the requested values are scanned:
+    other values are decoded one at a time and discarded.
+
+    Args:
+        fdesc: text stream
+        chunk_size: size of the chunks read from the stream (characters)
+        legacy_arrays: if True, decode ``["array", data, dtype]`` triplets
+    """
+
+    def __init__(
+        self, fdesc: IO[str], chunk_size: int = 1 << 16, legacy_arrays: bool = True
+    ) -> None:
+        self.fdesc = fdesc
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = CustomJSONDecoder(legacy_arrays=legacy_arrays)
+
+    def __fill(self, size: int | None = None) -> bool:
+        """Read the next chunk, dropping the part of the buffer already parsed
+
+        Args:
+            size: number of characters to read (default: chunk size)
+
+        Returns:
+            False if the end of the stream has been reached
+        """
+        if self.eof:
+            return False
+        chunk = self.fdesc.read(size or self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def __peek(self) -> str:
+        """Skip whitespace and return the next character (empty string at the end of
+        the stream)"""
+        while True:
+            buffer, pos = self.buffer, self.pos
+            while pos < len(buffer) and buffer[pos] in " \t\n\r":
+                pos += 1
+            self.pos = pos
+            if pos < len(buffer) or not self.__fill():
+                return buffer[pos : pos + 1]
+
+    def __expect(self, chars: str) -> str:
+        """Consume the next character, which must be one of `chars`
+
+        Args:
+            chars: expected characters
+
+        Returns:
+            Consumed character
+        """
+        char = self.__peek()
+        if not char or char not in chars:
+            raise ValueError(f"Invalid JSON stream: expected one of {chars!r}")
+        self.pos += 1
+        return char
+
+    def __decode(self) -> Any:
+        """Decode the next value"""
+        self.__peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # The value may be truncated: read more data (doubling the buffer,
+                # so that large values are not parsed too many times)
+                if not self.__fill(max(self.chunk_size, len(self.buffer))):
+                    raise
+                continue
+            if end == len(self.buffer) and self.__fill():
+                # Numbers may be truncated at the end of the buffer
+                continue
+            self.pos = end
+            return value
+
+    def __iter_members(self) -> Iterator[str]:
+        """Iterate over the keys of the JSON object starting at the current position:
+        for each key, the caller must consume the value before resuming"""
+        self.__expect("{")
+        if self.__peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            if self.__peek() != '"':
+                raise ValueError("Invalid JSON stream: expected a key")
+            key = self.__decode()
+            self.__expect(":")
+            yield key
+            if self.__expect(",}") == "}":
+                return
+
+    def iter_group(self, path: list[str]) -> Iterator[tuple[str, Any]]:
+        """Iterate over the members of a group (JSON object) of the document
+
+        Args:
+            path: names of the group and of its parent groups, from the root
+
+        Yields:
+            (key, decoded value) tuples. Nothing is yielded if the value of the
+            group is not a JSON object (e.g. null).
+
+        Raises:
+            KeyError: if the group does not exist
+        """
+        for depth, name in enumerate(path):
+            for key in self.__iter_members():
+                if key == name:
+                    break
+                self.__decode()  # Skip the value of another key
+            else:
+                raise KeyError("/".join(path[: depth + 1]))
+            if self.__peek() != "{":
+                if depth < len(path) - 1:
+                    raise KeyError("/".join(path[: depth + 2]))
+                self.__decode()
+                return
+        for key in self.__iter_members():
+            yield key, self.__decode()
+
+    def read_document(self) -> Any:
+        """Decode the value starting at the current position (e.g. the whole
+        document), group by group: only the text of one value which is not a group
+        is held in memory at a time
+
+        Returns:
+            Decoded value
+        """
+        if self.__peek() != "{":
+            return self.__decode()
+        group = {}
+        for key in self.__iter_members():
+            group[key] = self.read_document()
+        return self.decoder.object_hook(group)
@@ -0,0 +1,398 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+NumPy directories (one .npy file per array)
+
+Data is written in a directory: scalar values (and sequences or dictionaries of
+scalar values) are stored in a JSON manifest which mirrors the group hierarchy, and
+each NumPy array is stored in its own ``.npy`` file, the manifest holding a
+reference to the file (``{"__npy__": "000001.npy"}``).
+
+Arrays are read as read-only memory-mapped arrays (see :py:class:`NPYReader`): they
+are not copied into memory, and only the accessed parts of the array files are read.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import os.path as osp
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import Any
+from uuid import uuid1
+
+import numpy as np
+
+from guidata.io.base import BaseIOHandler, WriterMixin, deserialize_object
+
+#: Name of the manifest file
+MANIFEST_NAME = "manifest.json"
+#: Format identifier of the manifest
+MANIFEST_FORMAT = "guidata-npy"
+MANIFEST_VERSION = 1
+#: Key of the array references in the manifest
+ARRAY_KEY = "__npy__"
+
+
+def iter_array_files(val: Any) -> Iterator[str]:
+    """Iterate over the array files referenced by a value of the manifest
+
+    Args:
+        val: value stored in the manifest
+
+    Yields:
+        Array file names
+    """
+    if isinstance(val, dict):
+        if ARRAY_KEY in val:
+            yield val[ARRAY_KEY]
+        else:
+            for value in val.values():
+                yield from iter_array_files(value)
+    elif isinstance(val, list):
+        for item in val:
+            yield from iter_array_files(item)
+
+
+class NPYHandler(BaseIOHandler):
+    """Class handling NumPy directory r/w
+
+    Args:
+        dirname: directory name
+    """
+
+    def __init__(self, dirname: str) -> None:
+        super().__init__()
+        self.dirname = dirname
+        self.data: dict[str, Any] = {}
+
+    def get_parent_group(self) -> dict:
+        """Get parent group"""
+        parent = self.data
+        for option in self.option[:-1]:
+            parent = parent.setdefault(option, {})
+        return parent
+
+    def close(self) -> None:
+        """Close the handler"""
+
+    def __enter__(self) -> NPYHandler:
+        """Enter context"""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Exit context"""
+        self.close()
+
+
+class NPYWriter(NPYHandler, WriterMixin):
+    """Class handling NumPy directory serialization
+
+    Arrays are written to their ``.npy`` files as soon as they are written, and the
+    manifest is written when the writer is closed (see :py:meth:`close`).
+
+    Dictionaries containing the ``"__npy__"`` key, which is reserved for array
+    references, cannot be written.
+
+    Args:
+        dirname: directory name (created if it does not exist). An existing
+         directory must be empty, or be a NumPy directory: its manifest and the
+         array files referenced by the manifest are then removed (other files are
+         kept).
+
+    Raises:
+        ValueError: if the directory is not empty and is not a NumPy directory
+    """
+
+    def __init__(self, dirname: str) -> None:
+        super().__init__(dirname)
+        os.makedirs(dirname, exist_ok=True)
+        self.__remove_previous_files()
+        self.__count = 0
+        # Mark the directory as a NumPy directory right away, so that it may be
+        # rewritten even if the writer is not closed
+        self.__write_manifest()
+
+    def __remove_previous_files(self) -> None:
+        """Remove the files of a previous serialization
+
+        Raises:
+            ValueError: if the directory is not empty and is not a NumPy directory
+        """
+        if not os.listdir(self.dirname):
+            return
+        fname = osp.join(self.dirname, MANIFEST_NAME)
+        manifest = None
+        if osp.isfile(fname):
+            try:
+                with open(fname, encoding="utf-8") as fdesc:
+                    manifest = json.load(fdesc)
+            except ValueError:
+                pass
+        if not isinstance(manifest, dict) or manifest.get("format") != MANIFEST_FORMAT:
+            raise ValueError(
+                f"{self.dirname!r} is not empty and is not a guidata NumPy directory"
+            )
+        for array_fname in iter_array_files(manifest.get("data")):
+            if (
+                isinstance(array_fname, str)
+                and array_fname == osp.basename(array_fname)
+                and array_fname.endswith(".npy")
+            ):
+                path = osp.join(self.dirname, array_fname)
+                if osp.isfile(path):
+                    os.remove(path)
+        os.remove(fname)
+
+    def __save_array(self, arr: np.ndarray) -> dict[str, str]:
+        """Save an array to its own file
+
+        Args:
+            arr: NumPy array
+
+        Returns:
+            Reference to the array file (to be stored in the manifest)
+        """
+        if arr.dtype.kind == "O":
+            raise NotImplementedError(f"cannot serialize object array {arr!r}")
+        self.__count += 1
+        fname = f"{self.__count:06d}.npy"
+        np.save(osp.join(self.dirname, fname), arr, allow_pickle=False)
+        return {ARRAY_KEY: fname}
+
+    def __encode(self, val: Any) -> Any:
+        """Convert a value to a JSON-serializable value, saving arrays to files
+
+        Args:
+            val: value
+
+        Returns:
+            Value to be stored in the manifest
+        """
+        if isinstance(val, np.ndarray):
+            return self.__save_array(val)
+        if isinstance(val, dict):
+            if ARRAY_KEY in val:
+                raise ValueError(f"cannot serialize dict with key {ARRAY_KEY!r}")
+            return {key: self.__encode(value) for key, value in val.items()}
+        if isinstance(val, (list, tuple)):
+            return [self.__encode(item) for item in val]
+        if isinstance(val, np.generic):
+            return val.item()
+        if isinstance(val, bytes):
+            return val.decode()
+        return val
+
+    def write_any(self, val: Any) -> None:
+        """Write any value type"""
+        if ARRAY_KEY in self.option:
+            raise ValueError(f"cannot serialize value named {ARRAY_KEY!r}")
+        group = self.get_parent_group()
+        group[self.option[-1]] = self.__encode(val)
+
+    def write_none(self) -> None:
+        """Write None"""
+        self.write_any(None)
+
+    write_sequence = write_dict = write_str = write_bool = write_int = write_float = (
+        write_array
+    ) = write_any
+
+    def write_object_list(self, seq: Sequence[Any] | None, group_name: str) -> None:
+        """
+        Write an object sequence in a group.
+        Objects must implement the DataSet-like `serialize` method.
+
+        Args:
+            seq: The object sequence to write. Defaults to None.
+            group_name: The name of the group in which to write the objects.
+        """
+        with self.group(group_name):
+            if seq is None:
+                self.write_none()
+            else:
+                ids = []
+                for obj in seq:
+                    guid = str(uuid1())
+                    ids.append(guid)
+                    with self.group(guid):
+                        if obj is None:
+                            self.write_none()
+                        else:
+                            obj.serialize(self)
+                self.write(ids, "IDs")
+
+    def __write_manifest(self) -> None:
+        """Write the manifest, referencing the values written so far"""
+        manifest = {
+            "format": MANIFEST_FORMAT,
+            "version": MANIFEST_VERSION,
+            "data": self.data,
+        }
+        fname = osp.join(self.dirname, MANIFEST_NAME)
+        with open(fname, mode="w", encoding="utf-8") as fdesc:
+            json.dump(manifest, fdesc)
+
+    def close(self) -> None:
+        """Write the manifest"""
+        self.__write_manifest()
+
+
+class NoDefault:
+    """Class to represent the absence of a default value."""
+
+    pass
+
+
+class NPYReader(NPYHandler):
+    """Class handling NumPy directory deserialization
+
+    Args:
+        dirname: directory name
+        mmap_arrays: if True (default), arrays are read-only memory-mapped arrays
+         (see `numpy.load`), which are not loaded into memory. Otherwise, arrays
+         are loaded into memory (and are writeable).
+
+    .. note::
+        Memory-mapped arrays remain valid after the reader is closed, but they
+        read the array files when accessed: the directory must not be modified or
+        removed while they are in use.
+    """
+
+    def __init__(self, dirname: str, mmap_arrays: bool = True) -> None:
+        super().__init__(dirname)
+        self.mmap_arrays = mmap_arrays
+        with open(osp.join(dirname, MANIFEST_NAME), encoding="utf-8") as fdesc:
+            manifest = json.load(fdesc)
+        if manifest.get("format") != MANIFEST_FORMAT:
+            raise ValueError(f"{dirname!r} is not a guidata NumPy directory")
+        self.data = manifest["data"]
+
+    def __decode(self, val: Any) -> Any:
+        """Convert a value of the manifest, loading arrays
+
+        Args:
+            val: value stored in the manifest
+
+        Returns:
+            Value
+        """
+        if isinstance(val, dict):
+            if ARRAY_KEY in val:
+                fname = osp.join(self.dirname, val[ARRAY_KEY])
+                return np.load(fname, mmap_mode="r" if self.mmap_arrays else None)
+            return {key: self.__decode(value) for key, value in val.items()}
+        if isinstance(val, list):
+            return [self.__decode(item) for item in val]
+        return val
+
+    def read(
+        self,
+        group_name: str | None = None,
+        func: Callable[[], Any] | None = None,
+        instance: Any | None = None,
+        default: Any | NoDefault = NoDefault,
+        include: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+    ) -> Any:
+        """
+        Read a value from the current group or specified group_name.
+
+        Args:
+            group_name: The name of the group to read from. Defaults to None.
+            func: The function to use for reading the value. Defaults to None.
+            instance: An object that implements the DataSet-like `deserialize` method.
+             Defaults to None.
+            default: The default value to return if the value is not found.
+             Defaults to `NoDefault` (no default value: raises an exception if the
+             value is not found).
+            include: Names of the items of `instance` to deserialize (see
+             :py:meth:`guidata.dataset.DataSet.deserialize`). Defaults to None.
+            exclude: Names of the items of `instance` not to deserialize.
+             Defaults to None.
+
+        Returns:
+            The read value.
+        """
+        if group_name:
+            self.begin(group_name)
+        try:
+            if instance is None:
+                if func is None:
+                    func = self.read_any
+                val = func()
+            else:
+                group = self.get_parent_group()
+                if group.get(group_name) is None:
+                    # The object was None when serializing it
+                    val = None
+                else:
+                    deserialize_object(instance, self, include, exclude)
+                    val = instance
+        except Exception:  # pylint:disable=broad-except
+            if default is NoDefault:
+                raise
+            val = default
+        if group_name:
+            self.end(group_name)
+        return val
+
+    def read_any(self) -> Any:
+        """Read any value type"""
+        group = self.get_parent_group()
+        return self.__decode(group[self.option[-1]])
+
+    read_unicode = read_sequence = read_dict = read_float = read_int = read_str = (
+        read_bool
+    ) = read_array = read_none = read_any
+
+    def read_object_list(
+        self,
+        group_name: str,
+        klass: type[Any],
+        progress_callback: Callable[[int], bool] | None = None,
+        include: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+    ) -> list[Any] | None:
+        """Read an object sequence from a group.
+
+        Objects must implement the DataSet-like `deserialize` method.
+        `klass` is the object class which constructor requires no argument.
+
+        Args:
+            group_name: The name of the group to read the object sequence from.
+            klass: The object class which constructor requires no argument.
+            progress_callback: A function to call with an integer argument (progress:
+             0 --> 100). The function returns the `cancel` state (True: progress
+             dialog has been canceled, False otherwise).
+            include: Names of the items to deserialize (see
+             :py:meth:`guidata.dataset.DataSet.deserialize`). Defaults to None.
+            exclude: Names of the items not to deserialize. Defaults to None.
+
+        Returns:
+            The list of objects (None objects are read as None), or None if None
+            was written instead of the list.
+        """
+        with self.group(group_name):
+            if self.get_parent_group()[group_name] is None:
+                # None was saved instead of list of objects
+                return None
+            ids = self.read("IDs", func=self.read_sequence)
+            seq = []
+            count = len(ids)
+            for idx, name in enumerate(ids):
+                if progress_callback is not None:
+                    if progress_callback(int(100 * float(idx) / count)):
+                        break
+                with self.group(name):
+                    if self.get_parent_group()[name] is None:
+                        # The object was None when serializing it
+                        obj = None
+                    else:
+                        obj = klass()
+                        deserialize_object(obj, self, include, exclude)
+                seq.append(obj)
+        return seq
@@ -76,7 +76,7 @@ from qtpy import QtWidgets as QW
 
 import guidata
 from guidata.config import _
-from guidata.configtools import get_icon
+from guidata.configtools import clear_font_cache, get_icon
 from guidata.env import execenv
 from guidata.external import darkdetect
 
@@ -195,6 +195,7 @@ def set_color_mode(mode: Literal["light", "dark", "auto"] | None = None):
     global DEFAULT_STYLES, CURRENT_THEME
 
     CURRENT_THEME = None
+    clear_font_cache()
 
     if mode is not None:
         assert mode in COLOR_MODES, (
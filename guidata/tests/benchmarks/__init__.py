@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+guidata benchmarks
+==================
+
+Benchmarks are regular test modules: when run by pytest, they use small problem
+sizes and only check that the compared code paths give the same results. When run
+as scripts, they use realistic problem sizes and print timings.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+
+def measure(func: Callable[[], Any], repeat: int = 3) -> float:
+    """Return the best execution time of `func` (in seconds) over `repeat` runs
+
+    Args:
+        func: function to call (without argument)
+        repeat: number of runs
+
+    Returns:
+        Best execution time in seconds
+    """
+    best = float("inf")
+    for _index in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - t0)
+    return best
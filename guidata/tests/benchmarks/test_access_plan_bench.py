@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+Data item attribute access benchmark: precompiled access plans vs. property lookups
+"""
+
+from __future__ import annotations
+
+import warnings
+from typing import Any
+
+import guidata.dataset as gds
+from guidata.config import (
+    ValidationMode,
+    get_validation_mode,
+    temporary_validation_mode,
+)
+from guidata.dataset.datatypes import ComputedProp, DataItemValidationWarning
+from guidata.env import execenv
+from guidata.tests.benchmarks import measure
+
+
+class LookupFloatItem(gds.FloatItem):
+    """Float item looking up its data properties on each access (former code)"""
+
+    def __get__(self, instance: Any, klass: type) -> Any | None:
+        if instance is not None:
+            computed_prop = self.get_prop("data", "computed", None)
+            if isinstance(computed_prop, ComputedProp):
+                return computed_prop(instance, self, None)
+            return getattr(instance, "_%s" % (self._name), self._default)
+        return self
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        computed_prop = self.get_prop("data", "computed", None)
+        if isinstance(computed_prop, ComputedProp):
+            raise ValueError(f"Computed item '{self.get_name()}' is read-only")
+        self._set_value_with_validation(instance, value, force_allow_none=False)
+
+    def _set_value_with_validation(
+        self, instance: Any, value: Any, force_allow_none: bool = False
+    ) -> None:
+        # Same conversions as FloatItem
+        try:
+            if hasattr(value, "dtype") and not isinstance(value, self.type):
+                value = self.type(value)
+        except (TypeError, ValueError):
+            pass
+        if isinstance(value, int):
+            value = float(value)
+        # Former DataItem implementation
+        vmode = get_validation_mode()
+        if vmode == ValidationMode.DISABLED:
+            setattr(instance, f"_{self._name}", value)
+            return
+        if value is None:
+            if force_allow_none or self.get_prop("data", "allow_none", False):
+                setattr(instance, f"_{self._name}", value)
+                return
+        try:
+            self.check_value(value, raise_exception=True)
+        except NotImplementedError:
+            pass
+        except Exception as exc:  # pylint: disable=broad-except
+            if vmode == ValidationMode.ENABLED:
+                msg = f"Checking {instance.__class__.__name__}.{str(self)}: {exc}"
+                warnings.warn(msg, DataItemValidationWarning)
+            else:
+                raise
+        setattr(instance, f"_{self._name}", value)
+
+
+class PlanParameters(gds.DataSet):
+    """Parameters using access plans"""
+
+    x = gds.FloatItem("X", default=1.0)
+    y = gds.FloatItem("Y", default=2.0)
+
+
+class LookupParameters(gds.DataSet):
+    """Parameters looking up data properties on each access"""
+
+    x = LookupFloatItem("X", default=1.0)
+    y = LookupFloatItem("Y", default=2.0)
+
+
+def run_access_plan_benchmark(count: int, repeat: int) -> None:
+    """Compare attribute get/set with and without access plans"""
+    execenv.print(f"Data item attribute access ({count} get/set, ns per access):")
+    for label, klass, vmode in (
+        ("lookup", LookupParameters, ValidationMode.DISABLED),
+        ("plan", PlanParameters, ValidationMode.DISABLED),
+        ("lookup", LookupParameters, ValidationMode.ENABLED),
+        ("plan", PlanParameters, ValidationMode.ENABLED),
+    ):
+        param = klass()
+
+        def get():
+            for _index in range(count):
+                param.x  # pylint: disable=pointless-statement
+
+        def set_():
+            for index in range(count):
+                param.y = float(index)
+
+        with temporary_validation_mode(vmode):
+            t_get, t_set = measure(get, repeat), measure(set_, repeat)
+        assert param.y == float(count - 1)
+        execenv.print(
+            f"  {label:6s} ({vmode.name.lower():8s}) get: {t_get / count * 1e9:7.1f}"
+            f" set: {t_set / count * 1e9:7.1f}"
+        )
+
+
+def test_access_plan_benchmark():
+    """Benchmark data item access plans"""
+    run_access_plan_benchmark(count=1_000, repeat=1)
+
+
+if __name__ == "__main__":
+    run_access_plan_benchmark(count=1_000_000, repeat=5)
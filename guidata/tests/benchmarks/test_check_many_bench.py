@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+Batch validation benchmark: checking many numeric values before a sweep
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+import guidata.dataset as gds
+from guidata.env import execenv
+from guidata.tests.benchmarks import measure
+
+
+class SweepParameters(gds.DataSet):
+    """Sweep parameters"""
+
+    gain = gds.FloatItem("Gain", default=1.0, min=0.0, max=10.0)
+    offset = gds.FloatItem("Offset", default=1.0, nonzero=True)
+    count = gds.IntItem("Count", default=2, min=0, even=True)
+
+
+def run_check_many_benchmark(count: int, repeat: int) -> None:
+    """Compare value-by-value validation with vectorized batch validation"""
+    rng = np.random.default_rng(0)
+    values = {
+        "gain": rng.uniform(-1.0, 11.0, count),
+        "offset": rng.normal(size=count),
+        "count": rng.integers(-10, 100, count),
+    }
+    param = SweepParameters()
+    items = {item.get_name(): item for item in param.get_items()}
+    results = {}
+
+    def check_one_by_one():
+        results["loop"] = {
+            name: gds.DataItem.check_values(items[name], column)
+            for name, column in values.items()
+        }
+
+    def check_vectorized():
+        results["vectorized"] = param.check_many(values)[0]
+
+    t_loop = measure(check_one_by_one, repeat)
+    t_vect = measure(check_vectorized, repeat)
+    expected = np.logical_and.reduce(list(results["loop"].values()))
+    assert np.array_equal(expected, results["vectorized"])
+    execenv.print(f"Validation of {count} values for 3 numeric items:")
+    execenv.print(f"  one by one  {t_loop:8.4f} s")
+    execenv.print(f"  vectorized  {t_vect:8.4f} s")
+
+
+def test_check_many_benchmark():
+    """Benchmark batch validation"""
+    run_check_many_benchmark(count=1000, repeat=1)
+
+
+if __name__ == "__main__":
+    run_check_many_benchmark(count=100_000, repeat=3)
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+Compact data set benchmark: memory footprint of many small data set instances
+"""
+
+from __future__ import annotations
+
+import time
+import tracemalloc
+
+import guidata.dataset as gds
+from guidata.env import execenv
+
+
+class FrameParameters(gds.DataSet):
+    """Frame parameters
+
+    Acquisition parameters of a frame"""
+
+    index = gds.IntItem("Index", default=0)
+    exposure = gds.FloatItem("Exposure", default=0.1)
+    gain = gds.FloatItem("Gain", default=1.0)
+    label = gds.StringItem("Label", default="frame")
+    enabled = gds.BoolItem("Enabled", default=True)
+
+
+class CompactFrameParameters(FrameParameters, compact=True):
+    """Frame parameters
+
+    Acquisition parameters of a frame"""
+
+
+def create_frames(klass: type[FrameParameters], count: int) -> tuple[list, int, float]:
+    """Create `count` instances and return them with the allocated memory (bytes)
+    and the creation time (seconds)"""
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    frames = []
+    for index in range(count):
+        frame = klass()
+        frame.index = index
+        frames.append(frame)
+    elapsed = time.perf_counter() - t0
+    size, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return frames, size, elapsed
+
+
+def run_compact_dataset_benchmark(count: int) -> None:
+    """Compare memory footprint of standard and compact data sets"""
+    execenv.print(f"Memory footprint of {count} data set instances:")
+    for label, klass in (
+        ("standard", FrameParameters),
+        ("compact", CompactFrameParameters),
+    ):
+        frames, size, elapsed = create_frames(klass, count)
+        assert frames[-1].index == count - 1
+        execenv.print(
+            f"  {label:8s} {size / count:7.1f} bytes per instance"
+            f" ({size / 1e6:7.2f} MB, created in {elapsed:.3f} s)"
+        )
+        del frames
+
+
+def test_compact_dataset_benchmark():
+    """Benchmark compact data sets"""
+    run_compact_dataset_benchmark(count=1_000)
+
+
+if __name__ == "__main__":
+    run_compact_dataset_benchmark(count=200_000)
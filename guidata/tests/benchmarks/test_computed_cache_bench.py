@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+Computed item benchmark: reading array statistics repeatedly (e.g. when refreshing
+a view or exporting a table), with and without caching
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+import guidata.dataset as gds
+from guidata.env import execenv
+from guidata.tests.benchmarks import measure
+
+
+def compute_std(param: gds.DataSet) -> float:
+    """Compute the standard deviation of the signal data"""
+    return float(np.std(param.data)) * param.gain
+
+
+class CachedSignal(gds.DataSet):
+    """Signal"""
+
+    data = gds.FloatArrayItem("Data", default=np.zeros(1))
+    gain = gds.FloatItem("Gain", default=1.0)
+    label = gds.StringItem("Label", default="signal")
+    std = gds.FloatItem("Std").set_computed(compute_std)
+
+
+class UncachedSignal(gds.DataSet):
+    """Signal (computed item without cache, as before)"""
+
+    data = gds.FloatArrayItem("Data", default=np.zeros(1))
+    gain = gds.FloatItem("Gain", default=1.0)
+    label = gds.StringItem("Label", default="signal")
+    std = gds.FloatItem("Std").set_computed(compute_std, cache=False)
+
+
+def run_computed_cache_benchmark(size: int, reads: int, repeat: int) -> None:
+    """Compare cached and uncached computed items"""
+    data = np.random.default_rng(0).normal(size=size)
+    results = {}
+    for klass in (UncachedSignal, CachedSignal):
+        param = klass()
+        param.data = data
+
+        def read_values(param=param):
+            for index in range(reads):
+                if index % 10 == 0:
+                    # Unrelated edit, which does not invalidate the cache
+                    param.label = f"signal {index}"
+                assert param.std > 0.0
+
+        results[klass.__name__] = measure(read_values, repeat)
+    execenv.print(f"{reads} reads of a computed item ({size} points), (ms):")
+    for name, duration in results.items():
+        execenv.print(f"  {name:16s}{duration * 1e3:10.3f}")
+
+
+def test_computed_cache_benchmark():
+    """Benchmark computed item cache"""
+    run_computed_cache_benchmark(1000, 100, 1)
+
+
+if __name__ == "__main__":
+    run_computed_cache_benchmark(1_000_000, 1000, 3)
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+Columnar data set benchmark: processing a large batch of parameter sets
+"""
+
+from __future__ import annotations
+
+import os.path as osp
+import tempfile
+
+import numpy as np
+
+import guidata.dataset as gds
+from guidata.env import execenv
+from guidata.io import HDF5Reader, HDF5Writer
+from guidata.tests.benchmarks import measure
+
+
+class Exposure(gds.DataSet):
+    """Exposure parameters"""
+
+    index = gds.IntItem("Index", default=0)
+    exposure = gds.FloatItem("Exposure", default=0.1)
+    gain = gds.FloatItem("Gain", default=1.0)
+    binning = gds.ChoiceItem("Binning", [(1, "1x1"), (2, "2x2"), (4, "4x4")])
+    enabled = gds.BoolItem("Enabled", default=True)
+
+
+def run_dataarray_benchmark(count: int, repeat: int) -> None:
+    """Compare lists of DataSet objects with DataSetArray"""
+    datasets = [Exposure() for _index in range(count)]
+    records = gds.DataSetArray(Exposure, count)
+
+    def process_list():
+        for index, dataset in enumerate(datasets):
+            dataset.index = index
+            dataset.gain = dataset.gain * 2.0 + dataset.exposure
+            dataset.enabled = dataset.gain < 3.0
+
+    def process_array():
+        records["index"] = np.arange(count)
+        records["gain"] = records["gain"] * 2.0 + records["exposure"]
+        records["enabled"] = records["gain"] < 3.0
+
+    times = {"list": [measure(process_list, repeat)]}
+    times["array"] = [measure(process_array, repeat)]
+    with tempfile.TemporaryDirectory() as dirname:
+        fname = osp.join(dirname, "bench.h5")
+
+        def write_list():
+            with HDF5Writer(fname) as writer:
+                writer.write_object_list(datasets, "records", table=True)
+
+        def read_list():
+            with HDF5Reader(fname) as reader:
+                return reader.read_object_list("records", Exposure)
+
+        def write_array():
+            with HDF5Writer(fname) as writer:
+                writer.write(records, "records")
+
+        def read_array():
+            with HDF5Reader(fname) as reader:
+                return reader.read("records", instance=gds.DataSetArray(Exposure))
+
+        times["list"] += [measure(write_list, repeat), measure(read_list, repeat)]
+        times["array"] += [measure(write_array, repeat), measure(read_array, repeat)]
+        assert np.array_equal(read_array().data, records.data)
+    execenv.print(f"Processing {count} parameter sets (process/HDF5 write/read):")
+    for label, label_times in times.items():
+        execenv.print(f"  {label:6s}" + "".join(f" {t:8.4f} s" for t in label_times))
+
+
+def test_dataarray_benchmark():
+    """Benchmark DataSetArray"""
+    run_dataarray_benchmark(count=200, repeat=1)
+
+
+if __name__ == "__main__":
+    run_dataarray_benchmark(count=100_000, repeat=3)
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+Change tracking benchmark: propagating a few edits between large data sets
+"""
+
+from __future__ import annotations
+
+import guidata.dataset as gds
+from guidata.env import execenv
+from guidata.tests.benchmarks import measure
+
+
+def create_dataset_class(count: int) -> type[gds.DataSet]:
+    """Return a DataSet class with `count` float items"""
+    items = {
+        f"param{index:03d}": gds.FloatItem(f"P{index}", default=0.0)
+        for index in range(count)
+    }
+    return type("LargeParameters", (gds.DataSet,), {"__doc__": "Large", **items})
+
+
+def run_dirty_tracking_benchmark(item_count: int, repeat: int) -> None:
+    """Compare full and incremental update_dataset"""
+    klass = create_dataset_class(item_count)
+    source, dest = klass(), klass()
+    source.param001 = 1.0
+    source.param002 = 2.0
+    loops = 100
+
+    def update_all():
+        for _index in range(loops):
+            gds.update_dataset(dest, source)
+
+    def update_changed():
+        for _index in range(loops):
+            gds.update_dataset(dest, source, changed_only=True)
+
+    t_all, t_changed = measure(update_all, repeat), measure(update_changed, repeat)
+    assert dest.param002 == 2.0
+    execenv.print(f"update_dataset with 2 changes out of {item_count} items (ms):")
+    execenv.print(f"  all items     {t_all * 1e3 / loops:8.3f}")
+    execenv.print(f"  changed only  {t_changed * 1e3 / loops:8.3f}")
+
+
+def test_dirty_tracking_benchmark():
+    """Benchmark change tracking"""
+    run_dirty_tracking_benchmark(item_count=20, repeat=1)
+
+
+if __name__ == "__main__":
+    run_dirty_tracking_benchmark(item_count=500, repeat=3)
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+Font cache benchmark: scrolling through a large array in the array editor
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from qtpy import QtCore as QC
+from qtpy import QtWidgets as QW
+
+import guidata.configtools as configtools
+from guidata.config import CONF
+from guidata.env import execenv
+from guidata.qthelpers import qt_app_context
+from guidata.tests.benchmarks import measure
+from guidata.widgets.arrayeditor import ArrayEditor, datamodel
+
+
+def scroll_through(view: QW.QTableView, steps: int) -> None:
+    """Scroll through the whole view, repainting it at each step"""
+    scrollbar = view.verticalScrollBar()
+    for value in np.linspace(scrollbar.minimum(), scrollbar.maximum(), steps):
+        scrollbar.setValue(int(value))
+        view.viewport().repaint()
+
+
+def run_fontcache_benchmark(shape: tuple[int, int], steps: int, repeat: int) -> None:
+    """Compare uncached and cached font resolution in the array editor"""
+    with qt_app_context():
+        dlg = ArrayEditor()
+        dlg.setup_and_check(np.random.rand(*shape), "Font cache benchmark")
+        dlg.resize(1200, 800)
+        dlg.show()
+        QW.QApplication.processEvents()
+        widget = dlg.arraywidget
+        index = widget.model.index(0, 0)
+        font = widget.model.data(index, QC.Qt.ItemDataRole.FontRole)
+        assert font == configtools.get_font(CONF, "arrayeditor", "font")
+
+        def scroll():
+            scroll_through(widget.view, steps)
+
+        t_cached = measure(scroll, repeat)
+        try:
+            datamodel.get_cached_font = configtools.get_font
+            t_uncached = measure(scroll, repeat)
+        finally:
+            datamodel.get_cached_font = configtools.get_cached_font
+        dlg.close()
+    execenv.print(f"Scrolling a {shape[0]}x{shape[1]} array ({steps} steps):")
+    execenv.print(f"  get_font:        {t_uncached * 1e3:8.1f} ms")
+    execenv.print(f"  get_cached_font: {t_cached * 1e3:8.1f} ms")
+
+
+def test_fontcache_benchmark():
+    """Benchmark font cache in array editor"""
+    run_fontcache_benchmark(shape=(100, 20), steps=5, repeat=1)
+
+
+def test_fontcache_invalidation():
+    """Test that the font cache is invalidated when the configuration changes"""
+    with qt_app_context():
+        option = "font/size"
+        size = CONF.get("arrayeditor", option)
+        try:
+            font1 = configtools.get_cached_font(CONF, "arrayeditor", "font")
+            assert font1.pointSize() == size
+            CONF.set("arrayeditor", option, size + 1, save=False)
+            font2 = configtools.get_cached_font(CONF, "arrayeditor", "font")
+            assert font2.pointSize() == size + 1
+        finally:
+            CONF.set("arrayeditor", option, size, save=False)
+
+
+if __name__ == "__main__":
+    run_fontcache_benchmark(shape=(1000, 100), steps=50, repeat=3)
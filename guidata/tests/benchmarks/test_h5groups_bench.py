@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+HDF5 group handle benchmark: serializing many small nested datasets
+"""
+
+from __future__ import annotations
+
+import os.path as osp
+import tempfile
+
+import h5py
+
+import guidata.dataset as gds
+from guidata.env import execenv
+from guidata.io import HDF5Reader, HDF5Writer
+from guidata.tests.benchmarks import measure
+
+
+class Position(gds.DataSet):
+    """Position"""
+
+    x = gds.FloatItem("X", default=1.0)
+    y = gds.FloatItem("Y", default=2.0)
+    z = gds.FloatItem("Z", default=3.0)
+
+
+class Frame(gds.DataSet):
+    """Frame parameters"""
+
+    index = gds.IntItem("Index", default=0)
+    exposure = gds.FloatItem("Exposure", default=0.1)
+    label = gds.StringItem("Label", default="frame")
+    enabled = gds.BoolItem("Enabled", default=True)
+
+
+class FrameRecord:
+    """Frame record: frame parameters and nested position"""
+
+    def __init__(self) -> None:
+        self.frame = Frame()
+        self.position = Position()
+
+    def serialize(self, writer: HDF5Writer) -> None:
+        """Serialize record"""
+        writer.write(self.frame, "frame")
+        with writer.group("stage"):
+            writer.write(self.position, "position")
+
+    def deserialize(self, reader: HDF5Reader) -> None:
+        """Deserialize record"""
+        self.frame = reader.read("frame", instance=Frame())
+        with reader.group("stage"):
+            self.position = reader.read("position", instance=Position())
+
+
+def walk_parent_group(handler: HDF5Writer | HDF5Reader) -> h5py.Group:
+    """Return parent group by walking the hierarchy from the root (former code)"""
+    parent = handler.h5
+    for option in handler.option[:-1]:
+        parent = parent.require_group(option)
+    return parent
+
+
+class WalkingHDF5Writer(HDF5Writer):
+    """HDF5 writer without group handle stack"""
+
+    get_parent_group = walk_parent_group
+
+
+class WalkingHDF5Reader(HDF5Reader):
+    """HDF5 reader without group handle stack"""
+
+    get_parent_group = walk_parent_group
+
+
+def run_h5groups_benchmark(count: int, repeat: int) -> None:
+    """Compare group handle stack with walking the hierarchy from the root"""
+    records = []
+    for index in range(count):
+        record = FrameRecord()
+        record.frame.index = index
+        records.append(record)
+    results = {}
+    with tempfile.TemporaryDirectory() as dirname:
+        fname = osp.join(dirname, "bench.h5")
+        for label, wclass, rclass in (
+            ("walk", WalkingHDF5Writer, WalkingHDF5Reader),
+            ("stack", HDF5Writer, HDF5Reader),
+        ):
+
+            def write():
+                writer = wclass(fname)
+                with writer.group("records"):
+                    for index, record in enumerate(records):
+                        writer.write(record, f"record{index:06d}")
+                writer.close()
+
+            def read():
+                reader = rclass(fname)
+                with reader.group("records"):
+                    results[label] = [
+                        reader.read(f"record{index:06d}", instance=FrameRecord())
+                        for index in range(count)
+                    ]
+                reader.close()
+
+            results[label + "_times"] = measure(write, repeat), measure(read, repeat)
+    for label in ("walk", "stack"):
+        assert [rec.frame.index for rec in results[label]] == list(range(count))
+    execenv.print(f"HDF5 serialization of {count} nested records (write/read):")
+    for label in ("walk", "stack"):
+        t_write, t_read = results[label + "_times"]
+        execenv.print(f"  {label:6s} {t_write:8.3f} s {t_read:8.3f} s")
+
+
+def test_h5groups_benchmark():
+    """Benchmark HDF5 group handle stack"""
+    run_h5groups_benchmark(count=50, repeat=1)
+
+
+if __name__ == "__main__":
+    run_h5groups_benchmark(count=10_000, repeat=1)
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+HDF5 lazy array benchmark: deserializing data sets with large arrays
+"""
+
+from __future__ import annotations
+
+import os.path as osp
+import tempfile
+
+import numpy as np
+
+import guidata.dataset as gds
+from guidata.env import execenv
+from guidata.io import HDF5Reader, HDF5Writer
+from guidata.tests.benchmarks import measure
+
+
+class Acquisition(gds.DataSet):
+    """Acquisition"""
+
+    raw = gds.FloatArrayItem("Raw data")
+    background = gds.FloatArrayItem("Background").set_prop("data", h5_compression="lzf")
+
+
+def run_h5lazy_benchmark(size: int, repeat: int) -> None:
+    """Compare eager and lazy array loading"""
+    acq = Acquisition()
+    acq.raw = np.random.default_rng(0).random((size, size))
+    acq.background = np.zeros((size, size))
+    execenv.print(f"HDF5 deserialization of two {size}x{size} arrays:")
+    with tempfile.TemporaryDirectory() as dirname:
+        fname = osp.join(dirname, "bench.h5")
+        writer = HDF5Writer(fname)
+        writer.write(acq, "acq")
+        writer.close()
+        for lazy_arrays in (False, True):
+            result = []
+
+            def read():
+                reader = HDF5Reader(fname, lazy_arrays=lazy_arrays)
+                result[:] = [reader.read("acq", instance=Acquisition())]
+                reader.close()
+
+            t_read = measure(read, repeat)
+            acq2 = result[0]
+            t_shape = measure(lambda: (acq2.raw.shape, acq2.background.shape), 1)
+            assert np.array_equal(acq2.raw[-1], acq.raw[-1])
+            label = "lazy" if lazy_arrays else "eager"
+            execenv.print(
+                f"  {label:6s} read: {t_read * 1e3:9.2f} ms"
+                f" shape: {t_shape * 1e3:7.3f} ms"
+            )
+
+
+def test_h5lazy_benchmark():
+    """Benchmark HDF5 lazy arrays"""
+    run_h5lazy_benchmark(size=100, repeat=1)
+
+
+if __name__ == "__main__":
+    run_h5lazy_benchmark(size=5_000, repeat=3)
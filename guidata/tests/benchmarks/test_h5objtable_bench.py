@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+HDF5 object list benchmark: one group per object vs. columnar table
+"""
+
+from __future__ import annotations
+
+import os.path as osp
+import tempfile
+
+import numpy as np
+
+import guidata.dataset as gds
+from guidata.env import execenv
+from guidata.io import HDF5Reader, HDF5Writer
+from guidata.tests.benchmarks import measure
+
+
+class Peak(gds.DataSet):
+    """Peak parameters"""
+
+    index = gds.IntItem("Index", default=0)
+    position = gds.FloatItem("Position", default=0.0)
+    amplitude = gds.FloatItem("Amplitude", default=1.0)
+    label = gds.StringItem("Label", default="peak")
+    enabled = gds.BoolItem("Enabled", default=True)
+    profile = gds.FloatArrayItem("Profile", default=np.zeros(8))
+
+
+def run_h5objtable_benchmark(count: int, table_count: int, repeat: int) -> None:
+    """Compare object list layouts"""
+    execenv.print("HDF5 object lists (write/read):")
+    with tempfile.TemporaryDirectory() as dirname:
+        fname = osp.join(dirname, "bench.h5")
+        for table, nobj in ((False, count), (True, count), (True, table_count)):
+            seq = []
+            for index in range(nobj):
+                peak = Peak()
+                peak.index = index
+                peak.position = index * 0.1
+                peak.profile = np.full(8, index, dtype=float)
+                seq.append(peak)
+
+            def write():
+                writer = HDF5Writer(fname)
+                writer.write_object_list(seq, "peaks", table=table)
+                writer.close()
+
+            def read():
+                reader = HDF5Reader(fname)
+                result = reader.read_object_list("peaks", Peak)
+                reader.close()
+                return result
+
+            t_write, t_read = measure(write, repeat), measure(read, repeat)
+            result = read()
+            assert [peak.index for peak in result] == list(range(nobj))
+            assert np.array_equal(result[-1].profile, seq[-1].profile)
+            label = "table" if table else "groups"
+            execenv.print(
+                f"  {label:6s} {nobj:7d} objects {t_write:8.3f} s {t_read:8.3f} s"
+            )
+
+
+def test_h5objtable_benchmark():
+    """Benchmark HDF5 object tables"""
+    run_h5objtable_benchmark(count=50, table_count=500, repeat=1)
+
+
+if __name__ == "__main__":
+    # One group per object is limited to about 1,000 objects (object IDs are
+    # stored in a single HDF5 attribute)
+    run_h5objtable_benchmark(count=1_000, table_count=50_000, repeat=1)
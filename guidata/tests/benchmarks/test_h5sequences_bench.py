@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+HDF5 sequence benchmark: packed datasets vs. one element per attribute/dataset
+"""
+
+from __future__ import annotations
+
+import os
+import os.path as osp
+import tempfile
+
+import numpy as np
+
+from guidata.env import execenv
+from guidata.io import HDF5Reader, HDF5Writer
+from guidata.tests.benchmarks import measure
+
+
+def run_h5sequences_benchmark(count: int, array_count: int, repeat: int) -> None:
+    """Compare packed and per-element sequence layouts"""
+    floats = np.random.default_rng(0).random(count).tolist()
+    arrays = [np.full((16, 16), idx, dtype=np.float32) for idx in range(array_count)]
+    execenv.print(
+        f"HDF5 sequences ({count} floats, {array_count} arrays of 16x16):"
+        " write/read/size"
+    )
+    with tempfile.TemporaryDirectory() as dirname:
+        fname = osp.join(dirname, "bench.h5")
+        for packed_sequences in (False, True):
+
+            def write():
+                writer = HDF5Writer(fname, packed_sequences=packed_sequences)
+                writer.write(floats, "floats")
+                writer.write(arrays, "arrays")
+                writer.close()
+
+            def read():
+                reader = HDF5Reader(fname)
+                result = reader.read("floats"), reader.read("arrays")
+                reader.close()
+                return result
+
+            t_write, t_read = measure(write, repeat), measure(read, repeat)
+            floats2, arrays2 = read()
+            assert floats2 == floats
+            assert all(np.array_equal(a, b) for a, b in zip(arrays, arrays2))
+            size = os.stat(fname).st_size / 1e6
+            label = "packed" if packed_sequences else "legacy"
+            execenv.print(
+                f"  {label:6s} {t_write:8.3f} s {t_read:8.3f} s {size:8.2f} MB"
+            )
+
+
+def test_h5sequences_benchmark():
+    """Benchmark packed HDF5 sequences"""
+    run_h5sequences_benchmark(count=500, array_count=50, repeat=1)
+
+
+if __name__ == "__main__":
+    run_h5sequences_benchmark(count=10_000, array_count=2_000, repeat=1)
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+HDF5 update mode benchmark: autosaving a workspace after a small edit
+"""
+
+from __future__ import annotations
+
+import os.path as osp
+import tempfile
+
+import numpy as np
+
+import guidata.dataset as gds
+from guidata.env import execenv
+from guidata.io import HDF5Writer
+from guidata.tests.benchmarks import measure
+
+
+class Signal(gds.DataSet):
+    """Signal"""
+
+    title = gds.StringItem("Title", default="signal")
+    xlabel = gds.StringItem("X label", default="x")
+    ylabel = gds.StringItem("Y label", default="y")
+    offset = gds.FloatItem("Offset", default=0.0)
+    gain = gds.FloatItem("Gain", default=1.0)
+    enabled = gds.BoolItem("Enabled", default=True)
+    data = gds.FloatArrayItem("Data", default=np.zeros(10))
+
+
+def save_workspace(fname: str, signals: list[Signal], mode: str) -> None:
+    """Save all signals of the workspace"""
+    with HDF5Writer(fname, mode=mode) as writer:
+        for index, signal in enumerate(signals):
+            writer.write(signal, f"signal{index:04d}")
+
+
+def run_h5update_benchmark(count: int, size: int, repeat: int) -> None:
+    """Compare full and incremental autosave of a workspace"""
+    rng = np.random.default_rng(0)
+    signals = []
+    for _index in range(count):
+        signal = Signal()
+        signal.data = rng.normal(size=size)
+        signals.append(signal)
+    with tempfile.TemporaryDirectory() as dirname:
+        fname = osp.join(dirname, "workspace.h5")
+        save_workspace(fname, signals, "w")
+        save_workspace(fname, signals, "a")  # All items are now marked as clean
+
+        def edit():
+            signals[count // 2].gain += 1.0
+            signals[count // 3].data = signals[count // 3].data + 1.0
+
+        def autosave_full():
+            edit()
+            save_workspace(fname, signals, "w")
+
+        def autosave_update():
+            edit()
+            save_workspace(fname, signals, "a")
+
+        t_full = measure(autosave_full, repeat)
+        t_update = measure(autosave_update, repeat)
+    execenv.print(f"Autosave of {count} signals ({size} points) after 2 edits:")
+    execenv.print(f"  full rewrite  {t_full:8.4f} s")
+    execenv.print(f"  update        {t_update:8.4f} s")
+
+
+def test_h5update_benchmark():
+    """Benchmark HDF5 update mode"""
+    run_h5update_benchmark(count=20, size=100, repeat=1)
+
+
+if __name__ == "__main__":
+    run_h5update_benchmark(count=500, size=10_000, repeat=3)
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+JSON backend benchmark: `dataset_to_json` and `json_to_dataset` throughput for each
+available JSON backend
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+import guidata.dataset as gds
+from guidata.dataset.conv import dataset_to_json, json_to_dataset
+from guidata.env import execenv
+from guidata.io.jsonfmt import JSON_BACKENDS
+from guidata.tests.benchmarks import measure
+
+
+class Image(gds.DataSet):
+    """Image"""
+
+    title = gds.StringItem("Title", default="image")
+    gain = gds.FloatItem("Gain", default=1.0)
+    data = gds.FloatArrayItem("Data")
+    mask = gds.FloatArrayItem("Mask")
+
+
+def run_jsonbackend_benchmark(size: int, repeat: int) -> None:
+    """Compare the JSON backends on a dataset with large arrays"""
+    param = Image()
+    rng = np.random.default_rng(0)
+    param.data = rng.normal(size=(size, size))
+    param.mask = rng.integers(0, 255, size=(size, size), dtype=np.uint8)
+    texts = {}
+    execenv.print(f"JSON conversion of a dataset with {size}x{size} arrays:")
+    execenv.print(f"  {'backend':10s}{'to JSON (MB/s)':>16s}{'from JSON (MB/s)':>18s}")
+    for name, klass in JSON_BACKENDS.items():
+        if not klass.is_available():
+            execenv.print(f"  {name:10s}{'(not installed)':>16s}")
+            continue
+        text = texts[name] = dataset_to_json(param, backend=name)
+        result = json_to_dataset(text, backend=name)
+        assert np.array_equal(result.data, param.data)
+        assert np.array_equal(result.mask, param.mask)
+        size_mb = len(text) / 1e6
+        t_dump = measure(lambda name=name: dataset_to_json(param, backend=name), repeat)
+        t_load = measure(lambda name=name: json_to_dataset(text, backend=name), repeat)
+        execenv.print(f"  {name:10s}{size_mb / t_dump:16.1f}{size_mb / t_load:18.1f}")
+    # The documents written by every backend are read by every other backend
+    for text in texts.values():
+        for name in texts:
+            result = json_to_dataset(text, backend=name)
+            assert np.array_equal(result.data, param.data)
+
+
+def test_jsonbackend_benchmark():
+    """Benchmark JSON backends"""
+    run_jsonbackend_benchmark(size=20, repeat=1)
+
+
+if __name__ == "__main__":
+    run_jsonbackend_benchmark(size=1000, repeat=3)
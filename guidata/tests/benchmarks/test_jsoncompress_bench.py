@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+JSON file compression benchmark: file size, write time and read time of an object
+list for each compression codec
+"""
+
+from __future__ import annotations
+
+import os
+import os.path as osp
+import tempfile
+
+import numpy as np
+
+import guidata.dataset as gds
+from guidata.env import execenv
+from guidata.io import JSONReader, JSONWriter
+from guidata.io.jsonfmt import FILE_CODECS
+from guidata.tests.benchmarks import measure
+
+
+class Signal(gds.DataSet):
+    """Signal"""
+
+    title = gds.StringItem("Title", default="signal")
+    gain = gds.FloatItem("Gain", default=1.0)
+    xdata = gds.FloatArrayItem("X", default=np.linspace(0.0, 10.0, 100))
+    ydata = gds.FloatArrayItem("Y", default=np.zeros(100))
+
+
+def run_jsoncompress_benchmark(count: int, repeat: int) -> None:
+    """Compare the compression codecs of JSON files"""
+    objs = [Signal() for _index in range(count)]
+    for index, obj in enumerate(objs):
+        obj.ydata = np.sin(obj.xdata * index).round(6)
+    extensions = {None: ".json"}
+    for name, (_open, codec_extensions, _magic) in FILE_CODECS.items():
+        extensions[name] = ".json" + codec_extensions[0]
+    execenv.print(f"JSON file with {count} data sets:")
+    execenv.print(f"  {'codec':8s}{'size (MB)':>10s}{'ratio':>8s}", end="")
+    execenv.print(f"{'write (s)':>11s}{'read (s)':>10s}")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        plain_size = None
+        for codec, ext in extensions.items():
+            fname = osp.join(tmpdir, "objects" + ext)
+
+            def write(fname=fname):
+                writer = JSONWriter(fname, streaming=True)
+                writer.write_object_list(objs, "objs")
+                writer.save()
+
+            def read(fname=fname):
+                reader = JSONReader(fname, streaming=True)
+                result = list(reader.iter_object_list("objs", Signal))
+                assert len(result) == count
+                assert np.array_equal(result[-1].ydata, objs[-1].ydata)
+
+            t_write = measure(write, repeat)
+            t_read = measure(read, repeat)
+            size = os.path.getsize(fname) / 1e6
+            plain_size = plain_size or size
+            execenv.print(
+                f"  {codec or 'none':8s}{size:10.2f}{plain_size / size:8.1f}"
+                f"{t_write:11.3f}{t_read:10.3f}"
+            )
+
+
+def test_jsoncompress_benchmark():
+    """Benchmark JSON file compression"""
+    run_jsoncompress_benchmark(count=20, repeat=1)
+
+
+if __name__ == "__main__":
+    run_jsoncompress_benchmark(count=5000, repeat=3)
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+JSON array encoding benchmark: nested lists vs. binary (base64) form
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from guidata.env import execenv
+from guidata.io import JSONReader, JSONWriter
+from guidata.tests.benchmarks import measure
+
+
+def run_jsonfmt_benchmark(size: int, repeat: int) -> None:
+    """Compare array encodings in terms of size and speed"""
+    arr = np.random.default_rng(0).normal(size=size)
+    execenv.print(f"JSON round-trip of a {size}-element float64 array:")
+    execenv.print(f"  {'encoding':12s} {'size (MB)':>10s} {'write (s)':>10s}", end="")
+    execenv.print(f" {'read (s)':>10s}")
+    for label, options in (
+        ("lists", {}),
+        ("binary", {"binary_arrays": True}),
+        ("binary+zlib", {"binary_arrays": True, "compression": "zlib"}),
+    ):
+        writer = JSONWriter(None, **options)
+        writer.write(arr, "data")
+        texts = []
+        t_write = measure(lambda: texts.append(writer.get_json()), repeat)
+        text = texts[-1]
+        values = []
+        t_read = measure(lambda: values.append(JSONReader(text).read("data")), repeat)
+        assert np.array_equal(values[-1], arr)
+        execenv.print(
+            f"  {label:12s} {len(text) / 1e6:10.2f} {t_write:10.3f} {t_read:10.3f}"
+        )
+
+
+def test_jsonfmt_benchmark():
+    """Benchmark JSON array encodings"""
+    run_jsonfmt_benchmark(size=10_000, repeat=1)
+
+
+if __name__ == "__main__":
+    run_jsonfmt_benchmark(size=10_000_000, repeat=1)
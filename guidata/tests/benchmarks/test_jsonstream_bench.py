@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+JSON streaming benchmark: writing and reading a large object list, in normal and
+streaming modes (time and peak memory)
+"""
+
+from __future__ import annotations
+
+import os
+import os.path as osp
+import tempfile
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+
+import guidata.dataset as gds
+from guidata.env import execenv
+from guidata.io import JSONReader, JSONWriter
+from guidata.tests.benchmarks import measure
+
+
+class Signal(gds.DataSet):
+    """Signal"""
+
+    title = gds.StringItem("Title", default="signal")
+    gain = gds.FloatItem("Gain", default=1.0)
+    offset = gds.FloatItem("Offset", default=0.0)
+    data = gds.FloatArrayItem("Data", default=np.zeros(10))
+
+
+def measure_peak(func: Callable[[], Any]) -> float:
+    """Return the peak memory allocated by `func` (in MB)"""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 1e6
+    finally:
+        tracemalloc.stop()
+
+
+def run_jsonstream_benchmark(count: int, repeat: int) -> None:
+    """Compare normal and streaming JSON I/O of an object list"""
+    objs = [Signal() for _index in range(count)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fname = osp.join(tmpdir, "objects.json")
+        results = {}
+        for streaming in (False, True):
+
+            def write(streaming=streaming):
+                writer = JSONWriter(fname, streaming=streaming)
+                writer.write_object_list(objs, "objs")
+                writer.save()
+
+            def read(streaming=streaming):
+                reader = JSONReader(fname, streaming=streaming)
+                total = 0.0
+                for obj in reader.iter_object_list("objs", Signal):
+                    total += obj.gain
+                assert total == count
+
+            results[streaming] = (
+                measure(write, repeat),
+                measure_peak(write),
+                measure(read, repeat),
+                measure_peak(read),
+            )
+        size = os.path.getsize(fname) / 1e6
+    execenv.print(f"JSON I/O of {count} data sets ({size:.1f} MB):")
+    execenv.print(f"  {'mode':10s}{'write (s)':>10s}{'peak (MB)':>10s}", end="")
+    execenv.print(f"{'read (s)':>10s}{'peak (MB)':>10s}")
+    for streaming, (t_write, m_write, t_read, m_read) in results.items():
+        label = "streaming" if streaming else "normal"
+        execenv.print(
+            f"  {label:10s}{t_write:10.3f}{m_write:10.1f}{t_read:10.3f}{m_read:10.1f}"
+        )
+
+
+def test_jsonstream_benchmark():
+    """Benchmark JSON streaming I/O"""
+    run_jsonstream_benchmark(count=100, repeat=1)
+
+
+if __name__ == "__main__":
+    run_jsonstream_benchmark(count=100_000, repeat=1)
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+JSON array decoding benchmark: reading a document with many small lists (e.g.
+coordinates), with and without legacy array detection, for each JSON backend
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from guidata.env import execenv
+from guidata.io import JSONReader, JSONWriter
+from guidata.io.jsonfmt import JSON_BACKENDS
+from guidata.tests.benchmarks import measure
+
+
+def run_jsontags_benchmark(count: int, repeat: int) -> None:
+    """Compare JSON decoding with and without legacy array detection"""
+    writer = JSONWriter(None, tagged_arrays=True)
+    for index in range(count):
+        with writer.group(f"shape{index:05d}"):
+            writer.write([[index, index + 1, index + 2]] * 20, "points")
+            writer.write([255, 128, 0], "color")
+            writer.write(np.arange(3.0), "data")
+    text = writer.get_json()
+    execenv.print(f"Decoding {count} groups with 21 small lists ({len(text)} bytes):")
+    execenv.print(f"  {'backend':10s}{'legacy (s)':>12s}{'tags only (s)':>15s}")
+    for name, klass in JSON_BACKENDS.items():
+        if not klass.is_available():
+            continue
+        timings = []
+        for legacy_arrays in (True, False):
+
+            def read(name=name, legacy_arrays=legacy_arrays):
+                reader = JSONReader(text, backend=name, legacy_arrays=legacy_arrays)
+                with reader.group("shape00000"):
+                    assert reader.read("color") == [255, 128, 0]
+                    assert np.array_equal(reader.read("data"), np.arange(3.0))
+
+            timings.append(measure(read, repeat))
+        execenv.print(f"  {name:10s}{timings[0]:12.3f}{timings[1]:15.3f}")
+
+
+def test_jsontags_benchmark():
+    """Benchmark JSON array decoding"""
+    run_jsontags_benchmark(count=100, repeat=1)
+
+
+if __name__ == "__main__":
+    run_jsontags_benchmark(count=20_000, repeat=3)
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+Default value benchmark: creating many data sets with mutable default values
+"""
+
+from __future__ import annotations
+
+from copy import deepcopy
+
+import numpy as np
+
+import guidata.dataset as gds
+from guidata.dataset.datatypes import DataItemValidationError
+from guidata.env import execenv
+from guidata.tests.benchmarks import measure
+
+
+class CopyingMixin:
+    """Data item copying and validating its default value for each instance
+    (former code)"""
+
+    def set_default(self, instance: gds.DataSet) -> None:
+        """Set data item's value to default"""
+        try:
+            value = deepcopy(self._default)
+            self._set_value_with_validation(instance, value, force_allow_none=True)
+        except ValueError as exc:
+            raise DataItemValidationError(str(exc)) from exc
+
+
+class CopyingFloatItem(CopyingMixin, gds.FloatItem):
+    """Float item copying its default value"""
+
+
+class CopyingStringItem(CopyingMixin, gds.StringItem):
+    """String item copying its default value"""
+
+
+class CopyingFloatArrayItem(CopyingMixin, gds.FloatArrayItem):
+    """Float array item copying its default value"""
+
+
+class CopyingDictItem(CopyingMixin, gds.DictItem):
+    """Dictionary item copying its default value"""
+
+
+class Acquisition(gds.DataSet):
+    """Acquisition"""
+
+    exposure = gds.FloatItem("Exposure", default=0.1)
+    label = gds.StringItem("Label", default="acquisition")
+    background = gds.FloatArrayItem("Background", default=np.zeros((64, 64)))
+    metadata = gds.DictItem("Metadata", default={"unit": "s", "tags": ["raw"]})
+
+
+class CopyingAcquisition(gds.DataSet):
+    """Acquisition"""
+
+    exposure = CopyingFloatItem("Exposure", default=0.1)
+    label = CopyingStringItem("Label", default="acquisition")
+    background = CopyingFloatArrayItem("Background", default=np.zeros((64, 64)))
+    metadata = CopyingDictItem("Metadata", default={"unit": "s", "tags": ["raw"]})
+
+
+def run_lazy_defaults_benchmark(count: int, repeat: int) -> None:
+    """Compare copy-on-access defaults with copying defaults for each instance"""
+    execenv.print(f"Creation of {count} data sets with mutable defaults:")
+    for label, klass in (("copy", CopyingAcquisition), ("lazy", Acquisition)):
+        elapsed = measure(lambda klass=klass: [klass() for _ in range(count)], repeat)
+        execenv.print(f"  {label:5s} {elapsed:8.3f} s")
+    param1, param2 = Acquisition(), Acquisition()
+    param1.background[0, 0] = 1.0
+    assert param2.background[0, 0] == 0.0
+
+
+def test_lazy_defaults_benchmark():
+    """Benchmark copy-on-access default values"""
+    run_lazy_defaults_benchmark(count=200, repeat=1)
+
+
+if __name__ == "__main__":
+    run_lazy_defaults_benchmark(count=100_000, repeat=3)
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+NumPy directory benchmark: serializing an object list of many small data sets, and
+reading a large array, compared to HDF5 files
+"""
+
+from __future__ import annotations
+
+import os.path as osp
+import tempfile
+
+import numpy as np
+
+import guidata.dataset as gds
+from guidata.env import execenv
+from guidata.io import HDF5Reader, HDF5Writer, NPYReader, NPYWriter
+from guidata.tests.benchmarks import measure
+
+
+class Frame(gds.DataSet):
+    """Frame parameters"""
+
+    index = gds.IntItem("Index", default=0)
+    exposure = gds.FloatItem("Exposure", default=0.1)
+    label = gds.StringItem("Label", default="frame")
+    enabled = gds.BoolItem("Enabled", default=True)
+    roi = gds.FloatArrayItem("ROI", default=np.zeros(4))
+
+
+class Image(gds.DataSet):
+    """Image"""
+
+    title = gds.StringItem("Title", default="image")
+    data = gds.FloatArrayItem("Data")
+
+
+def run_npydir_benchmark(count: int, size: int, repeat: int) -> None:
+    """Compare NumPy directories with HDF5 files"""
+    frames = []
+    for index in range(count):
+        frame = Frame()
+        frame.index = index
+        frames.append(frame)
+    image = Image()
+    image.data = np.random.default_rng(0).normal(size=(size, size))
+    execenv.print(f"Object list of {count} data sets, image of {size}x{size} pixels:")
+    execenv.print(f"  {'format':8s}{'write (s)':>11s}{'read (s)':>10s}", end="")
+    execenv.print(f"{'image read (ms)':>17s}")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for label, wclass, rclass, path in (
+            ("hdf5", HDF5Writer, HDF5Reader, osp.join(tmpdir, "data.h5")),
+            ("npy", NPYWriter, NPYReader, osp.join(tmpdir, "data")),
+        ):
+
+            def write(wclass=wclass, path=path):
+                writer = wclass(path)
+                writer.write_object_list(frames, "frames")
+                writer.write(image, "image")
+                writer.close()
+
+            def read(rclass=rclass, path=path):
+                reader = rclass(path)
+                result = reader.read_object_list("frames", Frame)
+                reader.close()
+                assert [frame.index for frame in result] == list(range(count))
+
+            def read_image(rclass=rclass, path=path):
+                reader = rclass(path)
+                result = reader.read("image", instance=Image())
+                reader.close()
+                assert result.data[-1, -1] == image.data[-1, -1]
+
+            t_write = measure(write, repeat)
+            t_read = measure(read, repeat)
+            t_image = measure(read_image, repeat) * 1e3
+            execenv.print(f"  {label:8s}{t_write:11.3f}{t_read:10.3f}{t_image:17.2f}")
+
+
+def test_npydir_benchmark():
+    """Benchmark NumPy directories"""
+    run_npydir_benchmark(count=50, size=10, repeat=1)
+
+
+if __name__ == "__main__":
+    run_npydir_benchmark(count=1000, size=4000, repeat=3)
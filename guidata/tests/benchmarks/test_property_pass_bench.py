@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+Item property benchmark: refreshing the state of the widgets of a large dialog, in
+which many items share the same `active` properties
+"""
+
+from __future__ import annotations
+
+from qtpy import QtWidgets as QW
+
+import guidata.dataset as gds
+from guidata.dataset.qtwidgets import DataSetEditLayout
+from guidata.env import execenv
+from guidata.qthelpers import qt_app_context
+from guidata.tests.benchmarks import measure
+
+
+def create_parameters_class(size: int) -> type[gds.DataSet]:
+    """Create a DataSet class with `size` items depending on two choices"""
+    mode = gds.GetAttrProp("mode")
+    method = gds.GetAttrProp("method")
+    props = [
+        gds.FuncProp(mode, lambda value: value == "advanced"),
+        gds.FuncPropMulti(
+            [mode, method], lambda value1, value2: value1 == "advanced" and value2 > 0
+        ),
+        gds.NotProp(gds.FuncProp(method, lambda value: value == 0)),
+    ]
+    dct = {
+        "mode": gds.ChoiceItem(
+            "Mode", (("basic", "Basic"), ("advanced", "Advanced")), default="advanced"
+        ).set_prop("display", store=mode),
+        "method": gds.ChoiceItem("Method", ((0, "A"), (1, "B"), (2, "C"))).set_prop(
+            "display", store=method
+        ),
+    }
+    for index in range(size):
+        dct[f"x{index}"] = gds.FloatItem(f"X{index}").set_prop(
+            "display", active=props[index % len(props)]
+        )
+    return type("Parameters", (gds.DataSet,), dct)
+
+
+def run_property_pass_benchmark(size: int, refreshes: int, repeat: int) -> None:
+    """Compare widget state refreshes with and without evaluation passes"""
+    with qt_app_context():
+        param = create_parameters_class(size)()
+        widget = QW.QWidget()
+        layout = DataSetEditLayout(widget, param, QW.QGridLayout())
+
+        def refresh_without_pass():
+            for _index in range(refreshes):
+                for widget in layout.widgets:
+                    widget.set_state()
+
+        def refresh_with_pass():
+            for _index in range(refreshes):
+                layout.refresh_widgets()
+
+        t_without = measure(refresh_without_pass, repeat)
+        t_with = measure(refresh_with_pass, repeat)
+        states = [widget.is_active() for widget in layout.widgets]
+        param.mode = "basic"
+        layout.refresh_widgets()
+        assert [widget.is_active() for widget in layout.widgets] != states
+        with gds.property_evaluation_pass():
+            assert [widget.is_active() for widget in layout.widgets] == [
+                item.get_prop_value("display", param, "active", True)
+                for item in param.get_items()
+            ]
+    execenv.print(f"{refreshes} state refreshes of a dialog with {size} items (ms):")
+    execenv.print(f"  without evaluation pass: {t_without * 1e3:10.1f}")
+    execenv.print(f"  with evaluation pass:    {t_with * 1e3:10.1f}")
+
+
+def test_property_pass_benchmark():
+    """Benchmark evaluation passes of item properties"""
+    run_property_pass_benchmark(30, 2, 1)
+
+
+if __name__ == "__main__":
+    run_property_pass_benchmark(500, 20, 3)
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+Selective refresh benchmark: typing in a large parameter dialog with a computed item
+"""
+
+from __future__ import annotations
+
+from qtpy import QtWidgets as QW
+
+import guidata.dataset as gds
+from guidata.dataset.qtwidgets import DataSetEditLayout
+from guidata.env import execenv
+from guidata.qthelpers import qt_app_context
+from guidata.tests.benchmarks import measure
+
+
+def compute_gain(param: gds.DataSet) -> float:
+    """Compute the overall gain"""
+    return param.x0 * param.x1
+
+
+def create_parameters_class(size: int) -> type[gds.DataSet]:
+    """Create a DataSet class with `size` float items, part of them depending on a
+    boolean item, and a computed item"""
+    enable = gds.GetAttrProp("enable")
+    dct = {"enable": gds.BoolItem("Enable").set_prop("display", store=enable)}
+    for index in range(size):
+        item = gds.FloatItem(f"X{index}", default=float(index))
+        if index % 2:
+            item.set_prop("display", active=enable)
+        dct[f"x{index}"] = item
+    dct["gain"] = gds.FloatItem("Gain").set_computed(compute_gain)
+    return type("Parameters", (gds.DataSet,), dct)
+
+
+def run_selective_refresh_benchmark(size: int, edits: int, repeat: int) -> None:
+    """Compare full and selective refreshes after editing an item"""
+    with qt_app_context():
+        param = create_parameters_class(size)()
+        layout = DataSetEditLayout(QW.QWidget(), param, QW.QGridLayout())
+        widget = layout.widgets[-2]
+        name = widget.item.item.get_name()
+
+        def refresh_all():
+            for _index in range(edits):
+                layout.update_widgets(except_this_one=widget)
+                layout.refresh_widgets()
+
+        def refresh_selection():
+            for _index in range(edits):
+                layout.update_widgets(except_this_one=widget, names=[name])
+                layout.refresh_widgets(names=[name])
+
+        t_all = measure(refresh_all, repeat)
+        t_selection = measure(refresh_selection, repeat)
+        graph = layout.get_dependency_graph()
+        assert len(graph.get_value_widgets(["x1"])) == 2
+        assert len(graph.get_state_widgets(["enable"])) == size // 2
+    execenv.print(f"{edits} edits in a dialog with {size} items (ms):")
+    execenv.print(f"  full refresh:      {t_all * 1e3:10.1f}")
+    execenv.print(f"  selective refresh: {t_selection * 1e3:10.1f}")
+
+
+def test_selective_refresh_benchmark():
+    """Benchmark selective refresh of widgets"""
+    run_selective_refresh_benchmark(20, 2, 1)
+
+
+if __name__ == "__main__":
+    run_selective_refresh_benchmark(500, 20, 3)
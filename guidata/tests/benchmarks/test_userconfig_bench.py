@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+UserConfig benchmark: per-item saves vs. transaction (one file write per save)
+"""
+
+from __future__ import annotations
+
+import os.path as osp
+import tempfile
+
+import guidata.dataset as gds
+from guidata.env import execenv
+from guidata.io import INIWriter
+from guidata.tests.benchmarks import measure
+from guidata.userconfig import UserConfig
+
+
+class TempUserConfig(UserConfig):
+    """UserConfig saved in a given directory"""
+
+    def __init__(self, dirname: str) -> None:
+        super().__init__({})
+        self.dirname = dirname
+
+    def filename(self) -> str:
+        """Return configuration file name"""
+        return osp.join(self.dirname, "bench.ini")
+
+
+def make_dataset_class(size: int) -> type[gds.DataSet]:
+    """Return a DataSet class with `size` float items"""
+    items = {
+        f"item{idx:03d}": gds.FloatItem(f"Item {idx}", default=float(idx))
+        for idx in range(size)
+    }
+    return type("BenchParameters", (gds.DataSet,), items)
+
+
+def run_userconfig_benchmark(size: int, repeat: int) -> None:
+    """Compare per-item saves with batched saves"""
+    param = make_dataset_class(size)()
+    with tempfile.TemporaryDirectory() as dirname:
+        conf = TempUserConfig(dirname)
+
+        def per_item():
+            param.serialize(INIWriter(conf, "per_item", "param"))
+
+        def batched():
+            param.write_config(conf, "batched", "param")
+
+        t_item, t_batch = measure(per_item, repeat), measure(batched, repeat)
+        assert conf.get_section("per_item") == conf.get_section("batched")
+        reread = TempUserConfig(dirname)
+        reread.read(reread.filename(), encoding="utf-8")
+        assert reread.get_section("batched") == conf.get_section("batched")
+    execenv.print(f"UserConfig save of a {size}-item dataset:")
+    execenv.print(f"  per-item saves: {t_item * 1e3:8.2f} ms")
+    execenv.print(f"  transaction:    {t_batch * 1e3:8.2f} ms")
+
+
+def test_userconfig_benchmark():
+    """Benchmark UserConfig transaction vs. per-item saves"""
+    run_userconfig_benchmark(size=10, repeat=1)
+
+
+if __name__ == "__main__":
+    run_userconfig_benchmark(size=60, repeat=5)
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+Test selective refresh of the widgets of a data set layout, based on the
+dependencies of the widgets on the items
+"""
+
+from __future__ import annotations
+
+from qtpy import QtWidgets as QW
+
+import guidata.dataset as gds
+from guidata.dataset.qtwidgets import DataSetEditLayout
+from guidata.env import execenv
+from guidata.qthelpers import qt_app_context
+
+
+class Parameters(gds.DataSet):
+    """Parameters"""
+
+    def compute_sum(self) -> float:
+        """Compute the sum of x1 and x2"""
+        return self.x1 + self.x2
+
+    _enable = gds.GetAttrProp("enable")
+    _flag = gds.ValueProp(True)
+    enable = gds.BoolItem("Enable", default=True).set_prop("display", store=_enable)
+    x1 = gds.FloatItem("x1", default=1.0)
+    x2 = gds.FloatItem("x2", default=2.0).set_prop("display", active=_enable)
+    x3 = gds.FloatItem("x3", default=3.0).set_prop("display", active=_flag)
+    _bg = gds.BeginGroup("Group").set_prop("display", active=_enable)
+    x4 = gds.FloatItem("x4", default=4.0)
+    total = gds.FloatItem("Sum").set_computed(compute_sum)
+    _eg = gds.EndGroup("Group")
+
+
+def get_names(widgets: list) -> list[str]:
+    """Return the item names of widgets"""
+    return [widget.item.item.get_name() for widget in widgets]
+
+
+def test_selective_refresh():
+    """Test selective refresh of widgets"""
+    with qt_app_context():
+        param = Parameters()
+        layout = DataSetEditLayout(QW.QWidget(), param, QW.QGridLayout())
+        graph = layout.get_dependency_graph()
+        assert get_names(graph.widgets) == [
+            "enable",
+            "x1",
+            "x2",
+            "x3",
+            "_bg",
+            "x4",
+            "total",
+        ]
+        # Sum has been computed: it depends on x1 and x2 only
+        assert get_names(graph.get_value_widgets(["x1"])) == ["x1", "total"]
+        assert get_names(graph.get_value_widgets(["x4"])) == ["x4"]
+        # ValueProp may change at any time: x3 state is always refreshed
+        assert get_names(graph.get_state_widgets(["x1"])) == ["x3"]
+        assert get_names(graph.get_state_widgets(["enable"])) == ["x2", "x3", "_bg"]
+
+        x2_widget = graph.widgets[2]
+        param.enable = False
+        layout.refresh_widgets(names=["x1"])
+        assert x2_widget.label.isEnabled()
+        layout.refresh_widgets(names=["enable"])
+        assert not x2_widget.label.isEnabled()
+
+        total_widget = graph.widgets[-1]
+        param.x1 = 10.0
+        layout.update_widgets(names=["x4"])
+        assert total_widget.value() == "3.0"
+        layout.update_widgets(names=["x1"])
+        assert total_widget.value() == "12.0"
+
+        # Adding widgets invalidates the graph
+        layout.build_widget(get_item("x1"))
+        assert layout.get_dependency_graph() is not graph
+        execenv.print("OK")
+
+
+def get_item(name: str) -> gds.DataItem:
+    """Return an item of Parameters"""
+    return next(item for item in Parameters._items if item.get_name() == name)
+
+
+if __name__ == "__main__":
+    test_selective_refresh()
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+Test precompiled attribute access plans of data items
+"""
+
+from __future__ import annotations
+
+import pytest
+
+import guidata.dataset as gds
+from guidata.config import ValidationMode, temporary_validation_mode
+from guidata.dataset.datatypes import DataItemAccessPlan
+
+
+class Parameters(gds.DataSet):
+    """Parameters"""
+
+    def compute_double(self) -> float:
+        """Return twice the width"""
+        return 2 * self.width
+
+    width = gds.FloatItem("Width", default=1.0, min=0.0)
+    height = gds.FloatItem("Height", default=2.0, min=0.0)
+    double = gds.FloatItem("Double").set_computed(compute_double)
+
+
+def test_access_plan_compiled():
+    """Test that plans are compiled when the DataSet class is created"""
+    for item in Parameters._items:
+        assert isinstance(item._plan, DataItemAccessPlan)
+    plan = Parameters.width.get_access_plan()
+    assert plan.attr_name == "_width" and plan.computed is None
+    assert plan.check and not plan.allow_none
+    assert Parameters.double.get_access_plan().computed is not None
+
+
+def test_access_plan_invalidation():
+    """Test that plans follow `set_prop` and `set_computed`"""
+
+    class LocalParameters(gds.DataSet):
+        """Local parameters"""
+
+        value = gds.FloatItem("Value", default=1.0, min=0.0)
+        other = gds.FloatItem("Other", default=3.0)
+
+    param = LocalParameters()
+    with temporary_validation_mode(ValidationMode.STRICT):
+        with pytest.raises(gds.DataItemValidationError):
+            param.value = -1.0
+        LocalParameters.value.set_prop("data", check_value=False)
+        param.value = -1.0
+        assert param.value == -1.0
+        LocalParameters.value.set_prop("data", check_value=True)
+        with pytest.raises(gds.DataItemValidationError):
+            param.value = None
+        LocalParameters.value.set_prop("data", allow_none=True)
+        param.value = None
+        assert param.value is None
+    LocalParameters.value.set_computed(lambda ds: ds.other * 10)
+    assert param.value == 30.0
+    with pytest.raises(ValueError):
+        param.value = 1.0
+    # Display properties do not invalidate the plan
+    plan = LocalParameters.other.get_access_plan()
+    LocalParameters.other.set_prop("display", label="Other label")
+    assert LocalParameters.other.get_access_plan() is plan
+
+
+def test_access_plan_values():
+    """Test item values through access plans"""
+    param = Parameters()
+    assert (param.width, param.height, param.double) == (1.0, 2.0, 2.0)
+    param.width = 4.0
+    assert param.double == 8.0
+    with pytest.raises(ValueError):
+        param.double = 1.0
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+Test batch validation of data item values
+"""
+
+from __future__ import annotations
+
+import warnings
+
+import numpy as np
+import pytest
+
+import guidata.dataset as gds
+from guidata.config import ValidationMode, temporary_validation_mode
+
+
+class Sweep(gds.DataSet):
+    """Sweep parameters"""
+
+    gain = gds.FloatItem("Gain", default=1.0, min=0.0, max=10.0)
+    offset = gds.FloatItem("Offset", default=1.0, nonzero=True, allow_none=True)
+    count = gds.IntItem("Count", default=2, min=0, even=True)
+    name = gds.StringItem("Name", default="sweep", notempty=True)
+    free = gds.IntItem("Free", default=-5, max=0, check=False)
+
+
+def scalar_mask(item: gds.DataItem, values) -> np.ndarray:
+    """Return the mask obtained by checking values one by one"""
+    return np.array(
+        [item.check_value(item._convert_value(value)) for value in values], dtype=bool
+    )
+
+
+def test_check_values_vectorized():
+    """Test that vectorized checks match scalar checks"""
+    rng = np.random.default_rng(0)
+    gains = np.concatenate([rng.uniform(-5, 15, 1000), [np.nan, 0.0, 10.0]])
+    mask = Sweep.gain.check_values(gains)
+    assert np.array_equal(mask, scalar_mask(Sweep.gain, gains))
+    offsets = np.array([0.0, -1.0, 1.0, np.nan])
+    assert list(Sweep.offset.check_values(offsets)) == [False, True, True, True]
+    counts = rng.integers(-10, 10, 1000)
+    mask = Sweep.count.check_values(counts)
+    assert np.array_equal(mask, scalar_mask(Sweep.count, counts))
+    assert np.array_equal(mask, (counts >= 0) & (counts % 2 == 0))
+    # Values of other types are checked one by one
+    assert list(Sweep.gain.check_values([1, 2.0, "3", None, 20])) == [
+        True,
+        True,
+        False,
+        False,
+        False,
+    ]
+    assert list(Sweep.offset.check_values([None, 0])) == [True, False]
+    assert list(Sweep.count.check_values([2.0, 4, True, np.int8(6)])) == [
+        False,
+        True,
+        False,
+        True,
+    ]
+    assert list(Sweep.name.check_values(["", "a"])) == [False, True]
+    # Items which are not checked
+    assert Sweep.free.check_values(np.arange(3)).all()
+
+
+def test_check_many():
+    """Test DataSet.check_many"""
+    param = Sweep()
+    with temporary_validation_mode(ValidationMode.DISABLED):
+        mask, errors = param.check_many(
+            {"gain": np.array([1.0, 20.0, 2.0]), "count": [2, 4, 3]}
+        )
+    assert list(mask) == [True, False, False]
+    assert set(errors) == {"gain", "count"}
+    assert "1 invalid value(s) out of 3 (first at index 1" in errors["gain"]
+    assert "greater than maximum" in errors["gain"]
+    assert "not even" in errors["count"]
+    mask, errors = param.check_many({"gain": [1.0, 2.0]})
+    assert mask.all() and not errors
+    assert param.check_many({})[0].shape == (0,)
+    with pytest.raises(AttributeError):
+        param.check_many({"unknown": [1]})
+    with pytest.raises(ValueError):
+        param.check_many({"gain": [1.0], "count": [1, 2]})
+
+
+def test_check_many_validation_modes():
+    """Test validation modes in DataSet.check_many"""
+    param = Sweep()
+    values = {"gain": [1.0, -1.0]}
+    with temporary_validation_mode(ValidationMode.ENABLED):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            mask, errors = param.check_many(values)
+        assert list(mask) == [True, False] and "gain" in errors
+        assert len(caught) == 1
+        assert issubclass(caught[0].category, gds.DataItemValidationWarning)
+    with temporary_validation_mode(ValidationMode.STRICT):
+        with pytest.raises(gds.DataItemValidationError):
+            param.check_many(values)
+
+
+def test_dataarray_check():
+    """Test checking the records of a DataSetArray"""
+    records = gds.DataSetArray(Sweep, 5)
+    records["gain"] = [1.0, 2.0, -3.0, 4.0, 50.0]
+    records["name"] = ["a", "b", "c", "", "e"]
+    mask, errors = records.check()
+    assert list(mask) == [True, True, False, False, False]
+    assert set(errors) == {"gain", "name"}
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+Test compact data sets (`compact=True` class keyword)
+"""
+
+from __future__ import annotations
+
+import copy
+import pickle
+import weakref
+
+import numpy as np
+import pytest
+
+import guidata.dataset as gds
+
+
+class FrameParameters(gds.DataSet, compact=True):
+    """Frame parameters
+
+    Acquisition parameters of a frame"""
+
+    index = gds.IntItem("Index", default=0)
+    exposure = gds.FloatItem("Exposure", default=0.1)
+    label = gds.StringItem("Label", default="frame")
+    roi = gds.FloatArrayItem("ROI", default=np.zeros(4))
+
+
+class ExtendedFrameParameters(FrameParameters):
+    """Extended frame parameters"""
+
+    gain = gds.FloatItem("Gain", default=1.0)
+
+
+class StandardFrameParameters(gds.DataSet):
+    """Frame parameters"""
+
+    index = gds.IntItem("Index", default=0)
+
+
+def test_compact_dataset():
+    """Test compact data set instances"""
+    param = FrameParameters()
+    assert not hasattr(param, "__dict__")
+    assert param.index == 0 and param.exposure == 0.1 and param.label == "frame"
+    param.index = 5
+    param.exposure = 2.0
+    assert param.index == 5 and param.exposure == 2.0
+    with pytest.raises(AttributeError):
+        param.other = 1  # pylint: disable=attribute-defined-outside-init
+    assert weakref.ref(param)() is param
+    # Default title is shared by all instances
+    param2 = FrameParameters()
+    assert param.get_title() == "Frame parameters"
+    assert param.get_title() is param2.get_title()
+    param2.set_title("Custom")
+    assert param2.get_title() == "Custom"
+    assert FrameParameters(title="Other").get_title() == "Other"
+    # Copies
+    for clone in (
+        copy.copy(param),
+        copy.deepcopy(param),
+        pickle.loads(pickle.dumps(param)),
+    ):
+        gds.assert_datasets_equal(param, clone)
+        assert clone.get_title() == "Frame parameters"
+
+
+def test_compact_dataset_inheritance():
+    """Test that compactness is inherited"""
+    param = ExtendedFrameParameters()
+    assert not hasattr(param, "__dict__")
+    assert ExtendedFrameParameters.__slots__ == ("_gain",)
+    param.gain = 3.0
+    param.index = 2
+    assert (param.gain, param.index) == (3.0, 2)
+    assert param.get_title() == "Extended frame parameters"
+    assert hasattr(StandardFrameParameters(), "__dict__")
+
+
+def test_standard_dataset():
+    """Test that non-compact data sets keep their `__dict__` and weak references"""
+    param = StandardFrameParameters()
+    param.other = 1  # pylint: disable=attribute-defined-outside-init
+    assert vars(param)["other"] == 1
+    for instance in (param, gds.DataSet(), FrameParameters()):
+        assert weakref.ref(instance)() is instance
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+Test caching of computed item values
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+
+import numpy as np
+
+import guidata.dataset as gds
+from guidata.dataset.dataarray import DataSetArray
+from guidata.io import JSONReader, JSONWriter
+
+
+class Signal(gds.DataSet):
+    """Signal"""
+
+    def compute_mean(self) -> float:
+        """Compute the mean of the signal data"""
+        return float(np.mean(self.data)) * self.gain
+
+    def compute_scaled_mean(self) -> float:
+        """Compute the scaled mean (depends on another computed item)"""
+        return self.mean * self.scale
+
+    def compute_offset_gain(self) -> float:
+        """Compute the gain plus offset, reading the offset attribute directly"""
+        return self.gain + self._offset
+
+    data = gds.FloatArrayItem("Data", default=np.arange(4.0))
+    gain = gds.FloatItem("Gain", default=1.0)
+    scale = gds.FloatItem("Scale", default=2.0)
+    offset = gds.FloatItem("Offset", default=0.0)
+    label = gds.StringItem("Label", default="signal")
+    mean = gds.FloatItem("Mean").set_computed(compute_mean)
+    scaled_mean = gds.FloatItem("Scaled mean").set_computed(compute_scaled_mean)
+    offset_gain = gds.FloatItem("Offset gain").set_computed(
+        compute_offset_gain, depends_on=["offset"]
+    )
+    uncached = gds.FloatItem("Uncached").set_computed(compute_mean, cache=False)
+
+
+def get_prop(name: str) -> gds.ComputedProp:
+    """Return the computed property of an item of Signal"""
+    item = next(item for item in Signal._items if item.get_name() == name)
+    prop = item.get_prop("data", "computed")
+    prop.reset_stats()
+    return prop
+
+
+def test_computed_cache():
+    """Test that computed values are cached until a dependency is set"""
+    prop = get_prop("mean")
+    param = Signal()
+    assert param.mean == 1.5
+    assert param.mean == 1.5
+    assert prop.get_stats() == {"hits": 1, "misses": 1, "invalidations": 0}
+    # Setting an unrelated item keeps the cached value
+    param.label = "other"
+    assert param.mean == 1.5
+    assert prop.get_stats() == {"hits": 2, "misses": 1, "invalidations": 0}
+    # Setting a dependency invalidates the cached value
+    param.gain = 2.0
+    assert prop.invalidations == 1
+    assert param.mean == 3.0
+    param.data = np.arange(8.0)
+    assert param.mean == 7.0
+    assert prop.get_stats() == {"hits": 2, "misses": 3, "invalidations": 2}
+    # Caches are per instance
+    assert Signal().mean == 1.5
+
+
+def test_computed_cache_nested():
+    """Test dependencies of computed items depending on other computed items"""
+    param = Signal()
+    assert param.scaled_mean == 3.0
+    param.scale = 3.0
+    assert param.scaled_mean == 4.5
+    # Dependencies of the inner computed item are dependencies of the outer one
+    param.gain = 2.0
+    assert param.scaled_mean == 9.0
+    assert param.mean == 3.0
+
+
+def test_computed_cache_options():
+    """Test explicit dependencies and disabled caching"""
+    param = Signal()
+    assert param.offset_gain == 1.0
+    param.offset = 1.0
+    assert param.offset_gain == 2.0
+    param.gain = 3.0
+    assert param.offset_gain == 4.0
+    prop = get_prop("uncached")
+    assert param.uncached == param.uncached == 4.5
+    assert prop.get_stats() == {"hits": 0, "misses": 2, "invalidations": 0}
+
+
+def test_computed_cache_reset():
+    """Test that setting defaults and deserializing clear cached values"""
+    param = Signal()
+    param.gain = 2.0
+    assert param.mean == 3.0
+    writer = JSONWriter()
+    param.serialize(writer)
+    param.set_defaults()
+    assert param.mean == 1.5
+    param.deserialize(JSONReader(writer.get_json()))
+    assert param.mean == 3.0
+    # Setting the default value of a single item
+    gain_item = next(item for item in Signal._items if item.get_name() == "gain")
+    gain_item.set_default(param)
+    assert param.mean == 1.5
+    assert param.changed_items() == []
+
+
+class SlowSignal(gds.DataSet):
+    """Signal which computation waits for another thread"""
+
+    started = threading.Event()
+    resume = threading.Event()
+
+    def compute_mean(self) -> float:
+        """Compute the mean of the signal data, waiting for another thread"""
+        self.started.set()
+        self.resume.wait(5.0)
+        return float(np.mean(self.data))
+
+    data = gds.FloatArrayItem("Data", default=np.arange(4.0))
+    label = gds.StringItem("Label", default="signal")
+    mean = gds.FloatItem("Mean").set_computed(compute_mean)
+
+
+def test_computed_cache_threads():
+    """Test that items read by other threads are not recorded as dependencies"""
+    param = SlowSignal()
+    thread = threading.Thread(target=lambda: param.mean)
+    thread.start()
+    assert SlowSignal.started.wait(5.0)
+    # Read while the computation is in progress in the other thread
+    assert param.label == "signal"
+    SlowSignal.resume.set()
+    thread.join()
+    item = next(item for item in SlowSignal._items if item.get_name() == "mean")
+    prop = item.get_prop("data", "computed")
+    prop.reset_stats()
+    param.label = "other"
+    assert param.mean == 1.5
+    assert prop.invalidations == 0
+
+
+def test_computed_cache_copy():
+    """Test that copies do not share cached values and change journals"""
+    for copy_func in (copy.copy, copy.deepcopy):
+        param = Signal()
+        param.set_journal_enabled(True)
+        assert param.mean == 1.5
+        clone = copy_func(param)
+        clone.gain = 2.0
+        assert clone.mean == 3.0 and param.mean == 1.5
+        param.gain = 4.0
+        assert param.mean == 6.0 and clone.mean == 3.0
+        assert [name for name, _old, _new in param.get_journal()] == ["gain"]
+        assert [name for name, _old, _new in clone.get_journal()] == ["gain"]
+        with param.track_changes() as names:
+            clone = copy_func(param)
+            clone.label = "clone"
+            with clone.track_changes() as clone_names:
+                clone.scale = 3.0
+            param.offset = 1.0
+        assert names == {"offset"} and clone_names == {"scale"}
+
+
+def test_computed_cache_dataarray():
+    """Test that row views of columnar data sets do not cache computed values"""
+    records = DataSetArray.from_datasets([Signal(), Signal()])
+    row = records[0]
+    assert row.mean == 1.5
+    records["gain"] = 2.0
+    assert row.mean == 3.0
+
+
+if __name__ == "__main__":
+    test_computed_cache()
+    test_computed_cache_nested()
+    test_computed_cache_options()
+    test_computed_cache_reset()
+    test_computed_cache_threads()
+    test_computed_cache_dataarray()
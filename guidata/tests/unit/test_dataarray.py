@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+Test columnar data set containers
+"""
+
+from __future__ import annotations
+
+import os.path as osp
+
+import h5py
+import numpy as np
+import pytest
+
+import guidata.dataset as gds
+from guidata.dataset.dataarray import TABLE_NAME, get_dataset_dtype
+from guidata.io import HDF5Reader, HDF5Writer, JSONReader, JSONWriter
+
+
+class Measurement(gds.DataSet):
+    """Measurement"""
+
+    index = gds.IntItem("Index", default=0)
+    value = gds.FloatItem("Value", default=1.0)
+    valid = gds.BoolItem("Valid", default=True)
+    mode = gds.ChoiceItem("Mode", [("fast", "Fast"), ("slow", "Slow")])
+    level = gds.ChoiceItem("Level", ["low", "high"], default=1)
+    _group = gds.BeginGroup("Details")
+    label = gds.StringItem("Label", default="meas")
+    data = gds.FloatArrayItem("Data", default=np.zeros(3))
+    _egroup = gds.EndGroup("Details")
+    double = gds.FloatItem("Double").set_computed(lambda ds: ds.value * 2)
+
+
+def make_measurements(count: int) -> list[Measurement]:
+    """Return a list of measurements"""
+    seq = []
+    for index in range(count):
+        obj = Measurement()
+        obj.index = index
+        obj.value = index * 0.5
+        obj.valid = index % 2 == 0
+        obj.mode = ("fast", "slow")[index % 2]
+        obj.label = f"label{index}"
+        obj.data = np.full(3, float(index))
+        seq.append(obj)
+    return seq
+
+
+def assert_records_equal(seq1: list[gds.DataSet], seq2: list[gds.DataSet]) -> None:
+    """Assert that two lists of data sets are equal"""
+    assert len(seq1) == len(seq2)
+    for obj1, obj2 in zip(seq1, seq2):
+        gds.assert_datasets_equal(obj1, obj2)
+
+
+def test_dataset_dtype():
+    """Test structured dtype of a DataSet class"""
+    dtype = get_dataset_dtype(Measurement)
+    assert dtype.names == ("index", "value", "valid", "mode", "level")
+    assert dtype["index"] == np.int64 and dtype["value"] == np.float64
+    assert dtype["valid"] == np.dtype(bool) and dtype["mode"] == np.dtype("U4")
+    assert dtype["level"] == np.int64
+
+
+def test_dataarray_columns():
+    """Test vectorized column access"""
+    records = gds.DataSetArray(Measurement, 4)
+    assert len(records) == 4 and records.object_names == ["label", "data"]
+    assert np.array_equal(records["value"], np.ones(4))
+    records["value"] *= 3
+    records["index"] = np.arange(4)
+    records["label"] = "name"
+    records["data"] = [np.full(3, float(index)) for index in range(4)]
+    assert records[2].value == 3.0 and records[2].index == 2
+    assert records[3].label == "name" and np.array_equal(records[3].data, [3.0] * 3)
+    # Mutable default values are not shared between records
+    records = gds.DataSetArray(Measurement, 2)
+    records[0].data[0] = 1.0
+    assert records[1].data[0] == 0.0
+    subset = records[records["index"] == 0]
+    assert isinstance(subset, gds.DataSetArray) and len(subset) == 2
+    with pytest.raises(ValueError):
+        records["index"] = "abc"
+
+
+def test_dataarray_rows():
+    """Test row views"""
+    records = gds.DataSetArray.from_datasets(make_measurements(5))
+    row = records[-1]
+    assert isinstance(row, Measurement) and row.index == 4
+    assert isinstance(row.index, int) and isinstance(row.valid, bool)
+    assert row.double == 4.0 and row.mode == "fast"
+    row.value = 10.0
+    row.mode = "slow"
+    assert records["value"][4] == 10.0 and records["mode"][4] == "slow"
+    assert [row.index for row in records] == list(range(5))
+    assert "Value: 10.0" in str(row)
+    with pytest.raises(ValueError):
+        row.value = None
+    with pytest.raises(IndexError):
+        records[5]
+    records[0] = row
+    assert records[0].index == 4 and records[0].value == 10.0
+    dataset = records.get_dataset(0)
+    assert type(dataset) is Measurement
+    dataset.data[0] = -1.0
+    assert records[0].data[0] == 4.0
+
+
+def test_dataarray_conversion():
+    """Test conversion from and to lists of data sets"""
+    seq = make_measurements(10)
+    records = gds.DataSetArray.from_datasets(seq)
+    result = records.to_datasets()
+    assert all(type(obj) is Measurement for obj in result)
+    assert_records_equal(seq, result)
+    result[0].data[0] = 1.0
+    assert records[0].data[0] == 0.0
+    assert len(gds.DataSetArray.from_datasets([], Measurement)) == 0
+    with pytest.raises(ValueError):
+        gds.DataSetArray.from_datasets([])
+
+
+def test_dataarray_h5(tmp_path):
+    """Test HDF5 serialization of a DataSetArray"""
+    fname = osp.join(str(tmp_path), "records.h5")
+    seq = make_measurements(20)
+    records = gds.DataSetArray.from_datasets(seq)
+    writer = HDF5Writer(fname)
+    writer.write(records, "records")
+    writer.close()
+    with h5py.File(fname, "r") as h5:
+        table = h5["records"][TABLE_NAME]
+        assert table.shape == (20,)
+        assert table.dtype.names == records.data.dtype.names
+    reader = HDF5Reader(fname)
+    result = reader.read("records", instance=gds.DataSetArray(Measurement))
+    reader.close()
+    assert np.array_equal(result.data, records.data)
+    assert_records_equal(seq, result.to_datasets())
+
+
+def test_dataarray_json():
+    """Test JSON serialization of a DataSetArray"""
+    seq = make_measurements(5)
+    writer = JSONWriter(None)
+    writer.write(gds.DataSetArray.from_datasets(seq), "records")
+    writer.save()
+    reader = JSONReader(writer.get_json())
+    result = reader.read("records", instance=gds.DataSetArray(Measurement))
+    assert_records_equal(seq, result.to_datasets())
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+Test change tracking of data set items
+"""
+
+from __future__ import annotations
+
+import copy
+
+import numpy as np
+
+import guidata.dataset as gds
+from guidata.io import JSONReader, JSONWriter
+
+
+class Acquisition(gds.DataSet):
+    """Acquisition"""
+
+    exposure = gds.FloatItem("Exposure", default=0.1)
+    count = gds.IntItem("Count", default=1)
+    label = gds.StringItem("Label", default="acq")
+    data = gds.FloatArrayItem("Data", default=np.zeros(2))
+    total = gds.FloatItem("Total").set_computed(lambda ds: ds.exposure * ds.count)
+
+
+class AcquisitionItem(gds.ObjectItem):
+    """Acquisition item"""
+
+    klass = Acquisition
+
+
+class Setup(gds.DataSet):
+    """Setup"""
+
+    name = gds.StringItem("Name", default="setup")
+    acquisition = AcquisitionItem("Acquisition", default=Acquisition.create(count=4))
+
+
+class CompactAcquisition(Acquisition, compact=True):
+    """Acquisition"""
+
+    enabled = gds.BoolItem("Enabled", default=True)
+
+
+def test_changed_items():
+    """Test changed items and mark_clean"""
+    for klass in (Acquisition, CompactAcquisition):
+        param = klass()
+        assert param.changed_items() == []
+        param.label = "new"
+        param.exposure = 1.0
+        assert param.changed_items() == ["exposure", "label"]
+        param.mark_clean(["label"])
+        assert param.changed_items() == ["exposure"]
+        param.mark_clean()
+        assert param.changed_items() == []
+        # Setting default values does not mark items as changed
+        param.set_defaults()
+        assert param.changed_items() == []
+        param.count = 3
+        assert copy.deepcopy(param).changed_items() == ["count"]
+    param = CompactAcquisition.create(count=2)
+    assert param.changed_items() == ["count"]
+    param.enabled = False
+    assert param.changed_items() == ["count", "enabled"]
+
+
+def test_changed_items_object_item():
+    """Test that the default value of an object item is not a change"""
+    param = Setup()
+    assert param.changed_items() == []
+    assert param.acquisition.changed_items() == []
+    assert param.acquisition.count == 4
+    param.acquisition = Acquisition()
+    assert param.changed_items() == ["acquisition"]
+    param.mark_clean()
+    param.set_defaults()
+    assert param.changed_items() == []
+
+
+def test_changed_items_deserialize():
+    """Test that loaded items are not marked as changed"""
+    param = Acquisition()
+    param.count = 5
+    writer = JSONWriter(None)
+    param.serialize(writer)
+    writer.save()
+    param = Acquisition()
+    param.label = "modified"
+    param.deserialize(JSONReader(writer.get_json()), include=["count"])
+    assert param.count == 5
+    assert param.changed_items() == ["label"]
+
+
+def test_journal():
+    """Test change journal"""
+    param = Acquisition()
+    param.count = 2
+    assert param.get_journal() == []
+    param.set_journal_enabled(True)
+    param.count = 3
+    param.exposure = 2  # Converted to float
+    param.data = np.ones(2)
+    journal = param.get_journal()
+    assert journal[:2] == [("count", 2, 3), ("exposure", 0.1, 2.0)]
+    name, old_value, new_value = journal[2]
+    assert name == "data" and np.array_equal(old_value, np.zeros(2))
+    assert np.array_equal(new_value, np.ones(2))
+    param.mark_clean()
+    assert param.get_journal() == []
+    param.label = "x"
+    assert param.get_journal() == [("label", "acq", "x")]
+    param.set_journal_enabled(False)
+    param.label = "y"
+    assert param.get_journal() == []
+
+
+def test_update_dataset_changed_only():
+    """Test update_dataset with changed items only"""
+    source, dest = Acquisition(), Acquisition()
+    source.mark_clean()
+    source.exposure = 5.0
+    dest.count = 10
+    gds.update_dataset(dest, source, changed_only=True)
+    assert dest.exposure == 5.0 and dest.count == 10
+    gds.update_dataset(dest, source)
+    assert dest.count == 1
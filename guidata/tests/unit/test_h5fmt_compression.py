@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+Test HDF5 array chunking and compression options
+"""
+
+from __future__ import annotations
+
+import os.path as osp
+
+import h5py
+import numpy as np
+import pytest
+
+import guidata.dataset as gds
+from guidata.io import HDF5Reader, HDF5Writer
+
+
+class Calibration(gds.DataSet):
+    """Calibration"""
+
+    gain = gds.FloatArrayItem("Gain", default=np.ones((64, 64))).set_prop(
+        "data", h5_compression="gzip", h5_compression_opts=9, h5_shuffle=True
+    )
+    offset = gds.FloatArrayItem("Offset", default=np.zeros((64, 64))).set_prop(
+        "data", h5_chunks=(16, 64)
+    )
+    raw = gds.FloatArrayItem("Raw", default=np.zeros(10))
+
+
+def test_h5_array_options(tmp_path):
+    """Test per-item and writer-wide array options"""
+    fname = osp.join(str(tmp_path), "calib.h5")
+    param = Calibration()
+    param.gain = np.random.default_rng(0).random((64, 64))
+    writer = HDF5Writer(fname, compression="lzf")
+    writer.write(param, "calib")
+    writer.write(np.arange(5), "array")
+    writer.write(np.array(3.0), "scalar")
+    writer.write(np.zeros((0, 3)), "empty")
+    writer.close()
+
+    with h5py.File(fname, "r") as h5:
+        gain = h5["calib/gain"]
+        assert gain.compression == "gzip" and gain.compression_opts == 9
+        assert gain.shuffle
+        offset = h5["calib/offset"]
+        assert offset.chunks == (16, 64) and offset.compression == "lzf"
+        assert h5["calib/raw"].compression == "lzf"
+        assert h5["array"].compression == "lzf"
+        assert h5["scalar"].compression is None
+        assert h5["empty"].compression is None
+
+    param2 = Calibration()
+    reader = HDF5Reader(fname)
+    reader.read("calib", instance=param2)
+    assert np.array_equal(reader.read("array", func=reader.read_array), np.arange(5))
+    assert reader.read("scalar", func=reader.read_array) == 3.0
+    reader.close()
+    gds.assert_datasets_equal(param, param2)
+
+
+def test_h5_array_default_layout(tmp_path):
+    """Test that arrays are contiguous and uncompressed by default"""
+    fname = osp.join(str(tmp_path), "default.h5")
+    writer = HDF5Writer(fname)
+    writer.write(np.arange(5), "array")
+    with pytest.raises(ValueError):
+        writer.write_array(np.arange(5), level=3)
+    writer.close()
+    with h5py.File(fname, "r") as h5:
+        assert h5["array"].chunks is None and h5["array"].compression is None
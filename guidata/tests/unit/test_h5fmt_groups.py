@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+Test HDF5 group handle stack
+"""
+
+from __future__ import annotations
+
+import os.path as osp
+
+import h5py
+import numpy as np
+
+from guidata.io import HDF5Reader, HDF5Writer
+
+
+def test_h5_group_stack(tmp_path):
+    """Test reading and writing values in nested groups"""
+    fname = osp.join(str(tmp_path), "groups.h5")
+    writer = HDF5Writer(fname)
+    writer.write(1, "top")
+    with writer.group("a"):
+        writer.write(2.0, "x")
+        with writer.group("b"):
+            with writer.group("c"):
+                writer.write(np.arange(3), "arr")
+                writer.write("text", "s")
+        writer.write(3, "y")
+    writer.close()
+
+    with h5py.File(fname, "r") as h5:
+        assert set(h5["a"].attrs.keys()) == {"x", "y"}
+        assert "arr" in h5["a/b/c"] and h5["a/b/c"].attrs["s"] == "text"
+
+    reader = HDF5Reader(fname)
+    assert reader.read("top") == 1
+    with reader.group("a"):
+        assert reader.read("x") == 2.0
+        with reader.group("b"):
+            with reader.group("c"):
+                arr = reader.read("arr", func=reader.read_array)
+                assert np.array_equal(arr, [0, 1, 2])
+                assert reader.read("s") == "text"
+            assert reader.read("missing", default=None) is None
+        with reader.group("unknown"):
+            assert reader.read("z", default=-1) == -1
+        assert reader.read("y") == 3
+    # The option list may be modified directly: handles must follow
+    reader.option = ["a", "b", "c", "s"]
+    assert reader.read_any() == "text"
+    reader.close()
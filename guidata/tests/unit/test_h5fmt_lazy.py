@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+Test lazy array loading from HDF5 files
+"""
+
+from __future__ import annotations
+
+import copy
+import os.path as osp
+
+import numpy as np
+
+import guidata.dataset as gds
+from guidata.dataset.conv import dataset_to_json, json_to_dataset
+from guidata.io import (
+    HDF5Reader,
+    HDF5Writer,
+    JSONReader,
+    JSONWriter,
+    LazyArray,
+    NPYReader,
+    NPYWriter,
+)
+
+
+class Image(gds.DataSet):
+    """Image"""
+
+    data = gds.FloatArrayItem("Data", default=np.zeros((4, 4)))
+    mask = gds.FloatArrayItem("Mask", default=np.zeros((4, 4))).set_prop(
+        "data", h5_compression="gzip"
+    )
+    title = gds.StringItem("Title", default="")
+
+
+def write_image(fname: str) -> Image:
+    """Write image to HDF5 file"""
+    image = Image()
+    image.data = np.arange(100.0).reshape(10, 10)
+    image.mask = np.arange(100.0).reshape(10, 10) % 3
+    image.title = "image"
+    writer = HDF5Writer(fname)
+    writer.write(image, "image")
+    writer.close()
+    return image
+
+
+def test_h5_lazy_arrays(tmp_path):
+    """Test lazy array loading"""
+    fname = osp.join(str(tmp_path), "image.h5")
+    image = write_image(fname)
+    image2 = Image()
+    reader = HDF5Reader(fname, lazy_arrays=True)
+    reader.read("image", instance=image2)
+    reader.close()
+
+    # Contiguous dataset: memory-mapped (copy-on-write)
+    assert isinstance(image2.data, np.memmap)
+    assert np.array_equal(image2.data, image.data)
+    image2.data[0, 0] = -1.0
+
+    # Compressed dataset: proxy, loaded on first numeric access
+    mask = image2.mask
+    assert isinstance(mask, LazyArray) and not mask.loaded
+    assert mask.shape == (10, 10) and mask.ndim == 2 and mask.size == 100
+    assert mask.dtype == np.float64 and len(mask) == 10
+    assert np.array_equal(mask[2], image.mask[2])
+    assert not mask.loaded
+    assert mask.max() == 2.0 and mask.loaded
+    assert np.array_equal(mask + 1, image.mask + 1)
+    assert np.array_equal(np.asarray(mask), image.mask)
+    assert np.array_equal(copy.deepcopy(mask), image.mask)
+    assert image2.title == "image"
+
+    # The file is not modified by the copy-on-write memory map
+    reader = HDF5Reader(fname)
+    reader.read("image", instance=image2)
+    reader.close()
+    gds.assert_datasets_equal(image, image2)
+
+
+def test_h5_lazy_arrays_closed_reader(tmp_path):
+    """Test that lazy arrays remain valid after the reader is closed"""
+    fname = osp.join(str(tmp_path), "image.h5")
+    image = write_image(fname)
+    reader = HDF5Reader(fname, lazy_arrays=True)
+    with reader.group("image"):
+        mask = reader.read("mask", func=reader.read_array)
+    reader.close()
+    assert isinstance(mask, LazyArray)
+    assert np.array_equal(mask[:, 1], image.mask[:, 1])
+    assert np.array_equal(mask, image.mask)
+
+
+def test_h5_lazy_arrays_save(tmp_path):
+    """Test that data sets holding lazy arrays may be saved in other formats"""
+    fname = osp.join(str(tmp_path), "image.h5")
+    image = write_image(fname)
+    with HDF5Reader(fname, lazy_arrays=True) as reader:
+        image2 = reader.read("image", instance=Image())
+    assert isinstance(image2.mask, LazyArray)
+    gds.assert_datasets_equal(json_to_dataset(dataset_to_json(image2)), image)
+    jsonname = osp.join(str(tmp_path), "image.json")
+    writer = JSONWriter(jsonname)
+    writer.write(image2, "image")
+    writer.save()
+    reader = JSONReader(jsonname)
+    gds.assert_datasets_equal(reader.read("image", instance=Image()), image)
+    dirname = osp.join(str(tmp_path), "image")
+    with NPYWriter(dirname) as writer:
+        writer.write(image2, "image")
+    with NPYReader(dirname) as reader:
+        gds.assert_datasets_equal(reader.read("image", instance=Image()), image)
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+Test columnar ("table") mode of HDF5 object lists
+"""
+
+from __future__ import annotations
+
+import os.path as osp
+
+import h5py
+import numpy as np
+
+import guidata.dataset as gds
+from guidata.io import HDF5Reader, HDF5Writer
+from guidata.io.h5fmt import TABLE_NAME
+
+
+class Measurement(gds.DataSet):
+    """Measurement"""
+
+    index = gds.IntItem("Index", default=0)
+    value = gds.FloatItem("Value", default=1.0)
+    label = gds.StringItem("Label", default="")
+    valid = gds.BoolItem("Valid", default=True)
+    mode = gds.ChoiceItem("Mode", ["fast", "slow"], default="fast")
+    comment = gds.StringItem("Comment", default=None).set_prop("data", allow_none=True)
+    data = gds.FloatArrayItem("Data", default=np.zeros(3))
+
+
+def make_measurements(count: int) -> list[Measurement]:
+    """Return a list of measurements"""
+    seq = []
+    for index in range(count):
+        obj = Measurement()
+        obj.index = index
+        obj.value = index * 0.5
+        obj.label = f"mes{index}é"
+        obj.valid = index % 2 == 0
+        obj.mode = "slow" if index % 3 else "fast"
+        obj.data = np.arange(3.0) + index
+        seq.append(obj)
+    return seq
+
+
+def write_read(fname: str, seq: list, table: bool) -> list:
+    """Write object list, then read it back"""
+    writer = HDF5Writer(fname)
+    writer.write_object_list(seq, "objs", table=table)
+    writer.close()
+    reader = HDF5Reader(fname)
+    result = reader.read_object_list("objs", Measurement)
+    reader.close()
+    return result
+
+
+def test_h5_object_table(tmp_path):
+    """Test object list round trip in table mode"""
+    fname = osp.join(str(tmp_path), "table.h5")
+    seq = make_measurements(20)
+    result = write_read(fname, seq, table=True)
+    assert len(result) == len(seq)
+    for obj, obj2 in zip(seq, result):
+        gds.assert_datasets_equal(obj, obj2)
+        assert isinstance(obj2.label, str) and isinstance(obj2.valid, bool)
+    with h5py.File(fname, "r") as h5:
+        group = h5["objs"]
+        assert set(group) == {TABLE_NAME, "data"}
+        assert group["data"].shape == (20, 3)
+        assert set(group[TABLE_NAME].dtype.names) == {
+            "index",
+            "value",
+            "label",
+            "valid",
+            "mode",
+        }
+
+
+def test_h5_object_table_fallback(tmp_path):
+    """Test object lists which cannot be written as a table"""
+    fname = osp.join(str(tmp_path), "table.h5")
+    seq = make_measurements(3)
+    seq[1].data = np.zeros(5)  # Arrays of different shapes
+    result = write_read(fname, seq, table=True)
+    with h5py.File(fname, "r") as h5:
+        assert "IDs" in h5["objs"].attrs
+    for obj, obj2 in zip(seq, result):
+        assert obj.index == obj2.index and np.array_equal(obj.data, obj2.data)
+    seq = make_measurements(3)
+    seq[0].comment = "text"  # Mix of None and strings
+    result = write_read(fname, seq, table=True)
+    assert result[0].comment == "text"
+    assert write_read(fname, [], table=True) == []
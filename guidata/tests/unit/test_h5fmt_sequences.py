@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+Test packed sequences in HDF5 files
+"""
+
+from __future__ import annotations
+
+import os.path as osp
+
+import h5py
+import numpy as np
+import pytest
+
+import guidata.dataset as gds
+from guidata.io import HDF5Reader, HDF5Writer
+from guidata.io.h5fmt import SEQUENCE_TYPE_NAME, pack_sequence
+
+SEQUENCES = {
+    "bools": [True, False, True],
+    "ints": [1, -2, np.int32(3)],
+    "floats": [0.5, np.float64(1.5), -2.0],
+    "strings": ["a", "éàç", ""],
+    "arrays": [np.arange(6.0).reshape(2, 3), np.ones((2, 3))],
+    "mixed": [1, "a", 2.0],
+    "empty": [],
+    "nested": [[1, 2], [3.0, 4.0], ["x"]],
+    "dicts": [{"a": 1}, {"b": [1.0, 2.0]}],
+}
+
+
+def write_read(fname: str, packed_sequences: bool, **kwargs) -> dict:
+    """Write all test sequences, then read them back"""
+    writer = HDF5Writer(fname, packed_sequences=packed_sequences, **kwargs)
+    with writer.group("seqs"):
+        for name, seq in SEQUENCES.items():
+            writer.write(seq, name)
+        writer.write({"values": [1.0, 2.0], "names": ["a", "b"]}, "dict")
+    writer.close()
+    reader = HDF5Reader(fname)
+    with reader.group("seqs"):
+        result = {name: reader.read(name) for name in SEQUENCES}
+        result["dict"] = reader.read("dict", func=reader.read_dict)
+    reader.close()
+    return result
+
+
+def check_sequence(value: list, expected: list) -> None:
+    """Check that sequence `value` is equal to `expected`"""
+    assert isinstance(value, list) and len(value) == len(expected)
+    for obj, expected_obj in zip(value, expected):
+        if isinstance(expected_obj, np.ndarray):
+            assert np.array_equal(obj, expected_obj)
+        elif isinstance(expected_obj, list):
+            check_sequence(obj, expected_obj)
+        else:
+            assert obj == expected_obj
+
+
+@pytest.mark.parametrize("packed_sequences", [True, False])
+def test_h5_sequences(tmp_path, packed_sequences: bool):
+    """Test sequences round trip, with and without packing"""
+    fname = osp.join(str(tmp_path), "seqs.h5")
+    result = write_read(fname, packed_sequences)
+    for name, seq in SEQUENCES.items():
+        check_sequence(result[name], seq)
+    check_sequence(result["dict"]["values"], [1.0, 2.0])
+    check_sequence(result["dict"]["names"], ["a", "b"])
+    with h5py.File(fname, "r") as h5:
+        for name in ("bools", "ints", "floats", "strings", "arrays"):
+            assert isinstance(h5["seqs"][name], h5py.Dataset) is packed_sequences
+        for name in ("mixed", "empty", "nested", "dicts"):
+            assert isinstance(h5["seqs"][name], h5py.Group)
+        if packed_sequences:
+            assert h5["seqs/arrays"].shape == (2, 2, 3)
+            assert h5["seqs/floats"].attrs[SEQUENCE_TYPE_NAME] == "float"
+
+
+def test_h5_sequences_default(tmp_path):
+    """Test that sequences are not packed by default"""
+    fname = osp.join(str(tmp_path), "seqs.h5")
+    with HDF5Writer(fname) as writer:
+        writer.write([1.0, 2.0], "floats")
+    with h5py.File(fname, "r") as h5:
+        assert isinstance(h5["floats"], h5py.Group)
+
+
+def test_h5_sequences_compression(tmp_path):
+    """Test packed sequences compression"""
+    fname = osp.join(str(tmp_path), "seqs.h5")
+    result = write_read(fname, True, compression="gzip")
+    check_sequence(result["floats"], SEQUENCES["floats"])
+    with h5py.File(fname, "r") as h5:
+        assert h5["seqs/floats"].compression == "gzip"
+
+
+def test_pack_sequence():
+    """Test homogeneous sequence detection"""
+    assert pack_sequence([True, 1]) is None
+    assert pack_sequence([1, True]) is None
+    assert pack_sequence([1, 2.0]) is None
+    assert pack_sequence([2**70]) is None
+    assert pack_sequence([b"\xff"]) is None
+    assert pack_sequence([np.zeros(2), np.zeros(3)]) is None
+    assert pack_sequence([np.zeros(2), np.zeros(2, dtype=np.int32)]) is None
+    assert pack_sequence([b"a", "b"])[1] == "str"
+    assert pack_sequence((1, 2))[0].dtype == np.int64
+
+
+class SequenceParameters(gds.DataSet):
+    """Sequence parameters"""
+
+    choices = gds.MultipleChoiceItem("Choices", ["a", "b", "c"], [0, 2])
+    files = gds.FilesOpenItem("Files", default=["f1.txt", "f2.txt"])
+    ids = gds.StringItem("IDs", default="")
+
+
+def test_h5_sequences_items(tmp_path):
+    """Test items relying on `write_sequence` and `read_sequence`"""
+    fname = osp.join(str(tmp_path), "items.h5")
+    param = SequenceParameters()
+    param.choices = [1]
+    param.files = ["é.txt", "data.txt"]
+    writer = HDF5Writer(fname)
+    writer.write(param, "param")
+    writer.close()
+    param2 = SequenceParameters()
+    reader = HDF5Reader(fname)
+    reader.read("param", instance=param2)
+    reader.close()
+    assert param2.choices == [1]
+    assert param2.files == ["é.txt", "data.txt"]
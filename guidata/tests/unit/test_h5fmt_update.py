@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+Test HDF5 update mode (incremental save)
+"""
+
+from __future__ import annotations
+
+import datetime
+import os.path as osp
+
+import h5py
+import numpy as np
+import pytest
+
+import guidata.dataset as gds
+from guidata.dataset.conv import dataset_to_json
+from guidata.io import HDF5Reader, HDF5Writer, JSONReader
+
+
+class Channel(gds.DataSet):
+    """Channel"""
+
+    gain = gds.FloatItem("Gain", default=1.0)
+    label = gds.StringItem("Label", default="channel")
+    data = gds.FloatArrayItem("Data", default=np.zeros(4))
+
+
+class ChannelItem(gds.ObjectItem):
+    """Channel item"""
+
+    klass = Channel
+
+
+class Device(gds.DataSet):
+    """Device"""
+
+    name = gds.StringItem("Name", default="device")
+    channel = ChannelItem("Channel")
+
+
+def read_channel(fname: str, name: str) -> Channel:
+    """Read a channel from an HDF5 file"""
+    with HDF5Reader(fname) as reader:
+        return reader.read(name, instance=Channel())
+
+
+def test_h5_update_dataset(tmp_path):
+    """Test incremental save of data sets"""
+    fname = osp.join(str(tmp_path), "workspace.h5")
+    channels = [Channel() for _index in range(3)]
+    with HDF5Writer(fname) as writer:
+        for index, channel in enumerate(channels):
+            writer.write(channel, f"channel{index}")
+    # Items set before the first save are written again by the first update
+    assert channels[0].changed_items() == []
+    channels[1].gain = 2.0
+    channels[1].data = np.arange(4.0)
+    with h5py.File(fname, "r") as h5:
+        dset_offset = h5["channel1/data"].id.get_offset()
+    # Channel 1 is written incrementally, channel 3 is new
+    channels.append(Channel())
+    channels[3].label = "new"
+    with HDF5Writer(fname, mode="a") as writer:
+        for index, channel in enumerate(channels):
+            writer.write(channel, f"channel{index}")
+    assert all(channel.changed_items() == [] for channel in channels)
+    for index, channel in enumerate(channels):
+        gds.assert_datasets_equal(channel, read_channel(fname, f"channel{index}"))
+    with h5py.File(fname, "r") as h5:
+        # Array of the same shape and dtype has been overwritten in place
+        assert h5["channel1/data"].id.get_offset() == dset_offset
+    # Arrays of a different shape are replaced
+    channels[1].data = np.arange(10.0)
+    with HDF5Writer(fname, mode="a") as writer:
+        writer.write(channels[1], "channel1")
+    assert np.array_equal(read_channel(fname, "channel1").data, np.arange(10.0))
+    # Changes marked as clean are not lost: the data set is written entirely
+    channels[2].label = "changed"
+    channels[2].mark_clean()
+    with HDF5Writer(fname, mode="a") as writer:
+        writer.write(channels[2], "channel2")
+    assert read_channel(fname, "channel2").label == "changed"
+
+
+def test_h5_update_nested(tmp_path):
+    """Test incremental save of data sets held by object items"""
+    fname = osp.join(str(tmp_path), "nested.h5")
+    device = Device()
+    with HDF5Writer(fname, mode="a") as writer:
+        writer.write(device, "device")
+    device.channel.gain = 42.0
+    assert device.changed_items() == ["channel"]
+    with HDF5Writer(fname, mode="a") as writer:
+        writer.write(device, "device")
+    assert device.changed_items() == [] and device.channel.changed_items() == []
+    with HDF5Reader(fname) as reader:
+        result = reader.read("device", instance=Device())
+    assert result.channel.gain == 42.0
+
+
+def test_h5_update_unknown_state(tmp_path):
+    """Test that objects which state in the file is unknown are written entirely"""
+    fname = osp.join(str(tmp_path), "state.h5")
+    channel = Channel()
+    channel.label = "first"
+    with HDF5Writer(fname, mode="a") as writer:
+        writer.write(channel, "channel")
+    # New object written over an existing group
+    channel = Channel()
+    channel.gain = 2.0
+    with HDF5Writer(fname, mode="a") as writer:
+        writer.write(channel, "channel")
+    gds.assert_datasets_equal(channel, read_channel(fname, "channel"))
+    # Object read from the file: written incrementally
+    channel = read_channel(fname, "channel")
+    assert channel.changed_items() == []
+    channel.label = "read"
+    with HDF5Writer(fname, mode="a") as writer:
+        writer.write(channel, "channel")
+    assert read_channel(fname, "channel").label == "read"
+    # Group written by another object since the object was read
+    other = read_channel(fname, "channel")
+    other.label = "other"
+    with HDF5Writer(fname, mode="a") as writer:
+        writer.write(other, "channel")
+    with HDF5Writer(fname, mode="a") as writer:
+        writer.write(channel, "channel")
+    gds.assert_datasets_equal(channel, read_channel(fname, "channel"))
+
+
+@pytest.mark.parametrize("reset", ["set_defaults", "deserialize", "mark_clean"])
+def test_h5_update_reset(tmp_path, reset):
+    """Test that data sets reset since they were read are written entirely"""
+    fname = osp.join(str(tmp_path), "reset.h5")
+    channel = Channel()
+    channel.gain = 2.0
+    channel.label = "first"
+    with HDF5Writer(fname, mode="a") as writer:
+        writer.write(channel, "channel")
+    with HDF5Reader(fname) as reader:
+        channel = reader.read("channel", instance=Channel())
+    if reset == "set_defaults":
+        channel.set_defaults()
+    elif reset == "deserialize":
+        channel.deserialize(JSONReader(dataset_to_json(Channel())))
+    else:
+        channel.gain = 3.0
+        channel.mark_clean(["gain"])
+    assert channel.changed_items() == []
+    with HDF5Writer(fname, mode="a") as writer:
+        writer.write(channel, "channel")
+    gds.assert_datasets_equal(channel, read_channel(fname, "channel"))
+
+
+def test_h5_update_values(tmp_path):
+    """Test that values of a different kind replace the existing ones"""
+    fname = osp.join(str(tmp_path), "values.h5")
+    values = [
+        None,
+        np.arange(3),
+        [1, "a", 2.0],
+        {"a": 1, "b": [1.0, 2.0]},
+        datetime.datetime(2024, 1, 2, 3, 4, 5),
+        5,
+        [1.0, 2.0],
+        {"c": "d"},
+        "text",
+        np.zeros((2, 2)),
+    ]
+    with HDF5Writer(fname) as writer:
+        writer.write(values[0], "value")
+    for value in values[1:]:
+        with HDF5Writer(fname, mode="a") as writer:
+            writer.write(value, "value")
+        with HDF5Reader(fname) as reader:
+            if isinstance(value, np.ndarray):
+                result = reader.read("value", func=reader.read_array)
+            elif isinstance(value, dict):
+                result = reader.read("value", func=reader.read_dict)
+            elif isinstance(value, list):
+                result = reader.read("value", func=reader.read_sequence)
+            else:
+                result = reader.read("value")
+        if isinstance(value, np.ndarray):
+            assert np.array_equal(result, value)
+        else:
+            assert result == value
+
+
+def test_h5_update_object_list(tmp_path):
+    """Test that object lists are updated object by object in update mode"""
+    fname = osp.join(str(tmp_path), "list.h5")
+    with HDF5Writer(fname) as writer:
+        writer.write_object_list([Channel() for _index in range(3)], "channels")
+    with HDF5Writer(fname, mode="a") as writer:
+        writer.write_object_list([Channel()], "channels")
+    with HDF5Reader(fname) as reader:
+        assert len(reader.read_object_list("channels", Channel)) == 1
+    channels = [Channel() for _index in range(3)]
+    with HDF5Writer(fname, mode="a") as writer:
+        writer.write_object_list(channels, "channels")
+    with h5py.File(fname, "r") as h5:
+        ids = list(h5["channels"].attrs["IDs"])
+    # The groups of the objects already in the list are kept
+    channels[2].gain = 3.0
+    channels = [channels[2], channels[1], None, Channel()]
+    with HDF5Writer(fname, mode="a") as writer:
+        writer.write_object_list(channels, "channels")
+    with HDF5Reader(fname) as reader:
+        result = reader.read_object_list("channels", Channel)
+    assert [channel.gain for channel in result if channel is not None] == [
+        3.0,
+        1.0,
+        1.0,
+    ]
+    assert result[1].label == "channel" and result[2] is None
+    with h5py.File(fname, "r") as h5:
+        new_ids = list(h5["channels"].attrs["IDs"])
+        assert new_ids[:2] == [ids[2], ids[1]]
+        assert ids[0] not in h5["channels"]
+    # Objects read from the file are updated incrementally as well
+    result[0].gain = 4.0
+    with HDF5Writer(fname, mode="a") as writer:
+        writer.write_object_list(result, "channels")
+    with h5py.File(fname, "r") as h5:
+        ids = list(h5["channels"].attrs["IDs"])
+        # None values are written again
+        assert ids[:2] + ids[3:] == new_ids[:2] + new_ids[3:]
+    with HDF5Reader(fname) as reader:
+        assert reader.read_object_list("channels", Channel)[0].gain == 4.0
+    with pytest.raises(ValueError):
+        HDF5Writer(fname, mode="r")
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+Test item property dependencies and change tracking used for selective refreshes
+"""
+
+from __future__ import annotations
+
+import guidata.dataset as gds
+
+
+class Parameters(gds.DataSet):
+    """Parameters"""
+
+    def compute_total(self) -> float:
+        """Compute the total (depends on mode)"""
+        return self.a + self.b if self.mode == 0 else self.a
+
+    _mode = gds.GetAttrProp("mode")
+    _flag = gds.ValueProp(True)
+    mode = gds.IntItem("Mode", default=0).set_prop("display", store=_mode)
+    a = gds.FloatItem("A", default=1.0)
+    b = gds.FloatItem("B", default=2.0).set_prop(
+        "display", active=gds.FuncProp(_mode, lambda mode: mode == 0)
+    )
+    c = gds.FloatItem("C").set_prop(
+        "display",
+        active=gds.FuncPropMulti([_mode, gds.GetAttrProp("a")], lambda m, a: m and a),
+        readonly=gds.NotProp(_flag),
+    )
+    d = gds.FloatItem("D").set_prop("display", format=gds.FormatProp("%(a)s"))
+    e = gds.FloatItem("E").set_prop("display", active=gds.GetAttrProp("_mode"))
+    total = gds.FloatItem("Total").set_computed(compute_total)
+
+
+def get_item(name: str) -> gds.DataItem:
+    """Return an item of Parameters"""
+    return next(item for item in Parameters._items if item.get_name() == name)
+
+
+def test_item_dependencies():
+    """Test dependencies of item properties"""
+    param = Parameters()
+    b, c, d = get_item("b"), get_item("c"), get_item("d")
+    assert b.get_prop_dependencies("display", param, ["active"]) == {"mode"}
+    assert c.get_prop_dependencies("display", param, ["active"]) == {"mode", "a"}
+    assert c.get_prop_dependencies("display", param) is None
+    assert c.get_prop_dependencies("display", param, exclude=["readonly"]) == {
+        "mode",
+        "a",
+    }
+    assert d.get_prop_dependencies("display", param) == {"a"}
+    assert d.get_prop_dependencies("data", param) == set()
+    # Attributes which are not items: dependencies are unknown
+    assert get_item("e").get_prop_dependencies("display", param) is None
+    # Computed items: dependencies are known once the value has been computed
+    prop = get_item("total").get_prop("data", "computed")
+    prop.recorded_dependencies.clear()
+    assert prop.get_dependencies(param) is None
+    assert param.total == 3.0
+    assert prop.get_dependencies(param) == {"mode", "a", "b"}
+    param.mode = 1
+    assert param.total == 1.0
+    assert prop.get_dependencies(param) == {"mode", "a", "b"}
+
+
+def test_track_changes():
+    """Test collecting the items set in a block"""
+    param = Parameters()
+    param.a = 3.0
+    with param.track_changes() as names:
+        param.b = 4.0
+        param.mode = 1
+    assert names == {"b", "mode"}
+    assert sorted(param.changed_items()) == ["a", "b", "mode"]
+    # Items marked as clean in the block remain clean (and are still collected)
+    with param.track_changes() as names:
+        param.a = 5.0
+        with param.track_changes() as inner_names:
+            param.mark_clean(["b"])
+            param.c = 1.0
+        param.mark_clean(["a"])
+    assert inner_names == {"c"} and names == {"a", "c"}
+    assert sorted(param.changed_items()) == ["c", "mode"]
+    with param.track_changes():
+        param.mark_clean()
+    assert param.changed_items() == []
+
+
+if __name__ == "__main__":
+    test_item_dependencies()
+    test_track_changes()
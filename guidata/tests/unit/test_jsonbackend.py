@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+Test JSON backends: all backends must read and write the same format
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+
+import numpy as np
+import pytest
+
+import guidata.dataset as gds
+from guidata.dataset.conv import dataset_to_json, json_to_dataset
+from guidata.io import (
+    JSONReader,
+    JSONWriter,
+    get_json_backend,
+    set_default_json_backend,
+)
+from guidata.io.jsonfmt import JSON_BACKENDS, JSONBackend, StdlibJSONBackend
+
+BACKENDS = [name for name, klass in JSON_BACKENDS.items() if klass.is_available()]
+
+
+class Parameters(gds.DataSet):
+    """Parameters"""
+
+    count = gds.IntItem("Count", default=3)
+    gain = gds.FloatItem("Gain", default=0.1)
+    label = gds.StringItem("Label", default="é")
+    floats = gds.FloatArrayItem("Floats", default=np.linspace(0.0, 1.0, 12))
+    ints = gds.FloatArrayItem("Integers", default=np.arange(6, dtype=np.int16))
+
+
+VALUES = {
+    "float32": np.linspace(0.0, 1.0, 5, dtype=np.float32).reshape(5, 1),
+    "uint8": np.arange(4, dtype=np.uint8),
+    "bool": np.array([True, False]),
+    "complex": np.array([1 + 2j, 3 - 4j]),
+    "strided": np.arange(10.0)[::3],
+    "bigendian": np.arange(3, dtype=">i4"),
+    "strings": np.array(["a", "bc"]),
+    "scalar": np.float64(2.5),
+    "tuple": (1, np.int64(2), b"bytes"),
+}
+
+# Values which floats are formatted differently by the backends before normalization
+FLOAT_VALUES = {
+    "exponents": np.array([1e-8, -2.5e-5, 3e-5, 1e-4, 1e15, 1e16, 1.5e300, 5e-324]),
+    "random": np.random.default_rng(0).standard_normal((4, 3, 2)) * 1e-5,
+    "float32": np.linspace(-1e-5, 1e-5, 7, dtype=np.float32),
+    "complex64": np.array([1e-5 + 2e-8j, 10.00001j], dtype=np.complex64),
+    "empty": np.zeros((2, 0)),
+    "nested": [{"a": np.arange(3.0) / 7}, np.float32(0.1), 1e-5],
+}
+
+
+def assert_same(value, expected) -> None:
+    """Check that two decoded values are equal"""
+    if isinstance(expected, np.ndarray):
+        assert isinstance(value, np.ndarray)
+        assert value.dtype == expected.dtype
+        assert np.array_equal(value, expected)
+    elif isinstance(expected, dict):
+        assert value.keys() == expected.keys()
+        for key, item in expected.items():
+            assert_same(value[key], item)
+    elif isinstance(expected, list):
+        assert len(value) == len(expected)
+        for item, expected_item in zip(value, expected):
+            assert_same(item, expected_item)
+    else:
+        assert value == expected
+
+
+@pytest.mark.parametrize("binary_arrays", [False, True])
+def test_backends_wire_format(binary_arrays):
+    """Test that all backends write and read the same format"""
+    texts = {}
+    for name in BACKENDS:
+        backend = get_json_backend(name)
+        texts[name] = backend.dumps(VALUES, indent=4, binary_arrays=binary_arrays)
+    for name, text in texts.items():
+        # Every backend reads the documents written by every backend
+        for reader_name in BACKENDS:
+            decoded = get_json_backend(reader_name).loads(text)
+            assert_same(decoded, get_json_backend("json").loads(texts["json"]))
+    if not binary_arrays:
+        assert texts["json"].startswith('{\n    "float32": [\n        "array"')
+
+
+@pytest.mark.parametrize("indent", [None, 0, 2, 4])
+@pytest.mark.parametrize("tagged_arrays", [False, True])
+def test_backends_identical_output(indent, tagged_arrays):
+    """Test that all backends write the same documents, byte for byte"""
+    values = {**VALUES, **FLOAT_VALUES, "label": "é", "nan": np.array([np.nan])}
+    texts = [
+        get_json_backend(name).dumps(values, indent, tagged_arrays=tagged_arrays)
+        for name in BACKENDS
+    ]
+    assert all(text == texts[0] for text in texts)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_backend_unsupported_types(backend):
+    """Test that values which are not JSON serializable are rejected"""
+    for value in (datetime.datetime(2024, 1, 2), {1, 2}, np.array([object()])):
+        with pytest.raises(TypeError):
+            get_json_backend(backend).dumps({"value": value})
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_backend_non_finite(backend):
+    """Test documents with non-finite floats (not supported by all backends)"""
+    values = {"nan": float("nan"), "array": np.array([1.0, np.inf])}
+    text = get_json_backend(backend).dumps(values)
+    assert text == json.dumps(
+        {"nan": float("nan"), "array": ["array", [1.0, float("inf")], "float64"]}
+    )
+    for name in BACKENDS:
+        decoded = get_json_backend(name).loads(text)
+        assert np.isnan(decoded["nan"])
+        assert np.array_equal(decoded["array"], values["array"])
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_backend_dataset(backend, tmp_path):
+    """Test dataset serialization with a given backend"""
+    param = Parameters()
+    param.gain = 1 / 3
+    text = dataset_to_json(param, backend=backend)
+    for name in BACKENDS:
+        result = json_to_dataset(text, backend=name)
+        assert result.gain == param.gain
+        assert result.label == param.label
+        assert np.array_equal(result.floats, param.floats)
+        assert result.ints.dtype == param.ints.dtype
+    fname = str(tmp_path / "param.json")
+    writer = JSONWriter(fname, backend=backend)
+    param.serialize(writer)
+    writer.save()
+    reader = JSONReader(fname, backend="json")
+    result = Parameters()
+    result.deserialize(reader)
+    assert np.array_equal(result.floats, param.floats)
+
+
+def test_default_backend():
+    """Test default backend selection"""
+    assert isinstance(get_json_backend(), StdlibJSONBackend)
+    for name in BACKENDS:
+        set_default_json_backend(name)
+        try:
+            assert get_json_backend().name == name
+        finally:
+            set_default_json_backend(None)
+    assert isinstance(get_json_backend(), StdlibJSONBackend)
+    with pytest.raises(TypeError):
+        JSONBackend()  # pylint: disable=abstract-class-instantiated
+
+
+def test_unknown_backend():
+    """Test unknown backend name"""
+    with pytest.raises(ValueError):
+        get_json_backend("unknown")
+    with pytest.raises(ValueError):
+        JSONWriter(None, backend="unknown")
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+Test JSON binary array encoding
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import guidata.dataset as gds
+from guidata.io import JSONReader, JSONWriter
+
+ARRAYS = {
+    "float64": np.linspace(0.0, 1.0, 12).reshape(3, 4),
+    "float32_be": np.arange(5, dtype=">f4"),
+    "int16": np.arange(-3, 3, dtype=np.int16),
+    "uint8_3d": np.arange(24, dtype=np.uint8).reshape(2, 3, 4),
+    "complex128": np.array([[1 + 2j, 3 - 4j], [0j, -1j]]),
+    "bool": np.array([True, False, True]),
+    "fortran": np.asfortranarray(np.arange(6.0).reshape(2, 3)),
+    "empty": np.zeros((0, 3)),
+    "scalar": np.array(3.5),
+    "unicode": np.array(["abc", "déf"]),
+}
+
+
+class ArrayParameters(gds.DataSet):
+    """Dataset with an array item"""
+
+    name = gds.StringItem("Name", default="test")
+    data = gds.FloatArrayItem("Data", default=np.zeros((2, 2)))
+
+
+@pytest.mark.parametrize("compression", [None, "zlib", "bz2", "lzma"])
+def test_binary_arrays_roundtrip(compression):
+    """Test binary array encoding round trip"""
+    writer = JSONWriter(None, binary_arrays=True, compression=compression)
+    for name, arr in ARRAYS.items():
+        writer.write(arr, name)
+    text = writer.get_json()
+    assert "__ndarray__" in text
+    reader = JSONReader(text)
+    for name, arr in ARRAYS.items():
+        value = reader.read(name)
+        assert value.dtype == arr.dtype and value.shape == arr.shape
+        assert np.array_equal(value, arr)
+        assert value.flags.writeable
+
+
+def test_legacy_arrays():
+    """Test that list-encoded arrays are still written by default and read back"""
+    writer = JSONWriter(None)
+    writer.write(ARRAYS["complex128"], "z")
+    writer.write(ARRAYS["float64"], "x")
+    text = writer.get_json()
+    assert "__ndarray__" not in text and '"array"' in text
+    reader = JSONReader(text)
+    assert np.array_equal(reader.read("z"), ARRAYS["complex128"])
+    assert np.array_equal(reader.read("x"), ARRAYS["float64"])
+
+
+def test_binary_dataset_to_json():
+    """Test dataset serialization with binary arrays"""
+    param = ArrayParameters()
+    param.data = np.random.rand(10, 10)
+    text = gds.dataset_to_json(param, binary_arrays=True, compression="zlib")
+    param2 = gds.json_to_dataset(text)
+    gds.assert_datasets_equal(param, param2)
+
+
+def test_unknown_codec():
+    """Test that unknown compression codecs are rejected"""
+    with pytest.raises(ValueError):
+        JSONWriter(None, binary_arrays=True, compression="zip")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+Test compressed JSON files
+"""
+
+from __future__ import annotations
+
+import os.path as osp
+import re
+
+import numpy as np
+import pytest
+
+import guidata.dataset as gds
+from guidata.io import JSONReader, JSONWriter
+from guidata.io.jsonfmt import FILE_CODECS, detect_file_codec
+
+
+class Parameters(gds.DataSet):
+    """Parameters"""
+
+    gain = gds.FloatItem("Gain", default=1.0)
+    label = gds.StringItem("Label", default="signal é")
+    data = gds.FloatArrayItem("Data", default=np.arange(100.0))
+
+
+EXTENSIONS = {"gzip": ".json.gz", "bz2": ".json.bz2", "xz": ".json.xz"}
+
+
+def write_objects(fname: str, streaming: bool, **kwargs) -> list[Parameters]:
+    """Write an object list to a file"""
+    objs = [Parameters() for _index in range(20)]
+    for index, obj in enumerate(objs):
+        obj.gain = index
+    writer = JSONWriter(fname, streaming=streaming, **kwargs)
+    writer.write_object_list(objs, "objs")
+    writer.save()
+    return objs
+
+
+@pytest.mark.parametrize("codec", list(FILE_CODECS))
+@pytest.mark.parametrize("streaming", [False, True])
+def test_compressed_json(codec, streaming, tmp_path):
+    """Test that compressed files are written from extension and read back"""
+    fname = osp.join(str(tmp_path), "objs" + EXTENSIONS[codec])
+    objs = write_objects(fname, streaming)
+    assert detect_file_codec(fname) == codec
+    plain = osp.join(str(tmp_path), "objs.json")
+    write_objects(plain, streaming)
+    assert detect_file_codec(plain) is None
+    texts = []
+    for path, opener in ((fname, FILE_CODECS[codec][0]), (plain, open)):
+        with opener(path, "rb") as fdesc:
+            # Object IDs are different in both files
+            texts.append(re.sub(rb"[0-9a-f]{8}-[0-9a-f-]{27}", b"ID", fdesc.read()))
+    assert texts[0] == texts[1]
+    for reader in (JSONReader(fname), JSONReader(fname, streaming=True)):
+        result = list(reader.iter_object_list("objs", Parameters))
+        assert [obj.gain for obj in result] == [obj.gain for obj in objs]
+        assert result[0].label == "signal é"
+        assert np.array_equal(result[-1].data, objs[-1].data)
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_load_from_stream(streaming, tmp_path, monkeypatch):
+    """Test that compressed documents are decoded from the decompressing stream"""
+    fname = osp.join(str(tmp_path), "values.json.gz")
+    values = {
+        "floats": np.linspace(0.0, 1.0, 7),
+        "ints": np.arange(3, dtype=np.uint8),
+        "group": {
+            "text": "é" * 100,
+            "list": [1, [2.5, None]],
+            "empty": {},
+            "matrix": np.arange(6.0).reshape(2, 3),
+        },
+    }
+    writer = JSONWriter(fname)
+    writer.set_json_dict(values)
+    writer.save()
+    monkeypatch.setattr(JSONReader, "CHUNK_SIZE", 16)
+    reader = JSONReader(fname, streaming=streaming)
+    result = reader.get_json_dict()
+    assert reader.jsontext is None
+    matrix = result["group"].pop("matrix")
+    assert np.array_equal(matrix, values["group"].pop("matrix"))
+    assert result["group"] == values["group"]
+    for key in ("floats", "ints"):
+        assert np.array_equal(result[key], values[key])
+    assert result["ints"].dtype == np.uint8
+
+
+def test_compression_option(tmp_path):
+    """Test explicit codec, detected from file content whatever the extension"""
+    fname = osp.join(str(tmp_path), "objs.json")
+    objs = write_objects(fname, False, file_compression="xz")
+    assert detect_file_codec(fname) == "xz"
+    result = JSONReader(fname).read_object_list("objs", Parameters)
+    assert len(result) == len(objs)
+    with pytest.raises(ValueError):
+        JSONWriter(fname, file_compression="zip")
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+Test JSON streaming writer and incremental object list reader
+"""
+
+from __future__ import annotations
+
+import os.path as osp
+import re
+
+import numpy as np
+import pytest
+
+import guidata.dataset as gds
+from guidata.io import JSONReader, JSONWriter
+
+
+class Parameters(gds.DataSet):
+    """Parameters"""
+
+    gain = gds.FloatItem("Gain", default=1.0)
+    label = gds.StringItem("Label", default='signal "é"')
+    data = gds.FloatArrayItem("Data", default=np.arange(6.0).reshape(2, 3))
+
+
+def create_objects(count: int) -> list[Parameters | None]:
+    """Create a list of parameters, with a None object"""
+    objs = []
+    for index in range(count):
+        param = Parameters()
+        param.gain = index * 1.5
+        objs.append(param)
+    objs[1] = None
+    return objs
+
+
+def write_file(fname: str, objs: list, streaming: bool) -> None:
+    """Write a file with values, nested groups and an object list"""
+    writer = JSONWriter(fname, streaming=streaming)
+    writer.write("1.0", "version")
+    with writer.group("meta"):
+        writer.write([1, 2, 3], "sequence")
+        with writer.group("nested"):
+            writer.write(np.arange(3), "array")
+    writer.write_object_list(objs, "objs")
+    writer.write(None, "none")
+    writer.save()
+
+
+def test_streaming_writer(tmp_path):
+    """Test that the streaming writer writes the same file as the normal mode"""
+    objs = create_objects(5)
+    texts = []
+    for streaming in (False, True):
+        fname = osp.join(str(tmp_path), f"test_{streaming}.json")
+        write_file(fname, objs, streaming)
+        with open(fname, encoding="utf-8") as fdesc:
+            texts.append(re.sub(r"[0-9a-f]{8}-[0-9a-f-]{27}", "ID", fdesc.read()))
+    assert texts[0] == texts[1]
+    reader = JSONReader(fname)
+    assert reader.read("version") == "1.0"
+    with reader.group("meta"), reader.group("nested"):
+        assert np.array_equal(reader.read("array"), np.arange(3))
+    objs2 = reader.read_object_list("objs", Parameters)
+    assert objs2[1] is None
+    for obj, obj2 in zip(objs[::2], objs2[::2]):
+        gds.assert_datasets_equal(obj, obj2)
+
+
+def test_streaming_writer_errors(tmp_path):
+    """Test streaming writer errors"""
+    with pytest.raises(ValueError):
+        JSONWriter(None, streaming=True)
+    fname = osp.join(str(tmp_path), "test.json")
+    writer = JSONWriter(fname, streaming=True)
+    with writer.group("a"):
+        writer.write(1, "x")
+    writer.write(2, "b")
+    with pytest.raises(ValueError):
+        writer.write(3, "b")
+    with pytest.raises(ValueError):
+        with writer.group("a"):
+            writer.write(4, "y")
+    with pytest.raises(ValueError):
+        writer.get_json()
+    writer.close()
+    assert JSONReader(fname).get_json_dict() == {"a": {"x": 1}, "b": 2}
+    empty = osp.join(str(tmp_path), "empty.json")
+    JSONWriter(empty, streaming=True).save()
+    assert JSONReader(empty).get_json_dict() == {}
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_iter_object_list(tmp_path, streaming):
+    """Test incremental object list reader"""
+    fname = osp.join(str(tmp_path), "test.json")
+    objs = create_objects(20)
+    write_file(fname, objs, streaming=True)
+    reader = JSONReader(fname, streaming=streaming)
+    reader.CHUNK_SIZE = 64  # Values span several chunks
+    objs2 = list(reader.iter_object_list("objs", Parameters, exclude=["label"]))
+    assert len(objs2) == len(objs) and objs2[1] is None
+    for obj, obj2 in zip(objs[::2], objs2[::2]):
+        assert obj2.gain == obj.gain and np.array_equal(obj2.data, obj.data)
+    # The document is not loaded by the incremental reader
+    assert (reader.jsondata is None) == streaming
+    with reader.group("meta"):
+        assert reader.read("sequence") == [1, 2, 3]
+    # Object lists in groups, None object lists, missing object lists
+    writer = JSONWriter(fname, streaming=True)
+    with writer.group("group"):
+        writer.write_object_list(objs[:3], "objs")
+        writer.write_object_list(None, "none")
+    writer.save()
+    reader = JSONReader(fname, streaming=streaming)
+    with reader.group("group"):
+        assert len(list(reader.iter_object_list("objs", Parameters))) == 3
+        assert list(reader.iter_object_list("none", Parameters)) == []
+    with pytest.raises(KeyError):
+        list(JSONReader(fname, streaming=True).iter_object_list("objs", Parameters))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
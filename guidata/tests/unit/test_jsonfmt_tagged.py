@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+Test tagged arrays and legacy array detection of JSON files
+"""
+
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pytest
+
+from guidata.io import JSONReader, JSONWriter
+from guidata.io.jsonfmt import JSON_BACKENDS
+
+BACKENDS = [name for name, klass in JSON_BACKENDS.items() if klass.is_available()]
+
+ARRAYS = {
+    "float": np.linspace(0.0, 1.0, 6).reshape(2, 3),
+    "complex": np.array([1 + 2j, 3 - 4j], dtype=np.complex64),
+    "int": np.arange(4, dtype=np.int16),
+}
+
+
+def write_json(backend: str, tagged_arrays: bool) -> str:
+    """Write arrays and lists looking like legacy arrays"""
+    writer = JSONWriter(None, backend=backend, tagged_arrays=tagged_arrays)
+    for name, arr in ARRAYS.items():
+        writer.write(arr, name)
+    with writer.group("lists"):
+        writer.write([["array", [1, 2], "int8"], [[1, 2, 3], [4, 5, 6]]], "nested")
+        writer.write(["array", "point", "label"], "triplet")
+    return writer.get_json()
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_tagged_arrays(backend):
+    """Test that tagged arrays are decoded whatever the legacy option"""
+    text = write_json(backend, tagged_arrays=True)
+    assert json.loads(text)["float"] == {
+        "__array__": ARRAYS["float"].tolist(),
+        "dtype": "float64",
+    }
+    for name in BACKENDS:
+        for legacy_arrays in (False, True):
+            reader = JSONReader(text, backend=name, legacy_arrays=legacy_arrays)
+            for key, arr in ARRAYS.items():
+                value = reader.read(key)
+                assert value.dtype == arr.dtype
+                assert np.array_equal(value, arr)
+            with reader.group("lists"):
+                nested = reader.read("nested")
+                assert reader.read("triplet") == ["array", "point", "label"]
+            if legacy_arrays:
+                # Lists written as legacy arrays are still decoded as arrays
+                assert np.array_equal(nested[0], np.array([1, 2], dtype=np.int8))
+            else:
+                assert nested[0] == ["array", [1, 2], "int8"]
+            assert nested[1] == [[1, 2, 3], [4, 5, 6]]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_legacy_arrays(backend):
+    """Test legacy arrays, with and without legacy detection"""
+    text = write_json(backend, tagged_arrays=False)
+    reader = JSONReader(text, backend=backend)
+    assert np.array_equal(reader.read("complex"), ARRAYS["complex"])
+    reader = JSONReader(text, backend=backend, legacy_arrays=False)
+    assert reader.read("int") == ["array", [0, 1, 2, 3], "int16"]
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+Test shared and copy-on-access default values of data items
+"""
+
+from __future__ import annotations
+
+import copy
+import warnings
+
+import numpy as np
+import pytest
+
+import guidata.dataset as gds
+from guidata.config import ValidationMode, temporary_validation_mode
+from guidata.dataset.datatypes import LazyDefault, is_immutable
+
+
+class Parameters(gds.DataSet):
+    """Parameters"""
+
+    count = gds.IntItem("Count", default=3)
+    ratio = gds.FloatItem("Ratio", default=1)
+    name = gds.StringItem("Name", default="abc")
+    data = gds.FloatArrayItem("Data", default=np.zeros(3))
+    meta = gds.DictItem("Metadata", default={"a": [1, 2]})
+
+
+def test_is_immutable():
+    """Test immutable value detection"""
+    for value in (None, 1, 1.0, "a", b"a", (1, "a"), np.float64(1), frozenset()):
+        assert is_immutable(value)
+    for value in ([], {}, (1, []), np.zeros(2), set()):
+        assert not is_immutable(value)
+
+
+def test_lazy_defaults():
+    """Test that mutable defaults are copied on first access"""
+    Parameters()  # First instance: defaults are validated and cached
+    param1, param2 = Parameters(), Parameters()
+    assert isinstance(param1._data, LazyDefault)
+    assert param1._data is param2._data
+    assert param1._count == 3
+    # Converted default (int to float) is shared too
+    assert param1.ratio == 1.0 and isinstance(param1.ratio, float)
+    param1.data[0] = 5.0
+    param1.meta["a"].append(3)
+    assert not isinstance(param1._data, LazyDefault)
+    assert np.array_equal(param2.data, np.zeros(3))
+    assert param2.meta == {"a": [1, 2]}
+    assert np.array_equal(Parameters().data, np.zeros(3))
+    assert np.array_equal(Parameters.data._default, np.zeros(3))
+    # Setting a value never copies the default
+    param3 = Parameters()
+    param3.data = np.ones(2)
+    assert np.array_equal(param3.data, np.ones(2))
+    # Copies of a data set share the placeholder, but not the copied values
+    param4 = copy.deepcopy(param3)
+    assert isinstance(param4._meta, LazyDefault) and param4._meta is param3._meta
+    param4 = copy.deepcopy(param2)
+    assert param4.meta is not param2.meta
+    assert param4.meta == param2.meta
+    param4.meta["b"] = 1
+    assert "b" not in param2.meta
+    gds.assert_datasets_equal(Parameters(), Parameters())
+
+
+def test_lazy_defaults_validation():
+    """Test that defaults are validated again when needed"""
+
+    class ValidatedParameters(gds.DataSet):
+        """Validated parameters"""
+
+        value = gds.IntItem("Value", default=-1, min=0)
+
+    with temporary_validation_mode(ValidationMode.DISABLED):
+        assert ValidatedParameters().value == -1
+    with temporary_validation_mode(ValidationMode.STRICT):
+        with pytest.raises(gds.DataItemValidationError):
+            ValidatedParameters()
+    with temporary_validation_mode(ValidationMode.ENABLED):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            ValidatedParameters()
+        assert caught
+    ValidatedParameters.value.set_prop("data", min=-10)
+    with temporary_validation_mode(ValidationMode.STRICT):
+        assert ValidatedParameters().value == -1
+    ValidatedParameters.value._default = 5
+    assert ValidatedParameters().value == 5
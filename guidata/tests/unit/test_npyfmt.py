@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+Test NumPy directory I/O (one .npy file per array, memory-mapped when reading)
+"""
+
+from __future__ import annotations
+
+import os
+import os.path as osp
+
+import numpy as np
+import pytest
+
+import guidata.dataset as gds
+from guidata.dataset import assert_datasets_equal
+from guidata.io import HDF5Reader, HDF5Writer, NPYReader, NPYWriter
+
+
+class Parameters(gds.DataSet):
+    """Parameters"""
+
+    gain = gds.FloatItem("Gain", default=1.0)
+    count = gds.IntItem("Count", default=3)
+    enabled = gds.BoolItem("Enabled", default=True)
+    label = gds.StringItem("Label", default="signal é")
+    choice = gds.ChoiceItem("Choice", ["a", "b"], default="b")
+    flags = gds.MultipleChoiceItem("Flags", ["x", "y", "z"], default=[0, 2])
+    metadata = gds.DictItem("Metadata", default={"unit": "mm", "factors": [1, 2]})
+    data = gds.FloatArrayItem("Data", default=np.arange(12.0).reshape(3, 4))
+    mask = gds.FloatArrayItem("Mask", default=np.zeros(0, dtype=np.uint8))
+
+
+def create_objects() -> list[Parameters | None]:
+    """Create a list of parameters, with a None object"""
+    objs = []
+    for index in range(4):
+        param = Parameters()
+        param.gain = index * 0.5
+        param.data = param.data * index
+        objs.append(param)
+    objs[1] = None
+    return objs
+
+
+def write_objects(writer: NPYWriter | HDF5Writer, objs: list) -> None:
+    """Write an object list, a None list and a single data set"""
+    writer.write_object_list(objs, "objs")
+    writer.write_object_list(None, "none")
+    writer.write(objs[0], "param")
+    writer.write(None, "none_param")
+    writer.close()
+
+
+def test_npy_directory(tmp_path):
+    """Test that NumPy directories are read as HDF5 files are"""
+    objs = create_objects()
+    dirname = osp.join(str(tmp_path), "data")
+    h5name = osp.join(str(tmp_path), "data.h5")
+    write_objects(NPYWriter(dirname), objs)
+    write_objects(HDF5Writer(h5name), objs)
+    # One file per array, scalar values in the manifest
+    assert len([fname for fname in os.listdir(dirname) if fname.endswith(".npy")]) == 8
+    for reader in (NPYReader(dirname), HDF5Reader(h5name)):
+        result = reader.read_object_list("objs", Parameters)
+        assert result[1] is None
+        for obj, expected in zip(result, objs):
+            if expected is not None:
+                assert_datasets_equal(obj, expected)
+        assert reader.read_object_list("none", Parameters) is None
+        param = reader.read("param", instance=Parameters())
+        assert_datasets_equal(param, objs[0])
+        assert reader.read("none_param", instance=Parameters()) is None
+        # Partial deserialization
+        result = reader.read_object_list("objs", Parameters, include=["gain"])
+        assert result[2].gain == 1.0
+        assert np.array_equal(result[2].data, Parameters().data)
+        reader.close()
+
+
+def test_npy_arrays(tmp_path):
+    """Test memory-mapped arrays and missing values"""
+    dirname = osp.join(str(tmp_path), "data")
+    objs = create_objects()
+    with NPYWriter(dirname) as writer:
+        write_objects(writer, objs)
+    reader = NPYReader(dirname)
+    param = reader.read("param", instance=Parameters())
+    assert isinstance(param.data, np.memmap) and not param.data.flags.writeable
+    assert param.mask.dtype == np.uint8 and param.mask.shape == (0,)
+    with pytest.raises(KeyError):
+        reader.read("missing")
+    assert reader.read("missing", default=None) is None
+    reader = NPYReader(dirname, mmap_arrays=False)
+    param = reader.read("param", instance=Parameters())
+    assert not isinstance(param.data, np.memmap) and param.data.flags.writeable
+    # Rewriting the directory removes the previous array files
+    with NPYWriter(dirname) as writer:
+        writer.write(np.arange(3), "array")
+    assert sorted(os.listdir(dirname)) == ["000001.npy", "manifest.json"]
+    with pytest.raises(NotImplementedError):
+        NPYWriter(dirname).write(np.array([None]), "objects")
+
+
+def test_npy_directory_safety(tmp_path):
+    """Test that files which were not written by NPYWriter are never removed"""
+    dirname = osp.join(str(tmp_path), "data")
+    os.makedirs(dirname)
+    user_fname = osp.join(dirname, "user.npy")
+    np.save(user_fname, np.arange(3))
+    with pytest.raises(ValueError):
+        NPYWriter(dirname)
+    # A NumPy directory is rewritten, keeping the files it does not reference
+    os.remove(user_fname)
+    with NPYWriter(dirname) as writer:
+        writer.write(np.arange(4), "array")
+    np.save(user_fname, np.arange(3))
+    with NPYWriter(dirname) as writer:
+        writer.write(1, "value")
+    assert sorted(os.listdir(dirname)) == ["manifest.json", "user.npy"]
+    # Directory of a writer which has not been closed
+    NPYWriter(dirname).write(np.arange(2), "array")
+    NPYWriter(dirname).close()
+    with open(osp.join(dirname, "manifest.json"), "w", encoding="utf-8") as fdesc:
+        fdesc.write("{}")
+    with pytest.raises(ValueError):
+        NPYWriter(dirname)
+
+
+def test_npy_reserved_key(tmp_path):
+    """Test that dictionaries with the array reference key are rejected"""
+    dirname = osp.join(str(tmp_path), "data")
+    with NPYWriter(dirname) as writer:
+        with writer.group("metadata"), pytest.raises(ValueError):
+            writer.write_dict({"__npy__": "000001.npy"})
+        with writer.group("values"), pytest.raises(ValueError):
+            writer.write_sequence([{"a": {"__npy__": 1}}])
+        with writer.group("__npy__"), pytest.raises(ValueError):
+            writer.write_int(1)
+        with writer.group("metadata"):
+            writer.write_dict({"npy": "x"})
+    assert NPYReader(dirname).read("metadata") == {"npy": "x"}
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+Test pass-scoped evaluation of item properties
+"""
+
+from __future__ import annotations
+
+import threading
+
+import guidata.dataset as gds
+
+CALLS: list[str] = []
+
+
+def is_positive(value: float) -> bool:
+    """Return True if value is positive (and count calls)"""
+    CALLS.append("is_positive")
+    return value > 0
+
+
+def both_positive(value1: float, value2: float) -> bool:
+    """Return True if both values are positive (and count calls)"""
+    CALLS.append("both_positive")
+    return value1 > 0 and value2 > 0
+
+
+class Parameters(gds.DataSet):
+    """Parameters"""
+
+    _prop_a = gds.GetAttrProp("a")
+    _prop_b = gds.GetAttrProp("b")
+    _active = gds.FuncProp(_prop_a, is_positive)
+    _both = gds.FuncPropMulti([_prop_a, _prop_b], both_positive)
+    a = gds.FloatItem("A", default=1.0)
+    b = gds.FloatItem("B", default=1.0)
+    x1 = gds.FloatItem("X1").set_prop("display", active=_active)
+    x2 = gds.FloatItem("X2").set_prop("display", active=_active)
+    x3 = gds.FloatItem("X3").set_prop("display", active=gds.NotProp(_active))
+    x4 = gds.FloatItem("X4").set_prop("display", active=_both)
+    x5 = gds.FloatItem("X5").set_prop("display", active=_both)
+
+
+def get_active_states(param: Parameters) -> list[bool]:
+    """Return the active state of items x1 to x5"""
+    return [
+        item.get_prop_value("display", param, "active")
+        for item in param.get_items()
+        if item.get_name().startswith("x")
+    ]
+
+
+def test_property_pass():
+    """Test that properties are evaluated once per pass and instance"""
+    assert gds.FuncPropMulti([Parameters._prop_a], both_positive).item_independent
+    assert not gds.FuncProp(gds.ItemProperty(lambda *args: 1), abs).item_independent
+    param1, param2 = Parameters(), Parameters()
+    param2.a = -1.0
+    CALLS.clear()
+    assert get_active_states(param1) == [True, True, False, True, True]
+    assert len(CALLS) == 5
+    CALLS.clear()
+    with gds.property_evaluation_pass():
+        assert get_active_states(param1) == [True, True, False, True, True]
+        assert get_active_states(param2) == [False, False, True, False, False]
+        with gds.property_evaluation_pass():
+            assert get_active_states(param1) == [True, True, False, True, True]
+    assert sorted(CALLS) == ["both_positive"] * 2 + ["is_positive"] * 2
+    # The cache is dropped when leaving the outermost pass
+    CALLS.clear()
+    get_active_states(param1)
+    assert len(CALLS) == 5
+
+
+def test_property_pass_invalidation():
+    """Test that setting items or value properties clears the pass cache"""
+    param = Parameters()
+    store = gds.ValueProp(True)
+    item = gds.FloatItem("Y").set_prop("display", active=store)
+    with gds.property_evaluation_pass():
+        assert get_active_states(param)[0]
+        param.a = -1.0
+        assert get_active_states(param) == [False, False, True, False, False]
+        assert item.get_prop_value("display", param, "active")
+        store.set(param, item, False)
+        assert not item.get_prop_value("display", param, "active")
+
+
+def test_property_pass_threads():
+    """Test that evaluation passes are specific to the thread which started them"""
+    param = Parameters()
+    entered, done = threading.Event(), threading.Event()
+    results = []
+
+    def run_pass():
+        with gds.property_evaluation_pass():
+            entered.set()
+            done.wait(5)
+            results.append(get_active_states(param))
+
+    thread = threading.Thread(target=run_pass)
+    thread.start()
+    try:
+        assert entered.wait(5)
+        # A pass in progress in another thread does not cache values in this one
+        CALLS.clear()
+        get_active_states(param)
+        get_active_states(param)
+        assert len(CALLS) == 10
+    finally:
+        done.set()
+        thread.join()
+    assert results == [[True, True, False, True, True]]
+    CALLS.clear()
+    get_active_states(param)
+    assert len(CALLS) == 5
+
+
+if __name__ == "__main__":
+    test_property_pass()
+    test_property_pass_invalidation()
+    test_property_pass_threads()
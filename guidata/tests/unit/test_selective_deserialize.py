@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""
+Test selective deserialization of data sets (`include` and `exclude` arguments)
+"""
+
+from __future__ import annotations
+
+import os.path as osp
+
+import numpy as np
+import pytest
+
+import guidata.dataset as gds
+from guidata.io import HDF5Reader, HDF5Writer, JSONReader, JSONWriter
+
+
+class Record(gds.DataSet):
+    """Record"""
+
+    name = gds.StringItem("Name", default="")
+    exposure = gds.FloatItem("Exposure", default=1.0)
+    count = gds.IntItem("Count", default=0)
+    image = gds.FloatArrayItem("Image", default=np.zeros(2))
+
+
+class CountingHDF5Reader(HDF5Reader):
+    """HDF5 reader counting array reads"""
+
+    array_reads = 0
+
+    def read_array(self) -> np.ndarray:
+        """Read array and count reads"""
+        self.array_reads += 1
+        return super().read_array()
+
+
+def make_record(index: int = 0) -> Record:
+    """Make a record"""
+    return Record.create(
+        name=f"rec{index}",
+        exposure=0.5 + index,
+        count=index + 10,
+        image=np.full((20, 20), float(index)),
+    )
+
+
+def test_selective_deserialize_h5(tmp_path):
+    """Test selective deserialization from HDF5 files"""
+    fname = osp.join(str(tmp_path), "records.h5")
+    writer = HDF5Writer(fname)
+    writer.write(make_record(1), "record")
+    writer.write_object_list([make_record(i) for i in range(3)], "list")
+    writer.write_object_list([make_record(i) for i in range(3)], "table", table=True)
+    writer.close()
+
+    reader = CountingHDF5Reader(fname)
+    rec = reader.read("record", instance=Record(), include=["name", "count"])
+    assert (rec.name, rec.count, rec.exposure) == ("rec1", 11, 1.0)
+    assert reader.array_reads == 0
+    rec = reader.read("record", instance=Record(), exclude=["image"])
+    assert (rec.name, rec.count, rec.exposure) == ("rec1", 11, 1.5)
+    assert reader.array_reads == 0 and rec.image.shape == (2,)
+    for group_name in ("list", "table"):
+        recs = reader.read_object_list(group_name, Record, exclude=["image"])
+        assert [rec.name for rec in recs] == ["rec0", "rec1", "rec2"]
+        assert all(rec.image.shape == (2,) for rec in recs)
+        recs = reader.read_object_list(group_name, Record, include=["count"])
+        assert [rec.count for rec in recs] == [10, 11, 12]
+        assert all(rec.name == "" for rec in recs)
+    assert reader.array_reads == 0
+    rec = reader.read("record", instance=Record())
+    assert reader.array_reads == 1
+    reader.close()
+
+
+def test_selective_deserialize_json(tmp_path):
+    """Test selective deserialization from JSON files"""
+    fname = osp.join(str(tmp_path), "records.json")
+    writer = JSONWriter(fname)
+    writer.write(make_record(1), "record")
+    writer.write_object_list([make_record(i) for i in range(3)], "list")
+    writer.save()
+
+    reader = JSONReader(fname)
+    rec = reader.read("record", instance=Record(), include=["name"])
+    assert (rec.name, rec.count) == ("rec1", 0)
+    recs = reader.read_object_list("list", Record, exclude=["name", "image"])
+    assert [(rec.name, rec.count) for rec in recs] == [("", 10), ("", 11), ("", 12)]
+
+
+def test_selective_deserialize_unknown_item():
+    """Test that unknown item names are rejected"""
+    reader = JSONReader("{}")
+    with pytest.raises(AttributeError):
+        Record().deserialize(reader, include=["nonexistent"])
+    with pytest.raises(AttributeError):
+        Record().deserialize(reader, exclude=["nonexistent"])
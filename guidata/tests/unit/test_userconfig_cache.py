@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""UserConfig parsed value cache tests"""
+
+import pytest
+
+from guidata.userconfig import UserConfig
+
+DEFAULTS = {
+    "main": {"flag": True, "width": 640, "ratio": 0.5, "name": "abc"},
+    "plot": {"size": (10, 20), "colors": ["red", "blue"]},
+}
+
+
+@pytest.fixture()
+def conf():
+    """Return a UserConfig instance which is never saved"""
+    return UserConfig({sect: dict(opts) for sect, opts in DEFAULTS.items()})
+
+
+def test_cache_hits(conf):
+    """Test that repeated reads are served from the cache"""
+    assert conf.get("main", "width") == 640
+    assert conf.get("main", "width") == 640
+    assert conf.get("plot", "size") == (10, 20)
+    info = conf.get_cache_info()
+    # Interpolating a value reads its raw value first (which is cached as well)
+    assert (info.hits, info.misses, info.size) == (1, 4, 4)
+    conf.clear_cache()
+    assert conf.get_cache_info().size == 0
+
+
+def test_cache_invalidation(conf):
+    """Test that modifying an option invalidates the cached value"""
+    assert conf.get("main", "flag") is True
+    conf.set("main", "flag", False, save=False)
+    assert conf.get("main", "flag") is False
+    conf.set("main", "width", 800, save=False)
+    assert conf.get("main", "width") == 800
+    conf.reset_to_defaults(save=False)
+    assert conf.get("main", "width") == 640
+    assert conf.get("main", "flag") is True
+    assert conf.get("plot", "size") == (10, 20)
+    conf.remove_option("plot", "size")
+    assert conf.get("plot", "size", (1, 2)) == (1, 2)
+
+
+def test_cached_mutable_values(conf):
+    """Test that mutable cached values are not shared with callers"""
+    colors = conf.get("plot", "colors")
+    colors.append("green")
+    assert conf.get("plot", "colors") == ["red", "blue"]
+
+
+def test_parser_api(conf):
+    """Test that ConfigParser methods return the parsed values and use the cache"""
+    assert conf.getint("main", "width") == 640
+    assert conf.getfloat("main", "ratio") == 0.5
+    assert conf["main"].get("width", fallback=0) == 640
+    assert conf["main"].getint("width", fallback=0) == 640
+    info = conf.get_cache_info()
+    assert (info.hits, info.misses) == (2, 4)
+    assert conf.get("main", "width", vars={"width": "1"}) == 1
+    assert conf.get("main", "width") == 640
+
+
+def test_no_code_evaluation(conf):
+    """Test that option values are parsed as literals, not evaluated"""
+    conf.set("main", "other", [1, 2], save=False)
+    conf.read_string("[main]\nother = __import__('os').getcwd()\n")
+    assert conf.get("main", "other") == "__import__('os').getcwd()"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the BSD 3-Clause
+# (see guidata/LICENSE for details)
+
+"""UserConfig transaction tests"""
+
+import os.path as osp
+
+import pytest
+
+import guidata.dataset as gds
+from guidata import userconfig
+from guidata.io import INIWriter
+
+
+class Parameters(gds.DataSet):
+    """Example dataset"""
+
+    a = gds.FloatItem("A", 1.0)
+    b = gds.IntItem("B", 2)
+    c = gds.StringItem("C", "three")
+
+
+class TmpUserConfig(userconfig.UserConfig):
+    """UserConfig saved in a temporary directory"""
+
+    def __init__(self, dirname: str) -> None:
+        super().__init__({})
+        self.dirname = dirname
+
+    def filename(self) -> str:
+        """Return configuration file name"""
+        return osp.join(self.dirname, "test.ini")
+
+
+@pytest.fixture()
+def conf(tmp_path, monkeypatch):
+    """Return a UserConfig instance counting file writes"""
+    conf = TmpUserConfig(str(tmp_path))
+    conf.nb_writes = 0
+    replace_file = userconfig.try_replace_file
+
+    def counting_replace_file(*args, **kwargs):
+        conf.nb_writes += 1
+        replace_file(*args, **kwargs)
+
+    monkeypatch.setattr(userconfig, "try_replace_file", counting_replace_file)
+    return conf
+
+
+def test_write_config_single_save(conf):
+    """Test that writing a dataset saves the configuration file once"""
+    Parameters().write_config(conf, "section", "param")
+    assert conf.nb_writes == 1
+    reread = TmpUserConfig(conf.dirname)
+    reread.read(reread.filename(), encoding="utf-8")
+    param = Parameters()
+    param.read_config(reread, "section", "param")
+    assert (param.a, param.b, param.c) == (1.0, 2, "three")
+
+
+def test_nested_transaction(conf):
+    """Test that only the outermost transaction saves the configuration file"""
+    with conf.transaction():
+        conf.set("main", "x", 1)
+        with conf.transaction():
+            conf.set("main", "y", 2)
+            assert conf.in_transaction()
+        assert conf.nb_writes == 0
+    assert not conf.in_transaction()
+    assert conf.nb_writes == 1
+    with conf.transaction():
+        pass  # Nothing changed: nothing to save
+    assert conf.nb_writes == 1
+
+
+def test_transaction_rollback(conf):
+    """Test that an exception rolls back the in-memory configuration"""
+    conf.set("main", "x", 1)
+    with pytest.raises(ZeroDivisionError):
+        with conf.transaction():
+            conf.set("main", "x", 10)
+            conf.set("other", "y", 2)
+            _ = 1 / 0
+    assert conf.nb_writes == 1
+    assert conf.get("main", "x") == 1
+    assert not conf.has_section("other")
+    assert conf.get_default("other", "y") is userconfig.NoDefault
+
+
+def test_deferred_ini_writer(conf):
+    """Test INIWriter deferred save mode"""
+    writer = INIWriter(conf, "section", "param", deferred_save=True)
+    Parameters().serialize(writer)
+    assert conf.nb_writes == 0
+    writer.save()
+    assert conf.nb_writes == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -43,6 +43,14 @@ This module provides the following functions and classes:
 * :py:func:`get_config_basedir`: return user configuration base directory
 * :py:class:`UserConfig`: user configuration file management class
 
+Writing many options at once (e.g. when saving a whole data set with
+:py:meth:`guidata.dataset.DataSet.write_config`) may be grouped in a transaction
+with :py:meth:`UserConfig.transaction`: the .ini file is then written only once,
+when leaving the transaction.
+
+Values returned by :py:meth:`UserConfig.get` are parsed once and cached until the
+corresponding option is modified (see :py:meth:`UserConfig.get_cache_info`).
+
 .. autofunction:: get_home_dir
 
 .. autofunction:: get_config_basedir
@@ -51,13 +59,20 @@ This module provides the following functions and classes:
     :members:
 """
 
+from __future__ import annotations
+
+import ast
 import configparser as cp
+import copy
+import io
 import os
 import os.path as osp
 import re
 import sys
 import time
-from typing import Any
+from collections.abc import Generator
+from contextlib import contextmanager
+from typing import Any, NamedTuple
 
 
 def try_remove_file(path: str, wait_time: float = 0.05, retries: int = 20) -> None:
@@ -83,6 +98,31 @@ def try_remove_file(path: str, wait_time: float = 0.05, retries: int = 20) -> No
         raise IOError(f"Unable to remove file {path} due to file lock")
 
 
+def try_replace_file(
+    src: str, dst: str, wait_time: float = 0.05, retries: int = 20
+) -> None:
+    """Try to atomically replace a file by another one, waiting if necessary.
+
+    Args:
+        src: The path of the file to move.
+        dst: The path of the file to replace.
+        wait_time: The time in seconds to wait between checks.
+        retries: The number of times to retry before giving up.
+
+    Raises:
+        IOError: If the file cannot be replaced.
+    """
+    attempt = 0
+    while attempt < retries:
+        try:
+            os.replace(src, dst)
+            return
+        except IOError:
+            time.sleep(wait_time)
+            attempt += 1
+    raise IOError(f"Unable to replace file {dst} due to file lock")
+
+
 def get_home_dir() -> str:
     """Return user home directory"""
     try:
@@ -136,6 +176,14 @@ class NoDefault:
     pass
 
 
+class CacheInfo(NamedTuple):
+    """Statistics of the :py:class:`UserConfig` parsed value cache"""
+
+    hits: int
+    misses: int
+    size: int
+
+
 class UserConfig(cp.ConfigParser):
     """
     UserConfig class, based on ConfigParser
@@ -150,9 +198,16 @@ class UserConfig(cp.ConfigParser):
     default_section_name = "main"
 
     def __init__(self, defaults):
+        # Parsed value cache: section -> {(option, raw): value}
+        self.__cache: dict[str, dict[tuple[str, int], Any]] = {}
+        self.__cache_hits = 0
+        self.__cache_misses = 0
+        self.__revision = 0
         cp.ConfigParser.__init__(self)
         self.name = "none"
         self.raw = 0  # 0 = substitutions are enabled / 1 = raw config parser
+        self.__transaction_depth = 0
+        self.__pending_save = False
         assert isinstance(defaults, dict)
         for _key, val in list(defaults.items()):
             assert isinstance(val, dict)
@@ -179,6 +234,106 @@ class UserConfig(cp.ConfigParser):
         # In any case, the resulting config is saved in config file:
         self.__save()
 
+    @contextmanager
+    def transaction(self) -> Generator[UserConfig, None, None]:
+        """Context manager deferring configuration file writes
+
+        Inside the ``with`` block, methods which usually save the configuration
+        file (:py:meth:`set`, :py:meth:`remove_option`, ...) only update the
+        configuration in memory. The .ini file is written once, atomically, when
+        leaving the outermost block (and only if something has changed).
+
+        If an exception is raised inside the outermost block, the in-memory
+        configuration is restored to its state before the transaction and the
+        .ini file is left untouched.
+
+        Example::
+
+            with conf.transaction():
+                conf.set("main", "width", 640)
+                conf.set("main", "height", 480)
+        """
+        snapshot = self.__snapshot() if self.__transaction_depth == 0 else None
+        self.__transaction_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self.__transaction_depth -= 1
+            if self.__transaction_depth == 0:
+                self.__pending_save = False
+                self.__restore(snapshot)
+            raise
+        self.__transaction_depth -= 1
+        if self.__transaction_depth == 0 and self.__pending_save:
+            self.__pending_save = False
+            self.__save()
+
+    def get_cache_info(self) -> CacheInfo:
+        """Return statistics of the parsed value cache used by :py:meth:`get`"""
+        size = sum(len(options) for options in self.__cache.values())
+        return CacheInfo(self.__cache_hits, self.__cache_misses, size)
+
+    def clear_cache(self) -> None:
+        """Clear the parsed value cache used by :py:meth:`get`"""
+        self.__cache.clear()
+        self.__revision += 1
+
+    def get_revision(self) -> int:
+        """Return the configuration revision number
+
+        The revision number is incremented each time an option is modified, so that
+        objects built from configuration values (fonts, pens, ...) may be cached
+        and rebuilt only when the configuration has changed.
+        """
+        return self.__revision
+
+    def __invalidate(self, section: str) -> None:
+        """Invalidate cached values of a section
+
+        The whole section is invalidated (and not only the modified option) because
+        values may refer to other options of the same section through
+        interpolation.
+        """
+        self.__revision += 1
+        if section == self.default_section:
+            self.__cache.clear()
+        else:
+            self.__cache.pop(section, None)
+
+    def read(self, filenames, encoding=None):
+        """Read and parse configuration file(s) (see ``ConfigParser.read``)"""
+        self.clear_cache()
+        return cp.ConfigParser.read(self, filenames, encoding=encoding)
+
+    def read_file(self, f, source=None):
+        """Read and parse configuration data (see ``ConfigParser.read_file``)"""
+        self.clear_cache()
+        cp.ConfigParser.read_file(self, f, source=source)
+
+    def in_transaction(self) -> bool:
+        """Return True if configuration file writes are currently deferred"""
+        return self.__transaction_depth > 0
+
+    def __snapshot(self) -> tuple[str, dict[str, dict[str, Any]]]:
+        """
+        Return a snapshot of the in-memory configuration (options and defaults)
+        """
+        text = io.StringIO()
+        self.write(text)
+        defaults = {sect: dict(opts) for sect, opts in self.defaults.items()}
+        return text.getvalue(), defaults
+
+    def __restore(self, snapshot: tuple[str, dict[str, dict[str, Any]]]) -> None:
+        """
+        Restore the in-memory configuration from a snapshot
+        """
+        text, defaults = snapshot
+        for section in self.sections():
+            cp.ConfigParser.remove_section(self, section)
+        self.read_string(text)
+        self.defaults = defaults
+        self.clear_cache()
+
     def set_application(self, name, version, load=True, raw_mode=False):
         """
         Set the application name and version
@@ -190,6 +345,7 @@ class UserConfig(cp.ConfigParser):
         """
         self.name = name
         self.raw = 1 if raw_mode else 0
+        self.clear_cache()
         if (version is not None) and (re.match(r"^(\d+).(\d+).(\d+)", version) is None):
             raise RuntimeError(
                 f"Version number {version!r} is incorrect - must be in X.Y.Z format"
@@ -266,13 +422,20 @@ class UserConfig(cp.ConfigParser):
     def __save(self):
         """
         Save config into the associated .ini file
+
+        The file is first written next to its final location, then renamed,
+        so that it is never left half-written. Within a transaction, saving
+        is postponed until the transaction is committed.
         """
+        if self.__transaction_depth > 0:
+            self.__pending_save = True
+            return
         fname = self.filename()
-        if osp.isfile(fname):
-            try_remove_file(fname, wait_time=0.05, retries=20)
         os.makedirs(osp.dirname(fname), mode=0o700, exist_ok=True)
-        with open(fname, "w", encoding="utf-8") as configfile:
+        tmpname = fname + ".tmp"
+        with open(tmpname, "w", encoding="utf-8") as configfile:
             self.write(configfile)
+        try_replace_file(tmpname, fname, wait_time=0.05, retries=20)
 
     def get_path(self, basename: str) -> str:
         """Return filename path inside configuration directory"""
@@ -295,6 +458,7 @@ class UserConfig(cp.ConfigParser):
         """
         Set defaults from the current config
         """
+        self.clear_cache()
         self.defaults = {}
         for section in self.sections():
             secdict = {}
@@ -347,6 +511,18 @@ class UserConfig(cp.ConfigParser):
 
         section = self.__check_section_option(section, option)
 
+        # Values depending on ConfigParser `vars` are not cached
+        variables = kwargs.get("vars")
+        cached = None if variables else self.__cache.get(section)
+        if cached is not None:
+            value = cached.get((option, raw), NoDefault)
+            if value is not NoDefault:
+                self.__cache_hits += 1
+                if isinstance(value, (list, dict, set)):
+                    # Callers may modify mutable values: do not share them
+                    return copy.deepcopy(value)
+                return value
+
         if not self.has_section(section):
             if default is NoDefault:
                 raise RuntimeError(f"Unknown section {section!r}")
@@ -360,11 +536,11 @@ class UserConfig(cp.ConfigParser):
                 self.set(section, option, default)
                 return default
 
-        value = cp.ConfigParser.get(self, section, option, raw=raw)
+        value = cp.ConfigParser.get(self, section, option, raw=raw, vars=variables)
 
         default_value = self.get_default(section, option)
         if isinstance(default_value, bool):
-            value = eval(value)
+            value = ast.literal_eval(value)
         elif isinstance(default_value, float):
             value = float(value)
         elif isinstance(default_value, int):
@@ -374,10 +550,15 @@ class UserConfig(cp.ConfigParser):
         else:
             try:
                 # lists, tuples, ...
-                value = eval(value)
-            except Exception:
+                value = ast.literal_eval(value)
+            except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
                 pass
 
+        self.__cache_misses += 1
+        if not variables:
+            self.__cache.setdefault(section, {})[(option, raw)] = value
+        if isinstance(value, (list, dict, set)):
+            return copy.deepcopy(value)
         return value
 
     def get_section(self, section):
@@ -401,6 +582,7 @@ class UserConfig(cp.ConfigParser):
             self.add_section(section)
         if not isinstance(value, str):
             value = repr(value)
+        self.__invalidate(section)
         if verbose:
             print("{}[ {} ] = {}".format(section, option, value))
         cp.ConfigParser.set(self, section, option, value)
@@ -413,6 +595,7 @@ class UserConfig(cp.ConfigParser):
         section = self.__check_section_option(section, option)
         options = self.defaults.setdefault(section, {})
         options[option] = default_value
+        self.__invalidate(section)
 
     def set(self, section, option, value, verbose=False, save=True):
         """
@@ -439,6 +622,7 @@ class UserConfig(cp.ConfigParser):
     def remove_section(self, section):
         """Remove the given section and save the configuration."""
         cp.ConfigParser.remove_section(self, section)
+        self.__invalidate(section)
         self.__save()
 
     def remove_option(self, section, option):
@@ -447,4 +631,5 @@ class UserConfig(cp.ConfigParser):
         and save the configuration.
         """
         cp.ConfigParser.remove_option(self, section, option)
+        self.__invalidate(section)
         self.__save()
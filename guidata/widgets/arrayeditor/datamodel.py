@@ -29,7 +29,7 @@ from qtpy.QtGui import QColor
 from qtpy.QtWidgets import QMessageBox
 
 from guidata.config import CONF, _
-from guidata.configtools import get_font
+from guidata.configtools import get_cached_font
 from guidata.dataset.dataitems import BoolItem, FloatItem, IntItem, StringItem
 from guidata.dataset.datatypes import DataItem, DataSet
 from guidata.widgets.arrayeditor import utils
@@ -511,7 +511,7 @@ class BaseArrayModel(QAbstractTableModel, Generic[AnyArrayHandler, AnySupportedA
             except (TypeError, ValueError, ZeroDivisionError):
                 return None
         elif role == Qt.ItemDataRole.FontRole:
-            return get_font(CONF, "arrayeditor", "font")
+            return get_cached_font(CONF, "arrayeditor", "font")
         return None
 
     def setData(self, index, value, role=Qt.ItemDataRole.EditRole) -> bool:
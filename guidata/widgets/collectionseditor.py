@@ -61,7 +61,7 @@ from qtpy.QtWidgets import (
 )
 
 from guidata.config import CONF, _
-from guidata.configtools import get_font, get_icon
+from guidata.configtools import get_cached_font, get_font, get_icon
 from guidata.qthelpers import (
     add_actions,
     create_action,
@@ -413,7 +413,7 @@ class ReadOnlyCollectionsModel(QAbstractTableModel):
         elif role == Qt.BackgroundColorRole:
             return self.get_bgcolor(index)
         elif role == Qt.FontRole:
-            return get_font(CONF, "dicteditor", "font")
+            return get_cached_font(CONF, "dicteditor", "font")
         return None
 
     def headerData(self, section, orientation, role=Qt.DisplayRole):
@@ -53,7 +53,7 @@ from qtpy.QtWidgets import (
 )
 
 from guidata.config import CONF, _
-from guidata.configtools import get_font, get_icon
+from guidata.configtools import get_cached_font, get_icon
 from guidata.qthelpers import (
     add_actions,
     create_action,
@@ -325,7 +325,7 @@ class DataFrameModel(QAbstractTableModel):
         elif role == Qt.BackgroundColorRole:
             return self.get_bgcolor(index)
         elif role == Qt.FontRole:
-            return get_font(CONF, "arrayeditor", "font")
+            return get_cached_font(CONF, "arrayeditor", "font")
         elif role == Qt.ToolTipRole:
             if index in self.display_error_idxs:
                 return _(